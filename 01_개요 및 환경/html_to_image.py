@@ -2,7 +2,17 @@
 HTML 파일을 이미지로 변환하는 스크립트
 """
 import os
+import re
 import sys
+import glob
+import json
+import time
+import shutil
+import asyncio
+import hashlib
+import base64
+import argparse
+from io import BytesIO
 from pathlib import Path
 
 # Windows에서 UTF-8 인코딩 설정
@@ -11,13 +21,19 @@ if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
-try:
-    from playwright.sync_api import sync_playwright
-except ImportError:
-    print("playwright가 설치되어 있지 않습니다. 설치 중...")
-    os.system("pip install playwright")
-    os.system("playwright install chromium")
-    from playwright.sync_api import sync_playwright
+PLAYWRIGHT_INSTALL_HINT = "pip install playwright && playwright install chromium"
+
+def require_playwright():
+    """
+    playwright 로드 (브라우저로 렌더링할 때만 호출)
+    
+    설치되어 있지 않으면 자동 설치하지 않고 설치 방법을 담은 RuntimeError를 낸다.
+    """
+    try:
+        from playwright.async_api import async_playwright
+    except ImportError:
+        raise RuntimeError(f"playwright가 설치되어 있지 않습니다: {PLAYWRIGHT_INSTALL_HINT}") from None
+    return async_playwright
 
 def html_to_image(html_file, output_file=None, width=1200, height=None):
     """
@@ -43,58 +59,430 @@ def html_to_image(html_file, output_file=None, width=1200, height=None):
     print(f"HTML 파일 로딩: {html_path}")
     print(f"이미지 저장 경로: {output_file}")
     
-    with sync_playwright() as p:
-        # Chromium 브라우저 실행
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        
-        # HTML 파일 로드
-        page.goto(f"file://{html_path}")
-        
-        # 페이지가 완전히 로드될 때까지 대기
-        page.wait_for_load_state("networkidle")
-        
-        # 추가 대기 (CSS 및 폰트 로딩)
-        page.wait_for_timeout(1000)
-        
-        # 뷰포트 설정 (고해상도를 위해 2배 크기로 설정)
-        if width:
-            # 고해상도를 위해 viewport를 2배로 설정
-            page.set_viewport_size({"width": width * 2, "height": (height or 800) * 2})
-        
-        # 컨테이너 요소 찾기
-        container = page.locator('.container')
-        
-        if container.count() > 0:
-            # 컨테이너 요소만 스크린샷 (여백 제거, 고해상도)
-            container.screenshot(
-                path=str(output_file),
-                type="png"
-            )
-        else:
-            # 컨테이너가 없으면 전체 페이지 스크린샷
-            page.screenshot(
-                path=str(output_file),
-                full_page=True,
-                type="png"
-            )
-        
-        browser.close()
+    result = html_to_images([(html_path, output_file)], width=width, height=height, concurrency=1)
+    if result["errors"]:
+        raise RuntimeError(result["errors"][str(html_path)])
     
     print(f"이미지 생성 완료: {output_file}")
     return True
 
-if __name__ == "__main__":
-    # Jupiter 브라우저 변경.html 파일만 변환 (고해상도)
-    html_file = "Jupiter 브라우저 변경.html"
+def collect_html_files(targets):
+    """
+    파일, 폴더, glob 패턴 목록을 HTML 파일 목록으로 펼침
+    
+    폴더는 바로 아래의 *.html 파일만 포함한다.
+    """
+    files = []
+    seen = set()
+    for target in targets:
+        if os.path.isdir(target):
+            matches = sorted(glob.glob(os.path.join(glob.escape(target), "*.html")))
+        elif os.path.exists(target):
+            matches = [target]
+        else:
+            matches = sorted(glob.glob(target, recursive=True))
+        for match in matches:
+            path = Path(match).resolve()
+            if path.suffix.lower() == ".html" and path not in seen:
+                seen.add(path)
+                files.append(path)
+    return files
+
+# 렌더링 준비 완료 신호: 웹 폰트 로딩 완료 + 대상 요소 높이가 두 프레임 연속 동일
+_READY_SCRIPT = """
+async (selector) => {
+    await document.fonts.ready;
+    const el = document.querySelector(selector) || document.body;
+    const frame = () => new Promise(resolve => requestAnimationFrame(() => resolve()));
+    let last = -1, stable = 0;
+    while (stable < 2) {
+        await frame();
+        const height = el.getBoundingClientRect().height;
+        if (height === last) { stable += 1; } else { stable = 0; last = height; }
+    }
+    return true;
+}
+"""
+
+WAIT_MODES = ("signals", "sleep")
+IMAGE_FORMATS = {"png": ".png", "jpeg": ".jpg", "webp": ".webp"}
+TILE_MODES = ("stitch", "split")
+# 이어 붙인 이미지의 최대 픽셀 수 (넘으면 조각 파일로 저장)
+DEFAULT_MAX_PIXELS = 50_000_000
+
+# 캡처 영역: 대상 요소 (없으면 문서 전체), 문서 좌표 기준
+_CLIP_SCRIPT = """
+(selector) => {
+    const el = selector ? document.querySelector(selector) : null;
+    if (!el) {
+        const d = document.documentElement;
+        return {x: 0, y: 0, width: d.scrollWidth, height: d.scrollHeight};
+    }
+    const r = el.getBoundingClientRect();
+    return {x: r.left + window.scrollX, y: r.top + window.scrollY, width: r.width, height: r.height};
+}
+"""
+
+# 이미지 캐시 (저장소 루트의 .build_cache/images)
+IMAGE_CACHE_DIR = Path(__file__).resolve().parent.parent / ".build_cache" / "images"
+# 캡처 방식이 바뀌면 올려서 기존 캐시를 무효화
+IMAGE_CACHE_VERSION = 2
+# 출력 이미지에 영향을 주는 렌더링 옵션
+CACHE_KEY_OPTIONS = ("width", "height", "scale", "selector", "format", "quality", "tile_height", "tiles")
+
+_LOCAL_REFERENCE = re.compile(r'<link\b[^>]*\bhref="([^"]+)"|\bsrc="([^"]+)"', re.IGNORECASE)
+
+def _referenced_files(html_path, html_bytes):
+    """HTML이 참조하는 로컬 스타일시트/이미지/스크립트 파일 목록"""
+    files = set()
+    for match in _LOCAL_REFERENCE.finditer(html_bytes.decode("utf-8", errors="replace")):
+        ref = (match.group(1) or match.group(2)).split("#")[0].split("?")[0]
+        if not ref or re.match(r'^[a-zA-Z][a-zA-Z0-9+.-]*:', ref) or ref.startswith("//"):
+            continue  # 원격 리소스, data: URI 등은 제외
+        path = (html_path.parent / ref).resolve()
+        if path.is_file():
+            files.add(path)
+    return sorted(files)
+
+def image_cache_key(html_path, options):
+    """HTML 내용, 참조 파일 내용, 렌더링 옵션으로 만든 캐시 키"""
+    html_bytes = html_path.read_bytes()
+    h = hashlib.sha256()
+    h.update(f"v{IMAGE_CACHE_VERSION}\n".encode())
+    h.update(json.dumps({k: options[k] for k in CACHE_KEY_OPTIONS}, sort_keys=True).encode())
+    h.update(hashlib.sha256(html_bytes).digest())
+    for path in _referenced_files(html_path, html_bytes):
+        h.update(os.path.relpath(path, html_path.parent).encode("utf-8"))
+        h.update(hashlib.sha256(path.read_bytes()).digest())
+    return h.hexdigest()
+
+def _copy_if_changed(src, dst):
+    """내용이 다를 때만 복사"""
+    if dst.exists() and dst.stat().st_size == src.stat().st_size and dst.read_bytes() == src.read_bytes():
+        return
+    shutil.copyfile(src, dst)
+
+def render_options(width=1200, height=None, scale=2, selector=".container", wait="signals", timeout=30000,
+                   image_format="png", quality=85, tile_height=None, tiles="stitch",
+                   max_pixels=DEFAULT_MAX_PIXELS):
+    """렌더링 옵션 검증 후 옵션 딕셔너리 반환 (인자 설명은 html_to_images 참고)"""
+    if wait not in WAIT_MODES:
+        raise ValueError(f"wait는 {WAIT_MODES} 중 하나여야 합니다: {wait}")
+    if image_format not in IMAGE_FORMATS:
+        raise ValueError(f"image_format은 {tuple(IMAGE_FORMATS)} 중 하나여야 합니다: {image_format}")
+    if tiles not in TILE_MODES:
+        raise ValueError(f"tiles는 {TILE_MODES} 중 하나여야 합니다: {tiles}")
+    # Chromium은 잘못된 품질 값을 캡처할 때 거부하므로 일괄 작업을 시작하기 전에 확인
+    if image_format != "png" and not (isinstance(quality, int) and 1 <= quality <= 100):
+        raise ValueError(f"quality는 1~100 사이의 정수여야 합니다: {quality}")
+    if tile_height and tiles == "stitch":
+        try:
+            import PIL  # noqa: F401
+        except ImportError:
+            raise RuntimeError("조각 이어 붙이기(tiles='stitch')에는 Pillow가 필요합니다: pip install pillow "
+                               "(또는 tiles='split' 사용)") from None
+    return {
+        "width": width, "height": height, "scale": scale, "format": image_format,
+        "quality": quality if image_format != "png" else None,
+        "tile_height": tile_height, "tiles": tiles if tile_height else None,
+        "max_pixels": max_pixels, "selector": selector, "wait": wait, "timeout": timeout,
+    }
+
+def lookup_cached_image(html_path, output_file, options):
+    """
+    이미지 캐시 확인
+    
+    Returns:
+        (캐시 적중 여부, 캐시 파일 경로)
+        적중하면 output_file에 복사해 두고, 아니면 렌더링 후 저장할 캐시 경로를 돌려준다.
+    """
+    key = image_cache_key(html_path, options)
+    cached_file = IMAGE_CACHE_DIR / f"{key}{IMAGE_FORMATS[options['format']]}"
+    if cached_file.exists():
+        _copy_if_changed(cached_file, output_file)
+        return True, cached_file
+    return False, cached_file
+
+def _store_cached(output_file, cached_file):
+    cached_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = cached_file.with_name(cached_file.name + ".tmp")
+    shutil.copyfile(output_file, tmp_file)
+    os.replace(tmp_file, cached_file)
+
+def html_to_images(jobs, width=1200, height=None, concurrency=4, scale=2,
+                   selector=".container", wait="signals", timeout=30000, cache=True,
+                   image_format="png", quality=85, tile_height=None, tiles="stitch",
+                   max_pixels=DEFAULT_MAX_PIXELS):
+    """
+    여러 HTML 파일을 브라우저 하나로 일괄 변환
+    
+    브라우저는 한 번만 실행하고, 동시 작업 수만큼 페이지를 만들어 재사용한다.
+    
+    Args:
+        jobs: HTML 파일 경로 또는 (HTML 파일, 출력 이미지 파일) 튜플 목록
+        width: 이미지 너비 (기본값: 1200px)
+        height: 이미지 높이 (기본값: None, 자동 조정)
+        concurrency: 동시에 렌더링할 페이지 수
+        scale: 기기 배율 (기본값: 2, 고해상도)
+        selector: 스크린샷할 요소 (없으면 전체 페이지)
+        wait: 'signals' (폰트/레이아웃/요소 준비 신호 대기) 또는 'sleep' (networkidle + 1초 고정 대기)
+        timeout: 페이지별 로딩/준비 대기 제한 시간 (ms)
+        cache: True면 내용과 옵션이 같은 페이지는 이미지 캐시에서 복사 (브라우저 생략)
+        image_format: 'png', 'jpeg', 'webp'
+        quality: jpeg/webp 품질 (1~100)
+        tile_height: 지정하면 긴 페이지를 이 높이(CSS px)씩 나눠 캡처
+        tiles: 'stitch' (Pillow로 한 장으로 이어 붙임) 또는 'split' (조각마다 _001, _002 파일)
+        max_pixels: 이어 붙인 이미지가 이 픽셀 수를 넘으면 조각 파일로 저장
+    
+    Returns:
+        {'done': [출력 파일...], 'cached': [출력 파일...], 'errors': {HTML 파일: 메시지},
+         'waits': {HTML 파일: 준비 대기 시간(초)}, 'renders': {HTML 파일: 렌더링 시간(초)},
+         'idle': 작업 페이지가 큐를 기다린 시간 합계(초), 'elapsed': 초}
+    """
+    options = render_options(width, height, scale, selector, wait, timeout,
+                             image_format, quality, tile_height, tiles, max_pixels)
+    pairs = []
+    for job in jobs:
+        if isinstance(job, (tuple, list)):
+            html_path, output_file = Path(job[0]).resolve(), Path(job[1])
+        else:
+            html_path = Path(job).resolve()
+            output_file = html_path.with_suffix(IMAGE_FORMATS[image_format])
+        pairs.append((html_path, output_file))
+    return render_pages(pairs, options, concurrency, cache)
+
+def render_pages(pairs, options, concurrency=4, cache=True):
+    """
+    (HTML 파일, 출력 이미지 파일) 목록을 render_options()로 만든 옵션으로 렌더링
+    
+    Returns:
+        html_to_images와 같음
+    """
+    started = time.perf_counter()
+    result = new_result()
+    pending = []
+    for html_path, output_file in pairs:
+        if not cache or not html_path.exists():
+            pending.append((html_path, output_file, None))
+            continue
+        hit, cached_file = lookup_cached_image(html_path, output_file, options)
+        if hit:
+            result["cached"].append(str(output_file))
+        else:
+            pending.append((html_path, output_file, cached_file))
+    
+    # 캐시에 없는 페이지만 브라우저로 렌더링
+    if pending:
+        async_playwright = require_playwright()
+        asyncio.run(_render_batch(async_playwright, pending, options, concurrency, result))
+    
+    result["elapsed"] = time.perf_counter() - started
+    return result
+
+def new_result():
+    """html_to_images / render_queue 결과 딕셔너리"""
+    return {"done": [], "cached": [], "errors": {}, "waits": {}, "renders": {}, "idle": 0.0, "elapsed": 0.0}
+
+async def _render_batch(async_playwright, jobs, options, concurrency, result):
+    queue = asyncio.Queue()
+    workers = max(1, min(concurrency, len(jobs)))
+    for job in jobs:
+        queue.put_nowait(job)
+    for _ in range(workers):
+        queue.put_nowait(None)
+    await render_queue(async_playwright, queue, options, workers, result)
+
+async def render_queue(async_playwright, queue, options, concurrency, result):
+    """
+    큐에서 (HTML 파일, 출력 파일, 캐시 파일 또는 None)을 꺼내 렌더링
+    
+    브라우저는 한 번만 실행하고 작업 페이지 concurrency개가 큐를 나눠 소비한다.
+    작업 페이지마다 None을 하나씩 받으면 끝난다 (큐를 채우는 쪽이 작업 페이지 수만큼 넣음).
+    큐를 채우는 동안 동시에 실행할 수 있으므로 HTML 생성과 렌더링을 겹칠 수 있다.
+    """
+    async with async_playwright() as p:
+        # Chromium 브라우저는 한 번만 실행
+        browser = await p.chromium.launch(headless=True)
+        try:
+            await asyncio.gather(*[_render_worker(browser, queue, result, options) for _ in range(concurrency)])
+        finally:
+            await browser.close()
+
+async def _render_worker(browser, queue, result, options):
+    """큐에서 파일을 하나씩 꺼내 같은 페이지로 렌더링"""
+    # 뷰포트와 기기 배율은 페이지를 열기 전에 정해 두어 로딩 후 레이아웃이 다시 일어나지 않게 함
+    context = await browser.new_context(
+        viewport={"width": options["width"], "height": options["height"] or 800},
+        device_scale_factor=options["scale"],
+    )
+    page = await context.new_page()
+    page.set_default_timeout(options["timeout"])
+    cdp = await context.new_cdp_session(page)
+    try:
+        while True:
+            idle_started = time.perf_counter()
+            job = await queue.get()
+            result["idle"] += time.perf_counter() - idle_started
+            if job is None:
+                return
+            html_path, output_file, cached_file = job
+            started = time.perf_counter()
+            try:
+                if not html_path.exists():
+                    raise FileNotFoundError(f"파일을 찾을 수 없습니다: {html_path}")
+                waited, outputs = await _render_page(page, cdp, html_path, output_file, options)
+                # 조각 파일로 나뉜 결과는 캐시하지 않음 (한 장짜리 이미지만)
+                if cached_file is not None and outputs == [output_file]:
+                    _store_cached(output_file, cached_file)
+            except Exception as e:
+                result["errors"][str(html_path)] = f"{type(e).__name__}: {e}"
+            else:
+                result["done"].extend(str(path) for path in outputs)
+                result["waits"][str(html_path)] = waited
+                result["renders"][str(html_path)] = time.perf_counter() - started
+    finally:
+        await context.close()
+
+async def _wait_until_ready(page, options):
+    """페이지 준비 완료까지 대기하고 대기 시간(초) 반환"""
+    started = time.perf_counter()
+    if options["wait"] == "sleep":
+        # 이전 방식: networkidle 후 1초 고정 대기
+        await page.wait_for_load_state("networkidle")
+        await page.wait_for_timeout(1000)
+    else:
+        if await page.locator(options["selector"]).count() == 0:
+            await page.wait_for_selector(options["selector"], state="attached")
+        await asyncio.wait_for(
+            page.evaluate(_READY_SCRIPT, options["selector"]),
+            timeout=options["timeout"] / 1000,
+        )
+    return time.perf_counter() - started
+
+async def _capture(cdp, clip, options, lossless=False):
+    """
+    CDP로 문서 좌표 영역을 캡처해 이미지 바이트 반환 (뷰포트 밖 영역 포함)
+    
+    lossless=True면 출력 형식과 관계없이 PNG로 캡처한다 (이어 붙인 뒤 한 번만 인코딩할 조각).
+    """
+    image_format = "png" if lossless else options["format"]
+    params = {
+        "format": image_format,
+        "clip": dict(clip, scale=1),
+        "captureBeyondViewport": True,
+    }
+    if image_format != "png":
+        params["quality"] = options["quality"]
+    response = await cdp.send("Page.captureScreenshot", params)
+    return base64.b64decode(response["data"])
+
+def _write_bytes(path, data):
+    with open(path, "wb") as f:
+        f.write(data)
+
+async def _render_page(page, cdp, html_path, output_file, options):
+    """
+    열려 있는 페이지에 HTML 파일을 로드해 스크린샷 저장
+    
+    Returns:
+        (준비 대기 시간(초), 저장한 이미지 파일 목록)
+    """
+    # HTML 파일 로드 (스타일시트와 이미지까지)
+    await page.goto(html_path.as_uri(), wait_until="load")
     
-    if len(sys.argv) > 1:
-        html_file = sys.argv[1]
+    # 폰트, 레이아웃, 대상 요소가 준비될 때까지 대기
+    waited = await _wait_until_ready(page, options)
     
+    # 캡처 영역 계산 (대상 요소가 없으면 전체 페이지)
+    rect = await page.evaluate(_CLIP_SCRIPT, options["selector"])
+    x, y = rect["x"], rect["y"]
+    width, height = max(1, round(rect["width"])), max(1, round(rect["height"]))
+    tile_height = options["tile_height"]
+    
+    if not tile_height or height <= tile_height:
+        # 한 번에 캡처
+        _write_bytes(output_file, await _capture(cdp, {"x": x, "y": y, "width": width, "height": height}, options))
+        return waited, [output_file]
+    
+    # 긴 페이지는 tile_height씩 나눠 캡처 (브라우저는 조각 하나 크기만 그림)
+    offsets = range(0, height, tile_height)
+    scale = options["scale"]
+    stitch = (
+        options["tiles"] == "stitch"
+        and width * height * scale * scale <= options["max_pixels"]
+    )
+    
+    if not stitch:
+        outputs = []
+        for index, offset in enumerate(offsets, 1):
+            clip = {"x": x, "y": y + offset, "width": width, "height": min(tile_height, height - offset)}
+            tile_file = output_file.with_name(f"{output_file.stem}_{index:03d}{output_file.suffix}")
+            _write_bytes(tile_file, await _capture(cdp, clip, options))
+            outputs.append(tile_file)
+        return waited, outputs
+    
+    # 조각은 PNG로 캡처해 JPEG/WebP 손실 압축이 마지막 저장 때 한 번만 일어나게 함
+    from PIL import Image
+    canvas = Image.new("RGB", (round(width * scale), round(height * scale)))
+    top = 0
+    for offset in offsets:
+        clip = {"x": x, "y": y + offset, "width": width, "height": min(tile_height, height - offset)}
+        with Image.open(BytesIO(await _capture(cdp, clip, options, lossless=True))) as tile:
+            canvas.paste(tile.convert("RGB"), (0, top))
+            top += tile.height
+    save_options = {"quality": options["quality"]} if options["quality"] is not None else {}
+    canvas.save(output_file, format=options["format"].upper(), **save_options)
+    canvas.close()
+    return waited, [output_file]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HTML 파일을 이미지로 변환")
+    parser.add_argument("targets", nargs="*", default=["Jupiter 브라우저 변경.html"],
+                        help="HTML 파일, 폴더 또는 glob 패턴 (예: '*/*.html')")
+    parser.add_argument("-j", "--concurrency", type=int, default=4, help="동시에 렌더링할 페이지 수")
+    parser.add_argument("--width", type=int, default=1200, help="이미지 너비 (기본값: 1200px)")
+    parser.add_argument("--height", type=int, default=None, help="이미지 높이 (기본값: 자동)")
+    parser.add_argument("--scale", type=float, default=2, help="기기 배율 (기본값: 2)")
+    parser.add_argument("--selector", default=".container", help="스크린샷할 요소 (기본값: .container)")
+    parser.add_argument("--wait", choices=WAIT_MODES, default="signals",
+                        help="준비 대기 방식: signals (폰트/레이아웃 신호) 또는 sleep (1초 고정 대기)")
+    parser.add_argument("--no-cache", action="store_true", help="이미지 캐시를 사용하지 않음")
+    parser.add_argument("--format", choices=tuple(IMAGE_FORMATS), default="png", help="이미지 형식 (기본값: png)")
+    parser.add_argument("--quality", type=int, default=85, help="jpeg/webp 품질 (기본값: 85)")
+    parser.add_argument("--tile-height", type=int, default=None,
+                        help="긴 페이지를 이 높이(px)씩 나눠 캡처 (메모리 절약)")
+    parser.add_argument("--tiles", choices=TILE_MODES, default="stitch",
+                        help="조각 처리: stitch (한 장으로 이어 붙임, Pillow 필요) 또는 split (조각 파일)")
+    parser.add_argument("--max-pixels", type=int, default=DEFAULT_MAX_PIXELS,
+                        help="이어 붙인 이미지의 최대 픽셀 수 (넘으면 조각 파일로 저장)")
+    args = parser.parse_args(argv)
+    if not 1 <= args.quality <= 100:
+        parser.error(f"--quality는 1~100 사이여야 합니다: {args.quality}")
+    
+    html_files = collect_html_files(args.targets)
+    if not html_files:
+        print(f"오류: HTML 파일을 찾을 수 없습니다: {' '.join(args.targets)}")
+        return 1
+    
+    print(f"총 {len(html_files)}개 HTML 파일 변환 시작... (동시 {args.concurrency}개)")
     try:
-        html_to_image(html_file, None, width=1200)
-    except Exception as e:
-        print(f"오류 발생: {e}")
-        import traceback
-        traceback.print_exc()
+        result = html_to_images(html_files, width=args.width, height=args.height,
+                                concurrency=args.concurrency, scale=args.scale,
+                                selector=args.selector, wait=args.wait, cache=not args.no_cache,
+                                image_format=args.format, quality=args.quality,
+                                tile_height=args.tile_height, tiles=args.tiles, max_pixels=args.max_pixels)
+    except RuntimeError as e:
+        # 선택 의존성(playwright, Pillow)이 없는 경우
+        print(f"오류: {e}")
+        return 2
+    
+    for html_file, waited in sorted(result["waits"].items()):
+        print(f"이미지 생성 완료: {Path(html_file).name} (준비 대기 {waited * 1000:.0f}ms)")
+    for html_file, message in sorted(result["errors"].items()):
+        print(f"[ERROR] 오류 발생 ({html_file}): {message}")
+    print(f"\n완료 {len(result['done'])}개, 캐시 {len(result['cached'])}개, "
+          f"오류 {len(result['errors'])}개 ({result['elapsed']:.1f}초)")
+    return 1 if result["errors"] else 0
 
+if __name__ == "__main__":
+    sys.exit(main())
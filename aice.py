@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+학습 자료 빌드 도구 통합 실행 스크립트
+
+    python aice.py convert [폴더...]     마크다운 -> HTML 일괄 변환 (md_to_html_final)
+    python aice.py image [HTML...]       HTML -> 이미지 (01_개요 및 환경/html_to_image.py)
+    python aice.py watch                 변경 감시 + 자동 변환 + 브라우저 새로고침 (md_watch)
+    python aice.py bench                 변환기 성능 비교 (bench_converters)
+    python aice.py serve                 미리 압축 + 로컬 정적 서버 (md_static)
+    python aice.py publish               마크다운 -> HTML -> 이미지 파이프라인 (md_publish)
+    python aice.py check                 python 코드 블록 실행 확인 (md_check)
+    python aice.py dashboard             진도표 데이터 생성 (md_dashboard)
+    python aice.py book                  전체 챕터 -> 목차가 있는 교재 PDF (md_book)
+    python aice.py render                한 번 파싱해 인쇄용 HTML/텍스트/목차 출력 (md_ast)
+
+하위 명령에 필요한 모듈만 그 명령을 실행할 때 import한다. 선택 의존성이 없으면
+설치를 시도하지 않고 설치 방법을 출력한 뒤 바로 종료한다.
+convert는 지난 실행과 옵션이 같고 입력/출력 파일이 하나도 바뀌지 않았으면 변환기를
+import하지 않고 stat만으로 끝낸다 (--force를 주면 항상 변환기를 실행).
+각 하위 명령의 옵션은 'python aice.py <명령> --help'로 확인한다.
+"""
+import os
+import sys
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 명령 -> (모듈 이름 또는 저장소 기준 파일 경로, 설명)
+COMMANDS = {
+    "convert": ("md_to_html_final", "마크다운을 HTML로 일괄 변환"),
+    "image": (os.path.join("01_개요 및 환경", "html_to_image.py"), "HTML을 이미지로 변환"),
+    "watch": ("md_watch", "변경 감시 + 자동 변환 + 브라우저 자동 새로고침"),
+    "bench": ("bench_converters", "변환기 성능 비교"),
+    "serve": ("md_static", "빌드 결과물 미리 압축 + 로컬 정적 서버"),
+    "publish": ("md_publish", "HTML 변환과 이미지 렌더링을 겹쳐 실행"),
+    "check": ("md_check", "python 코드 블록이 실행되는지 확인"),
+    "dashboard": ("md_dashboard", "학습 일정에서 진도표 데이터 생성"),
+    "book": ("md_book", "전체 챕터를 교재 PDF 하나로 출력"),
+    "render": ("md_ast", "한 번 파싱해 인쇄용 HTML, 텍스트, 목차 등으로 출력"),
+}
+
+# 명령 -> [(import 이름, 설치 방법)] (실행 전에 설치 여부만 확인, import는 하지 않음)
+REQUIREMENTS = {
+    "image": [("playwright", "pip install playwright && playwright install chromium")],
+    "publish": [("playwright", "pip install playwright && playwright install chromium")],
+}
+
+# md_to_html_final.NOOP_STAMP_PATH (변환기를 import하지 않고 읽으려고 경로를 따로 적음)
+NOOP_STAMP_PATH = os.path.join(BASE_DIR, ".build_cache", "noop_stamp.json")
+
+def usage():
+    width = max(len(name) for name in COMMANDS)
+    lines = ["사용법: python aice.py <명령> [옵션...]", "", "명령:"]
+    lines += [f"  {name:<{width}}  {description}" for name, (_, description) in COMMANDS.items()]
+    lines += ["", "명령별 옵션: python aice.py <명령> --help"]
+    return "\n".join(lines)
+
+def missing_requirements(command):
+    """설치되지 않은 선택 의존성 -> [(이름, 설치 방법)]"""
+    from importlib.util import find_spec
+    return [(name, hint) for name, hint in REQUIREMENTS.get(command, []) if find_spec(name) is None]
+
+def highlighter_version():
+    """md_to_html_final.highlighter_version()과 같은 값 (패키지 버전만 확인)"""
+    try:
+        import pygments
+    except ImportError:
+        return "none"
+    return f"pygments-{pygments.__version__}"
+
+def convert_up_to_date(argv, stamp_path=NOOP_STAMP_PATH):
+    """
+    지난 convert와 옵션/실행 폴더가 같고 기록된 파일이 하나도 바뀌지 않았는지 확인
+    
+    md_to_html_final을 import하지 않고 Python과 Pygments 버전(렉서는 로드하지 않음),
+    기록된 파일의 크기와 수정 시각만 비교한다.
+    바뀐 것이 없으면 지난 실행의 깨진 링크를 다시 출력하고 True를 돌려준다.
+    """
+    import json
+    try:
+        with open(stamp_path, "r", encoding="utf-8") as f:
+            stamp = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return False
+    if stamp.get("argv") != argv or stamp.get("cwd") != os.getcwd():
+        return False
+    if stamp.get("python") != [sys.executable, sys.version] or stamp.get("highlighter") != highlighter_version():
+        return False
+    for path, expected in stamp.get("files", {}).items():
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            current = None
+        else:
+            current = [st.st_size, st.st_mtime_ns]
+        if current != expected:
+            return False
+    
+    print(f"\n총 {stamp['sources']}개 파일: 지난 변환 이후 바뀐 파일 없음 (다시 변환하려면 --force)\n")
+    for key, href, reason in stamp["broken"]:
+        print(f"[LINK] 깨진 링크 ({key}): {href} ({reason})")
+    return True
+
+def load_command(command):
+    """명령 모듈 로드 (폴더 이름에 공백이 있는 스크립트는 파일 경로로 로드)"""
+    import importlib
+    target = COMMANDS[command][0]
+    if not target.endswith(".py"):
+        return importlib.import_module(target)
+    import importlib.util
+    path = os.path.join(BASE_DIR, target)
+    spec = importlib.util.spec_from_file_location(os.path.splitext(os.path.basename(path))[0], path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] in ("-h", "--help"):
+        print(usage())
+        return 0 if argv else 2
+    command, rest = argv[0], argv[1:]
+    if command not in COMMANDS:
+        print(f"오류: 알 수 없는 명령: {command}\n\n{usage()}", file=sys.stderr)
+        return 2
+    
+    # 도움말은 의존성 없이도 볼 수 있게 함
+    missing = [] if {"-h", "--help"} & set(rest) else missing_requirements(command)
+    if missing:
+        for name, hint in missing:
+            print(f"오류: '{command}' 명령에는 {name}가 필요합니다: {hint}", file=sys.stderr)
+        return 2
+    
+    if command == "convert" and convert_up_to_date(rest):
+        return 0
+    
+    # 하위 명령의 도움말/오류 메시지에 'aice.py <명령>'이 표시되도록 함
+    sys.argv[0] = f"{os.path.basename(sys.argv[0])} {command}"
+    return load_command(command).main(rest)
+
+if __name__ == "__main__":
+    sys.exit(main())
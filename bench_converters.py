@@ -0,0 +1,307 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+세 가지 변환기(md_to_html, md_to_html_improved, md_to_html_final)의 성능 비교 벤치마크
+
+실제 챕터 파일, 10배~1000배로 늘린 합성 문서, 병적인 입력(별표가 가득한 긴 줄,
+깊은 리스트, 거대한 코드 블록)에 대해 줄/초, 파일별 지연 시간 백분위수,
+최대 메모리를 측정해 JSON 파일로 저장한다.
+
+코드 하이라이트 캐시가 있는 변환기(md_to_html_final)는 두 가지로 따로 잰다 (결과의 'cache'):
+'cold'는 실행마다 빈 캐시에서 시작해 Pygments 하이라이트 비용까지 포함하고,
+'warm'은 미리 한 번 실행해 채운 디스크 캐시로 잰다 (캐시가 찬 빌드 프로세스와 같은 조건,
+프로세스 안 메모리 캐시는 실행마다 비움). 둘 다 저장소의 .build_cache/highlight는 쓰지 않는다.
+캐시가 없는 변환기는 'none'이다.
+"""
+import os
+import sys
+import gc
+import json
+import time
+import argparse
+import platform
+import tempfile
+import importlib
+import contextlib
+import tracemalloc
+import multiprocessing
+
+import md_to_html_final
+
+VARIANTS = ("md_to_html", "md_to_html_improved", "md_to_html_final")
+DEFAULT_OUTPUT = os.path.join(md_to_html_final.BUILD_DIR, "bench_results.json")
+# 측정 실행 한 번에 허용하는 최대 시간 (초), 넘으면 멈춘 것으로 보고 중단해 timeout으로 기록
+DEFAULT_TIMEOUT = 60
+
+def load_variants(names=VARIANTS):
+    """변환기 모듈 로드 -> {이름: 모듈}"""
+    return {name: importlib.import_module(name) for name in names}
+
+def variant_apis(module):
+    """
+    측정할 함수 목록 -> {'file': f(md_path, html_path), 'parse': f(md_content)}
+    
+    parse_markdown_to_html이 없는 변환기(md_to_html)는 파일 단위만 측정한다.
+    """
+    apis = {"file": module.markdown_to_html}
+    if hasattr(module, "parse_markdown_to_html"):
+        apis["parse"] = module.parse_markdown_to_html
+    return apis
+
+# ---------------------------------------------------------------------------
+# 입력 문서
+# ---------------------------------------------------------------------------
+
+def real_inputs():
+    """실제 챕터 파일 -> [(이름, 내용)]"""
+    inputs = []
+    for md_file, _ in md_to_html_final.discover_sources():
+        with open(md_file, "r", encoding="utf-8") as f:
+            inputs.append((md_to_html_final.manifest_key(md_file), f.read()))
+    return inputs
+
+def scaled_inputs(corpus, scales):
+    """전체 챕터를 이어 붙인 문서를 배율만큼 반복 -> [(이름, 내용)]"""
+    joined = "\n\n".join(content for _, content in corpus)
+    return [(f"synthetic_x{scale}", "\n\n".join([joined] * scale)) for scale in scales]
+
+def pathological_inputs(size=2000):
+    """변환기를 괴롭히는 입력 -> [(이름, 내용)]"""
+    star_line = " ".join(["*a", "**b", "c*", "*"] * (size // 8))
+    deep_list = "\n".join(("  " * (i % 12)) + f"- 항목 {i} **강조** `code`" for i in range(size))
+    code_block = "```python\n" + "\n".join(f"x_{i} = [i * 2 for i in range({i})]  # <{i}> & *" for i in range(size * 10)) + "\n```"
+    bracket_line = "[" * size + "](" * (size // 2) + "text"
+    backtick_line = "`a" * size
+    return [
+        ("pathological_stars", "# 별표\n\n" + "\n".join([star_line] * 50)),
+        ("pathological_deep_list", "# 깊은 리스트\n\n" + deep_list),
+        ("pathological_huge_code", "# 거대한 코드 블록\n\n" + code_block),
+        ("pathological_brackets", "# 대괄호\n\n" + "\n".join([bracket_line] * 50)),
+        ("pathological_backticks", "# 백틱\n\n" + "\n".join([backtick_line] * 50)),
+    ]
+
+# ---------------------------------------------------------------------------
+# 측정
+# ---------------------------------------------------------------------------
+
+def percentile(sorted_values, fraction):
+    """정렬된 값에서 선형 보간 백분위수"""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+def cache_modes(module):
+    """변환기별 측정할 캐시 조건 ('cold', 'warm' 또는 캐시가 없으면 'none')"""
+    return ("cold", "warm") if hasattr(module, "HIGHLIGHT_CACHE_DIR") else ("none",)
+
+def isolate_highlight_cache(module, cache_dir, mode):
+    """
+    하이라이트 디스크 캐시를 cache_dir로 바꾸고 측정 실행 전마다 호출할 함수를 돌려줌
+    
+    mode가 'cold'면 디스크 캐시와 프로세스 안 메모리 캐시를 모두 비우고,
+    'warm'이면 메모리 캐시만 비운다 (디스크 캐시는 측정 전 준비 실행으로 채움).
+    """
+    module.HIGHLIGHT_CACHE_DIR = cache_dir
+    
+    def reset():
+        module._highlight_memo.clear()
+        if mode == "cold":
+            for name in os.listdir(cache_dir):
+                os.remove(os.path.join(cache_dir, name))
+    
+    return reset
+
+def measure(func, args, repeat, reset=None, warmup=False, on_run=None):
+    """
+    func(*args)를 repeat번 실행한 지연 시간(초) 목록과 최대 메모리(바이트)
+    
+    reset이 있으면 실행마다 시간을 재기 전에 호출한다 (캐시 비우기 등).
+    warmup=True면 재지 않는 준비 실행을 먼저 한 번 하고, on_run은 실행이 하나 끝날 때마다 호출한다.
+    """
+    timings = []
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        if warmup:
+            func(*args)
+            if on_run is not None:
+                on_run()
+        for _ in range(repeat):
+            if reset is not None:
+                reset()
+            gc.collect()
+            started = time.perf_counter()
+            func(*args)
+            timings.append(time.perf_counter() - started)
+            if on_run is not None:
+                on_run()
+        
+        # 메모리는 별도 실행으로 측정 (tracemalloc이 실행 속도를 늦추므로)
+        if reset is not None:
+            reset()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            func(*args)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return timings, peak
+
+def _case_entry(conn, variant, api, cache, md_path, html_path, repeat):
+    """
+    자식 프로세스에서 측정 실행 후 (timings, peak) 또는 오류 메시지를 전송
+    
+    실행이 하나 끝날 때마다 ('run', None)을 보내 부모가 실행 단위로 시간 초과를 판단하게 한다.
+    """
+    try:
+        module = importlib.import_module(variant)
+        func = variant_apis(module)[api]
+        if api == "file":
+            args = (md_path, html_path)
+        else:
+            with open(md_path, "r", encoding="utf-8") as f:
+                args = (f.read(),)
+        on_run = lambda: conn.send(("run", None))
+        if cache == "none":
+            conn.send(("ok", measure(func, args, repeat, on_run=on_run)))
+            return
+        # 저장소의 하이라이트 캐시를 읽거나 채우지 않도록 측정마다 임시 캐시 사용
+        with tempfile.TemporaryDirectory(prefix="bench_highlight_") as cache_dir:
+            reset = isolate_highlight_cache(module, cache_dir, cache)
+            conn.send(("ok", measure(func, args, repeat, reset, warmup=cache == "warm", on_run=on_run)))
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+def run_case(variant, api, name, content, md_path, html_path, repeat, timeout=DEFAULT_TIMEOUT, cache="none"):
+    """
+    한 변환기 x 한 입력 x 한 캐시 조건 측정 결과
+    
+    측정은 별도 프로세스에서 실행한다. 변환기끼리 메모리 측정이 섞이지 않고,
+    정규식 역추적으로 멈춘 변환기도 실행 하나가 timeout을 넘으면 중단할 수 있다.
+    """
+    lines = content.count("\n") + 1
+    record = {
+        "variant": variant, "api": api, "cache": cache, "input": name,
+        "lines": lines, "bytes": len(content.encode("utf-8")),
+    }
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(
+        target=_case_entry, args=(sender, variant, api, cache, md_path, html_path, repeat), daemon=True)
+    process.start()
+    sender.close()
+    while True:
+        if not receiver.poll(timeout):
+            process.terminate()
+            process.join()
+            record["error"] = f"timeout: 실행 한 번이 {timeout:g}초 안에 끝나지 않음"
+            return record
+        status, payload = receiver.recv()
+        if status != "run":
+            break
+    process.join()
+    if status == "error":
+        record["error"] = payload
+        return record
+    timings, peak = payload
+    timings.sort()
+    median = percentile(timings, 0.5)
+    record.update({
+        "runs": len(timings),
+        "latency_ms": {
+            "p50": median * 1000,
+            "p90": percentile(timings, 0.9) * 1000,
+            "p99": percentile(timings, 0.99) * 1000,
+            "max": timings[-1] * 1000,
+            "mean": sum(timings) / len(timings) * 1000,
+        },
+        "lines_per_sec": lines / median if median > 0 else None,
+        "peak_memory_kb": peak / 1024,
+    })
+    return record
+
+def run_benchmarks(variants=VARIANTS, scales=(10, 100, 1000), repeat=5, include_real=True,
+                   include_pathological=True, timeout=DEFAULT_TIMEOUT, progress=None):
+    """
+    전체 벤치마크 실행
+    
+    Returns:
+        {'environment': {...}, 'results': [측정 결과...]}
+    """
+    load_variants(variants)  # 없는 변환기는 여기서 바로 ImportError
+    corpus = real_inputs()
+    inputs = []
+    if include_real:
+        inputs += [(name, content, repeat) for name, content in corpus]
+    # 큰 합성 문서는 반복 횟수를 줄임
+    inputs += [(name, content, max(1, repeat // (scale // 10 or 1)))
+               for (name, content), scale in zip(scaled_inputs(corpus, scales), scales)]
+    if include_pathological:
+        inputs += [(name, content, repeat) for name, content in pathological_inputs()]
+    
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        html_path = os.path.join(tmp_dir, "out.html")
+        for index, (name, content, runs) in enumerate(inputs):
+            md_path = os.path.join(tmp_dir, f"input_{index}.md")
+            with open(md_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            for variant in variants:
+                module = importlib.import_module(variant)
+                for api in variant_apis(module):
+                    for cache in cache_modes(module):
+                        record = run_case(variant, api, name, content, md_path, html_path, runs, timeout, cache)
+                        results.append(record)
+                        if progress is not None:
+                            progress(record)
+            os.remove(md_path)
+    
+    return {
+        "environment": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeat": repeat,
+            "timeout": timeout,
+            "scales": list(scales),
+        },
+        "results": results,
+    }
+
+def format_record(record):
+    label = f"{record['variant']:<20} {record['api']:<5} {record['cache']:<5} {record['input'][:40]:<40}"
+    if "error" in record:
+        return f"{label} 오류: {record['error']}"
+    latency = record["latency_ms"]
+    return (f"{label} p50 {latency['p50']:9.2f}ms  p99 {latency['p99']:9.2f}ms  "
+            f"{record['lines_per_sec']:12,.0f} 줄/초  {record['peak_memory_kb']:10,.0f} KB")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="마크다운 변환기 성능 비교")
+    parser.add_argument("--variants", default=",".join(VARIANTS), help="비교할 변환기 (쉼표 구분)")
+    parser.add_argument("--scales", default="10,100,1000", help="합성 문서 배율 (쉼표 구분, 빈 값이면 생략)")
+    parser.add_argument("--repeat", type=int, default=5, help="입력별 반복 실행 횟수")
+    parser.add_argument("--no-real", action="store_true", help="실제 챕터 파일 측정 생략")
+    parser.add_argument("--no-pathological", action="store_true", help="병적인 입력 측정 생략")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help=f"실행 한 번의 최대 시간(초), 넘으면 멈춘 것으로 보고 중단 (기본값: {DEFAULT_TIMEOUT})")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help="결과 JSON 파일 경로")
+    args = parser.parse_args(argv)
+    
+    variants = tuple(v for v in args.variants.split(",") if v)
+    scales = tuple(int(s) for s in args.scales.split(",") if s)
+    report = run_benchmarks(variants, scales, args.repeat, not args.no_real,
+                            not args.no_pathological, args.timeout, progress=lambda r: print(format_record(r)))
+    
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=1)
+    print(f"\n결과 저장: {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+window.AICE_DASHBOARD = {"version":1,"title":"AICE Associate 32일 학습 일정","start":"2025-11-18","goal":"2025-12-20","source":"32dbbd91bc88","groups":[{"id":"p1","kind":"phase","title":"Phase 1: Python 기초","range":"Day 1-10","tasks":[{"id":"d1","name":"Day 1 (11/18)","date":"2025-11-18","time":2.0,"goal":"Python 환경 설정 및 기본 문법"},{"id":"d1.1b1d1c18","name":"Python 설치 완료","parent":"d1"},{"id":"d1.a48b0d86","name":"Jupyter Notebook 실행 확인","parent":"d1"},{"id":"d1.2f985d63","name":"기본 문법 실습 완료","parent":"d1"},{"id":"d2","name":"Day 2 (11/19)","date":"2025-11-19","time":2.0,"goal":"자료형 심화 (리스트, 딕셔너리, 튜플)"},{"id":"d3","name":"Day 3 (11/20)","date":"2025-11-20","time":2.0,"goal":"조건문 (if, elif, else)"},{"id":"d4","name":"Day 4 (11/21)","date":"2025-11-21","time":2.0,"goal":"반복문 (for, while)"},{"id":"d5","name":"Day 5 (11/22)","date":"2025-11-22","time":2.0,"goal":"함수 정의 및 활용"},{"id":"d6","name":"Day 6 (11/23)","date":"2025-11-23","time":2.0,"goal":"모듈 및 패키지"},{"id":"d7","name":"Day 7 (11/24)","date":"2025-11-24","time":2.0,"goal":"Python 기초 종합 복습"},{"id":"d8","name":"Day 8 (11/25)","date":"2025-11-25","time":2.0,"goal":"Python 기초 종합 복습"},{"id":"d9","name":"Day 9 (11/26)","date":"2025-11-26","time":2.0,"goal":"Python 기초 종합 복습"},{"id":"d10","name":"Day 10 (11/27)","date":"2025-11-27","time":2.0,"goal":"Python 기초 종합 복습"},{"id":"p1.18ba5cb5","name":"Python 기초 문법 완료","parent":"p1"},{"id":"p1.5bf0eddf","name":"자료형 활용 완료","parent":"p1"},{"id":"p1.a76afb1a","name":"제어문 활용 완료","parent":"p1"},{"id":"p1.75c7bce5","name":"함수 작성 완료","parent":"p1"}]},{"id":"p2","kind":"phase","title":"Phase 2: 데이터 분석","range":"Day 11-18","tasks":[{"id":"d11","name":"Day 11 (11/28)","date":"2025-11-28","time":3.0,"goal":"NumPy 기초"},{"id":"d12","name":"Day 12 (11/29)","date":"2025-11-29","time":3.0,"goal":"NumPy 고급"},{"id":"d13","name":"Day 13 (11/30)","date":"2025-11-30","time":3.0,"goal":"Pandas 기초"},{"id":"d14","name":"Day 14 (12/1)","date":"2025-12-01","time":3.0,"goal":"Pandas 데이터 선택 및 필터링"},{"id":"d15","name":"Day 15 (12/2)","date":"2025-12-02","time":2.0,"goal":"데이터 탐색"},{"id":"d16","name":"Day 16 (12/3)","date":"2025-12-03","time":2.0,"goal":"데이터 전처리 기초"},{"id":"d17","name":"Day 17 (12/4)","date":"2025-12-04","time":2.0,"goal":"데이터 전처리 기초"},{"id":"d18","name":"Day 18 (12/5)","date":"2025-12-05","time":2.0,"goal":"데이터 전처리 기초"},{"id":"p2.ece467dc","name":"NumPy 활용 완료","parent":"p2"},{"id":"p2.f88e7cbd","name":"Pandas 활용 완료","parent":"p2"},{"id":"p2.ea06ff82","name":"데이터 전처리 완료","parent":"p2"}]},{"id":"p3","kind":"phase","title":"Phase 3: 머신러닝","range":"Day 19-28","tasks":[{"id":"d19","name":"Day 19 (12/6)","date":"2025-12-06","time":3.0,"goal":"머신러닝 개요"},{"id":"d20","name":"Day 20 (12/7)","date":"2025-12-07","time":3.0,"goal":"회귀 모델"},{"id":"d21","name":"Day 21 (12/8)","date":"2025-12-08","time":3.0,"goal":"회귀 모델"},{"id":"d22","name":"Day 22 (12/9)","date":"2025-12-09","time":3.0,"goal":"회귀 모델"},{"id":"d23","name":"Day 23 (12/10)","date":"2025-12-10","time":3.0,"goal":"분류 모델"},{"id":"d24","name":"Day 24 (12/11)","date":"2025-12-11","time":3.0,"goal":"분류 모델"},{"id":"d25","name":"Day 25 (12/12)","date":"2025-12-12","time":3.0,"goal":"분류 모델"},{"id":"d26","name":"Day 26 (12/13)","date":"2025-12-13","time":2.0,"goal":"모델 평가"},{"id":"d27","name":"Day 27 (12/14)","date":"2025-12-14","time":2.0,"goal":"모델 평가"},{"id":"d28","name":"Day 28 (12/15)","date":"2025-12-15","time":3.0,"goal":"하이퍼파라미터 튜닝"},{"id":"p3.ea960faf","name":"머신러닝 개념 이해","parent":"p3"},{"id":"p3.ada24687","name":"회귀 모델 실습 완료","parent":"p3"},{"id":"p3.bd762694","name":"분류 모델 실습 완료","parent":"p3"},{"id":"p3.af397067","name":"모델 평가 완료","parent":"p3"}]},{"id":"p4","kind":"phase","title":"Phase 4: 실전 대비","range":"Day 29-32","tasks":[{"id":"d29","name":"Day 29 (12/16)","date":"2025-12-16","time":4.0,"goal":"기출 유형 분석"},{"id":"d30","name":"Day 30 (12/17)","date":"2025-12-17","time":4.0,"goal":"모의고사 1회"},{"id":"d31","name":"Day 31 (12/18)","date":"2025-12-18","time":4.0,"goal":"모의고사 2회"},{"id":"d32","name":"Day 32 (12/19)","date":"2025-12-19","time":3.0,"goal":"최종 정리"},{"id":"p4.ba4d09da","name":"기출 문제 분석 완료","parent":"p4"},{"id":"p4.1e53569d","name":"모의고사 2회 이상 완료","parent":"p4"},{"id":"p4.910f9efc","name":"최종 정리 완료","parent":"p4"}]},{"id":"c01","kind":"chapter","title":"01_개요 및 환경","tasks":[{"id":"c:01_개요 및 환경/01_01_개요.md","name":"01_01_개요.md","title":"01. AICE Associate 개요","url":"01_개요 및 환경/01_01_개요.html","sections":7}]},{"id":"c02","kind":"chapter","title":"02_파이썬기초","tasks":[{"id":"c:02_파이썬기초/02_01_기본문법.md","name":"02_01_기본문법.md","title":"02-01. 파이썬 기본 문법","url":"02_파이썬기초/02_01_기본문법.html","sections":9},{"id":"c:02_파이썬기초/02_02_자료형.md","name":"02_02_자료형.md","title":"02-02. 파이썬 자료형","url":"02_파이썬기초/02_02_자료형.html","sections":12},{"id":"c:02_파이썬기초/02_03_제어문.md","name":"02_03_제어문.md","title":"02-03. 파이썬 제어문","url":"02_파이썬기초/02_03_제어문.html","sections":8},{"id":"c:02_파이썬기초/02_04_함수모듈.md","name":"02_04_함수모듈.md","title":"02-04. 파이썬 함수와 모듈","url":"02_파이썬기초/02_04_함수모듈.html","sections":11},{"id":"c:02_파이썬기초/02_05_웹데이터수집.md","name":"02_05_웹데이터수집.md","title":"02-05. 웹데이터 수집","url":"02_파이썬기초/02_05_웹데이터수집.html","sections":11}]},{"id":"c03","kind":"chapter","title":"03_데이터분석","tasks":[{"id":"c:03_데이터분석/03_01_Numpy기초.md","name":"03_01_Numpy기초.md","title":"03-01. NumPy 기초","url":"03_데이터분석/03_01_Numpy기초.html","sections":12},{"id":"c:03_데이터분석/03_02_Pandas기초.md","name":"03_02_Pandas기초.md","title":"03-02. Pandas 기초","url":"03_데이터분석/03_02_Pandas기초.html","sections":12}]},{"id":"c04","kind":"chapter","title":"04_전처리","tasks":[{"id":"c:04_전처리/04_01_데이터전처리.md","name":"04_01_데이터전처리.md","title":"04-01. 데이터 전처리","url":"04_전처리/04_01_데이터전처리.html","sections":10}]},{"id":"c05","kind":"chapter","title":"05_시각화","tasks":[{"id":"c:05_시각화/05_01_데이터시각화.md","name":"05_01_데이터시각화.md","title":"05-01. 데이터 시각화","url":"05_시각화/05_01_데이터시각화.html","sections":9}]},{"id":"c06","kind":"chapter","title":"06_머신러닝","tasks":[{"id":"c:06_머신러닝/06_01_머신러닝기초.md","name":"06_01_머신러닝기초.md","title":"06-01. 머신러닝 기초","url":"06_머신러닝/06_01_머신러닝기초.html","sections":11}]},{"id":"c07","kind":"chapter","title":"07_기출문제","tasks":[{"id":"c:07_기출문제/07_01_기출문제분석.md","name":"07_01_기출문제분석.md","title":"07-01. 기출 문제 분석","url":"07_기출문제/07_01_기출문제분석.html","sections":8}]}]};
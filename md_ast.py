@@ -0,0 +1,516 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+마크다운 문서를 한 번만 파싱해 블록/인라인 트리로 만들고,
+그 트리로 여러 출력(다크 테마 HTML, 인쇄용 HTML, 검색용 텍스트, 목차)을 만드는 스크립트
+
+파싱은 md_to_html_final의 블록 이벤트(iter_block_events)와 인라인 스캐너를 그대로 사용하므로
+두 변환 경로의 문법 해석이 항상 같다. 트리는 .build_cache/ast에 캐시한다.
+"""
+import os
+import sys
+import json
+import pickle
+import hashlib
+import argparse
+
+import md_to_html_final as converter
+from md_to_html_final import (escape_html, highlight_code, iter_block_events, extract_title, write_if_changed,
+                               table_links_html, heading_slug)
+
+AST_CACHE_DIR = os.path.join(converter.BUILD_DIR, "ast")
+
+# ---------------------------------------------------------------------------
+# 노드
+# ---------------------------------------------------------------------------
+
+class Node:
+    """모든 노드의 기반 클래스 (__slots__로 인스턴스 딕셔너리 없이 저장)"""
+    __slots__ = ()
+    
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+    
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+    
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+# 블록 노드
+class Document(Node):
+    __slots__ = ("title", "children")
+
+class Section(Node):
+    """요약/체크리스트 상자 (kind: 'summary' | 'checklist')"""
+    __slots__ = ("kind", "children")
+
+class Heading(Node):
+    __slots__ = ("level", "children")
+
+class Paragraph(Node):
+    __slots__ = ("children",)
+
+class ListBlock(Node):
+    """children은 ListItem 목록"""
+    __slots__ = ("ordered", "children")
+
+class ListItem(Node):
+    __slots__ = ("children",)
+
+class CheckItem(Node):
+    __slots__ = ("checked", "children")
+
+class CodeBlock(Node):
+    __slots__ = ("lang", "code")
+
+class Quote(Node):
+    """인용구 (kind: 'tip' | 'warning' | 'quote')"""
+    __slots__ = ("kind", "children")
+
+class Rule(Node):
+    __slots__ = ()
+
+class Table(Node):
+    """aligns: 열 정렬 튜플, children: TableRow 목록 (첫 행이 머리글)"""
+    __slots__ = ("aligns", "children")
+
+class TableRow(Node):
+    """cells: 칸별 인라인 노드 목록 (literal=True면 CSV 값이라 이스케이프해서 출력)"""
+    __slots__ = ("header", "cells", "literal")
+
+class TableLinks(Node):
+    """표 아래 링크 줄 (links: [(주소, 이름)])"""
+    __slots__ = ("links",)
+
+# 인라인 노드
+class Text(Node):
+    __slots__ = ("text",)
+
+class Code(Node):
+    __slots__ = ("text",)
+
+class Strong(Node):
+    __slots__ = ("children",)
+
+class Emphasis(Node):
+    __slots__ = ("children",)
+
+class Link(Node):
+    __slots__ = ("href", "children")
+
+# ---------------------------------------------------------------------------
+# 파싱
+# ---------------------------------------------------------------------------
+
+class _Marker:
+    """인라인 스캐너가 HTML 태그 대신 출력하는 표식"""
+    __slots__ = ("name",)
+    
+    def __init__(self, name):
+        self.name = name
+    
+    def __repr__(self):
+        return f"<{self.name}>"
+
+(STRONG_OPEN, STRONG_CLOSE, EM_OPEN, EM_CLOSE, CODE_OPEN, CODE_CLOSE,
+ LINK_OPEN, LINK_HREF_END, LINK_CLOSE) = (_Marker(name) for name in (
+    "strong", "/strong", "em", "/em", "code", "/code", "a", "a-href-end", "/a"))
+
+# md_to_html_final.HTML_INLINE_TAGS와 같은 순서 (코드 내용은 이스케이프하지 않음)
+NODE_INLINE_TAGS = (
+    STRONG_OPEN, STRONG_CLOSE, EM_OPEN, EM_CLOSE, CODE_OPEN, CODE_CLOSE,
+    LINK_OPEN, LINK_HREF_END, LINK_CLOSE, str,
+)
+
+def parse_inline_nodes(text):
+    """인라인 마크다운을 인라인 노드 목록으로 변환"""
+    if not converter._INLINE_SPECIAL.search(text):
+        return [Text(text)] if text else []
+    tokens = []
+    converter._scan_inline(text, 0, len(text), tokens, NODE_INLINE_TAGS)
+    
+    root = []
+    stack = [root]
+    it = iter(tokens)
+    for token in it:
+        children = stack[-1]
+        if token.__class__ is str:
+            # 스캐너는 텍스트를 여러 조각으로 낼 수 있으므로 이어 붙임
+            if children and children[-1].__class__ is Text:
+                children[-1].text += token
+            elif token:
+                children.append(Text(token))
+        elif token is CODE_OPEN:
+            children.append(Code(next(it)))
+            next(it)  # CODE_CLOSE
+        elif token is LINK_OPEN:
+            node = Link(next(it), [])
+            next(it)  # LINK_HREF_END
+            children.append(node)
+            stack.append(node.children)
+        elif token is STRONG_OPEN or token is EM_OPEN:
+            node = (Strong if token is STRONG_OPEN else Emphasis)([])
+            children.append(node)
+            stack.append(node.children)
+        else:  # STRONG_CLOSE, EM_CLOSE, LINK_CLOSE
+            stack.pop()
+    return root
+
+def build_document(md_content, source=None):
+    """마크다운 문자열을 Document 트리로 변환 (source: include 지시문 기준이 되는 마크다운 파일 경로)"""
+    lines = md_content.split('\n')
+    document = Document(extract_title(lines), [])
+    # 열린 컨테이너 노드 (가장 안쪽이 마지막)
+    stack = [document]
+    
+    for event in iter_block_events(lines, source):
+        kind = event[0]
+        parent = stack[-1].children
+        if kind == 'table_row':
+            literal = event[3]
+            cells = [[Text(cell)] if literal else parse_inline_nodes(cell) for cell in event[2]]
+            parent.append(TableRow(event[1], cells, literal))
+        elif kind == 'item':
+            parent.append(ListItem(parse_inline_nodes(event[1])))
+        elif kind == 'paragraph':
+            parent.append(Paragraph(parse_inline_nodes(event[1])))
+        elif kind == 'heading':
+            parent.append(Heading(event[1], parse_inline_nodes(event[2])))
+        elif kind == 'code':
+            parent.append(CodeBlock(event[1], event[2]))
+        elif kind == 'check':
+            parent.append(CheckItem(event[1], parse_inline_nodes(event[2])))
+        elif kind == 'quote':
+            parent.append(Quote(event[1], parse_inline_nodes(event[2])))
+        elif kind == 'rule':
+            parent.append(Rule())
+        elif kind == 'list_open':
+            node = ListBlock(event[1] == 'ol', [])
+            parent.append(node)
+            stack.append(node)
+        elif kind == 'section_open':
+            node = Section(event[1], [])
+            parent.append(node)
+            stack.append(node)
+        elif kind == 'table_open':
+            node = Table(event[1], [])
+            parent.append(node)
+            stack.append(node)
+        elif kind == 'table_close':
+            stack.pop()
+        elif kind == 'table_links':
+            parent.append(TableLinks(event[1]))
+        elif kind == 'list_close':
+            while len(stack) > 1 and stack.pop().__class__ is not ListBlock:
+                pass
+        elif kind == 'section_close':
+            # HTML과 같이 가장 안쪽 섹션을 닫음
+            for depth in range(len(stack) - 1, 0, -1):
+                if stack[depth].__class__ is Section:
+                    del stack[depth:]
+                    break
+    return document
+
+# ---------------------------------------------------------------------------
+# 디스크 캐시
+# ---------------------------------------------------------------------------
+
+_fingerprint = None
+
+def ast_fingerprint():
+    """파서(md_to_html_final)와 노드 정의(md_ast) 소스 해시"""
+    global _fingerprint
+    if _fingerprint is None:
+        h = hashlib.sha256(converter.converter_fingerprint().encode())
+        with open(os.path.abspath(__file__), "rb") as f:
+            h.update(f.read())
+        _fingerprint = h.hexdigest()
+    return _fingerprint
+
+def load_document(md_file, use_cache=True):
+    """
+    마크다운 파일의 Document 트리 (내용과 파서가 같으면 캐시에서 읽음)
+    
+    캐시 키는 파일 내용 해시 + 파서 해시 (+ include한 데이터 파일의 경로/크기/수정 시각)이므로
+    include가 없는 문서는 경로가 바뀌어도 재사용된다.
+    """
+    with open(md_file, "rb") as f:
+        md_bytes = f.read()
+    if not use_cache:
+        return build_document(md_bytes.decode("utf-8"), md_file)
+    
+    h = hashlib.sha256(md_bytes + ast_fingerprint().encode())
+    if b"include:" in md_bytes:
+        stamps = converter.include_stamps(md_file, md_bytes.decode("utf-8").split('\n'))
+        h.update(json.dumps(stamps, sort_keys=True).encode())
+    key = h.hexdigest()
+    cache_file = os.path.join(AST_CACHE_DIR, f"{key}.pickle")
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except (FileNotFoundError, pickle.UnpicklingError, EOFError, AttributeError):
+        pass
+    
+    document = build_document(md_bytes.decode("utf-8"), md_file)
+    os.makedirs(AST_CACHE_DIR, exist_ok=True)
+    tmp_file = cache_file + ".tmp"
+    with open(tmp_file, "wb") as f:
+        pickle.dump(document, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_file, cache_file)
+    return document
+
+# ---------------------------------------------------------------------------
+# 렌더러
+# ---------------------------------------------------------------------------
+
+class HtmlRenderer:
+    """다크 테마 HTML 본문 (md_to_html_final.parse_markdown_to_html과 같은 결과)"""
+    
+    separator = '\n    '
+    
+    def render(self, document):
+        parts = []
+        self._slugs = {}
+        for node in document.children:
+            self.block(node, parts)
+        return self.separator.join(parts)
+    
+    def block(self, node, parts):
+        cls = node.__class__
+        if cls is Paragraph:
+            parts.append(f'<p>{self.inline(node.children)}</p>')
+        elif cls is Heading:
+            text = self.inline(node.children)
+            parts.append(f'<h{node.level} id="{heading_slug(text, self._slugs)}">{text}</h{node.level}>')
+        elif cls is CodeBlock:
+            parts.append(f'<pre><code class="language-{node.lang}">{highlight_code(node.lang, node.code)}</code></pre>')
+        elif cls is ListBlock:
+            tag = 'ol' if node.ordered else 'ul'
+            parts.append(f'<{tag}>')
+            for item in node.children:
+                parts.append(f'<li>{self.inline(item.children)}</li>')
+            parts.append(f'</{tag}>')
+        elif cls is CheckItem:
+            parts.append(self.check_item(node))
+        elif cls is Quote:
+            parts.append(self.quote(node))
+        elif cls is Rule:
+            parts.append('<hr>')
+        elif cls is Section:
+            parts.append(f'<div class="{node.kind}">')
+            for child in node.children:
+                self.block(child, parts)
+            parts.append('</div>')
+        elif cls is Table:
+            parts.append('<table>')
+            for row in node.children:
+                parts.append(self.table_row(row, node.aligns))
+            parts.append('</table>')
+        elif cls is TableLinks:
+            parts.append(table_links_html(node.links))
+    
+    def table_row(self, row, aligns):
+        tag = 'th' if row.header else 'td'
+        out = []
+        for cell, align in zip(row.cells, aligns):
+            style = f' style="text-align: {align}"' if align else ''
+            text = escape_html(inline_text(cell)) if row.literal else self.inline(cell)
+            out.append(f'<{tag}{style}>{text}</{tag}>')
+        html = f'<tr>{"".join(out)}</tr>'
+        return f'<thead>{html}</thead>' if row.header else html
+    
+    def check_item(self, node):
+        checked = 'checked' if node.checked else ''
+        return f'<div class="checklist-item"><input type="checkbox" {checked}><label>{self.inline(node.children)}</label></div>'
+    
+    def quote(self, node):
+        if node.kind == 'quote':
+            return f'<blockquote>{self.inline(node.children)}</blockquote>'
+        return f'<div class="{node.kind}"><strong>{self.inline(node.children)}</strong></div>'
+    
+    def link_href(self, href):
+        """링크 주소 (하위 클래스에서 바꿔 쓸 수 있음)"""
+        return href
+    
+    def inline(self, nodes):
+        out = []
+        self._inline(nodes, out)
+        return ''.join(out)
+    
+    def _inline(self, nodes, out):
+        for node in nodes:
+            cls = node.__class__
+            if cls is Text:
+                out.append(node.text)
+            elif cls is Code:
+                out.append(f'<code>{escape_html(node.text)}</code>')
+            elif cls is Strong:
+                out.append('<strong>')
+                self._inline(node.children, out)
+                out.append('</strong>')
+            elif cls is Emphasis:
+                out.append('<em>')
+                self._inline(node.children, out)
+                out.append('</em>')
+            elif cls is Link:
+                out.append(f'<a href="{self.link_href(node.href)}">')
+                self._inline(node.children, out)
+                out.append('</a>')
+
+PRINT_STYLE = """
+    body { font-family: 'Malgun Gothic', 'Noto Sans KR', sans-serif; color: #000; background: #fff;
+           max-width: 800px; margin: 0 auto; padding: 20px; line-height: 1.6; font-size: 11pt; }
+    h1 { text-align: center; border-bottom: 2px solid #000; padding-bottom: 8px; }
+    h2 { border-left: 4px solid #000; padding-left: 10px; page-break-after: avoid; }
+    h3 { page-break-after: avoid; }
+    pre { border: 1px solid #999; padding: 10px; white-space: pre-wrap; page-break-inside: avoid; font-size: 9.5pt; }
+    code { font-family: Consolas, Menlo, monospace; }
+    pre .k, pre .kn, pre .kc, pre .ow { font-weight: bold; }
+    pre .c, pre .c1, pre .cm, pre .ch { font-style: italic; color: #555; }
+    .summary, .checklist, .tip, .warning { border: 1px solid #666; padding: 8px 12px; margin: 10px 0; page-break-inside: avoid; }
+    .warning { border-width: 2px; }
+    .checklist-item { margin: 4px 0; }
+    table { border-collapse: collapse; width: 100%; page-break-inside: auto; font-size: 10pt; }
+    th, td { border: 1px solid #999; padding: 4px 8px; }
+    thead { display: table-header-group; }
+    tr { page-break-inside: avoid; }
+    a[href^="http"]::after { content: " (" attr(href) ")"; font-size: 0.85em; }
+    @page { margin: 18mm 15mm; }
+"""
+
+class PrintHtmlRenderer(HtmlRenderer):
+    """인쇄용 HTML (흰 배경, 체크박스 대신 기호, 링크 주소 표시)"""
+    
+    separator = '\n'
+    
+    def page(self, document):
+        return (
+            '<!DOCTYPE html>\n<html lang="ko">\n<head>\n  <meta charset="UTF-8">\n'
+            f'  <title>{document.title}</title>\n  <style>{PRINT_STYLE}  </style>\n</head>\n<body>\n'
+            f'<h1>{document.title}</h1>\n{self.render(document)}\n</body>\n</html>\n'
+        )
+    
+    def check_item(self, node):
+        mark = '☑' if node.checked else '☐'
+        return f'<div class="checklist-item">{mark} {self.inline(node.children)}</div>'
+    
+    def quote(self, node):
+        if node.kind == 'quote':
+            return f'<blockquote>{self.inline(node.children)}</blockquote>'
+        return f'<div class="{node.kind}">{self.inline(node.children)}</div>'
+
+def inline_text(nodes):
+    """인라인 노드의 순수 텍스트"""
+    out = []
+    for node in nodes:
+        if node.__class__ in (Text, Code):
+            out.append(node.text)
+        else:
+            out.append(inline_text(node.children))
+            if node.__class__ is Link:
+                out.append(f" ({node.href})")
+    return ''.join(out)
+
+def table_row_text(row):
+    """표 한 행의 순수 텍스트 (칸은 탭으로 구분)"""
+    return '\t'.join(inline_text(cell) for cell in row.cells)
+
+def render_text(document):
+    """검색용 순수 텍스트 (블록마다 한 줄, 코드는 원문 그대로)"""
+    lines = [document.title]
+    
+    def walk(nodes):
+        for node in nodes:
+            cls = node.__class__
+            if cls is CodeBlock:
+                lines.append(node.code)
+            elif cls in (Section, ListBlock):
+                walk(node.children)
+            elif cls is Table:
+                lines.extend(table_row_text(row) for row in node.children)
+            elif cls in (Rule, TableLinks):
+                continue
+            else:
+                lines.append(inline_text(node.children))
+    
+    walk(document.children)
+    return '\n'.join(lines) + '\n'
+
+def render_toc(document):
+    """제목 목차 [{'level': n, 'text': 제목, 'id': HTML 앵커 id}]"""
+    toc = []
+    slugs = {}
+    renderer = HtmlRenderer()
+    
+    def walk(nodes):
+        for node in nodes:
+            if node.__class__ is Heading:
+                anchor = heading_slug(renderer.inline(node.children), slugs)
+                toc.append({"level": node.level, "text": inline_text(node.children), "id": anchor})
+            elif node.__class__ is Section:
+                walk(node.children)
+    
+    walk(document.children)
+    return toc
+
+# 출력 형식 -> (파일 이름 접미사, 렌더링 함수)
+# html은 변환기(md_to_html_final)가 관리하는 <문서>.html과 겹치지 않도록 다른 접미사를 쓴다
+# (같은 파일에 쓰면 빌드 매니페스트가 모르는 내용이 되어 다음 증분 빌드가 잘못 건너뜀)
+RENDERERS = {
+    "html": (".ast.html", lambda doc: converter.load_template().render(doc.title, HtmlRenderer().render(doc))),
+    "print": (".print.html", lambda doc: PrintHtmlRenderer().page(doc)),
+    "text": (".txt", render_text),
+    "toc": (".toc.json", lambda doc: json.dumps(render_toc(doc), ensure_ascii=False, indent=1) + "\n"),
+}
+
+def render_outputs(md_file, formats=tuple(RENDERERS), use_cache=True):
+    """
+    문서를 한 번 파싱(또는 캐시에서 로드)해 여러 형식으로 저장
+    
+    Returns:
+        {형식: (출력 파일, 새로 썼는지 여부)}
+    """
+    document = load_document(md_file, use_cache)
+    outputs = {}
+    for name in formats:
+        suffix, render = RENDERERS[name]
+        output_file = md_file[:-3] + suffix
+        outputs[name] = (output_file, write_if_changed(output_file, render(document)))
+    return outputs
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="마크다운을 한 번 파싱해 여러 형식으로 출력")
+    parser.add_argument("dirs", nargs="*", help="변환할 폴더 (생략하면 전체 챕터와 루트 계획 파일)")
+    parser.add_argument("--formats", default=",".join(RENDERERS),
+                        help=f"출력 형식 (쉼표 구분, 기본값: {','.join(RENDERERS)})")
+    parser.add_argument("--no-cache", action="store_true", help="트리 캐시를 사용하지 않음")
+    args = parser.parse_args(argv)
+    
+    formats = [name for name in args.formats.split(",") if name]
+    unknown = [name for name in formats if name not in RENDERERS]
+    if unknown:
+        parser.error(f"알 수 없는 형식: {', '.join(unknown)}")
+    
+    errors = 0
+    for md_file, _ in converter.discover_sources(dirs=args.dirs or None):
+        try:
+            outputs = render_outputs(md_file, formats, not args.no_cache)
+        except Exception as e:
+            errors += 1
+            print(f"[ERROR] 오류 발생 ({converter.manifest_key(md_file)}): {type(e).__name__}: {e}")
+            continue
+        written = [name for name, (_, changed) in outputs.items() if changed]
+        print(f"[OK] {converter.manifest_key(md_file)}: {', '.join(written) if written else '변경 없음'}")
+    return 1 if errors else 0
+
+if __name__ == "__main__":
+    # 캐시된 트리는 md_ast 모듈의 노드 클래스로 저장되므로 스크립트로 실행해도 같은 모듈을 사용
+    import md_ast
+    sys.exit(md_ast.main())
@@ -0,0 +1,290 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+전체 챕터를 한 권의 학습 교재(HTML + PDF)로 묶는 스크립트
+
+챕터 폴더 순서(01_ -> 07_)대로 문서를 인쇄용 HTML로 이어 붙이고, 앞에 표지와 목차를
+만든다. 제목 id는 챕터 번호를 앞에 붙여 겹치지 않게 하고, 챕터 사이의 상대 링크는
+교재 안의 앵커로 바꾼다.
+
+PDF는 브라우저 하나로 렌더링한다 (playwright는 렌더링이 필요할 때만 로드).
+교재 HTML과 PDF 옵션이 같으면 .build_cache/book의 PDF를 그대로 쓰므로 브라우저를
+실행하지 않는다. 문서 파싱은 md_ast의 트리 캐시를 쓰므로 바뀐 챕터만 다시 파싱한다.
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import hashlib
+import argparse
+from pathlib import Path
+
+import md_ast
+import md_to_html_final as converter
+from md_to_html_final import escape_html, heading_slug
+
+BOOK_DIR = os.path.join(converter.BASE_DIR, "book")
+BOOK_CACHE_DIR = os.path.join(converter.BUILD_DIR, "book")
+DEFAULT_TITLE = "AICE Associate 학습 교재"
+DEFAULT_OUTPUT = os.path.join(BOOK_DIR, "aice_book.pdf")
+# PDF 렌더링 방식을 바꾸면 올림 (이전 캐시 무효화)
+BOOK_CACHE_VERSION = 1
+PAPER_FORMATS = ("A4", "A5", "B5", "Letter")
+
+BOOK_STYLE = """
+    .cover { height: 90vh; display: flex; flex-direction: column; justify-content: center; text-align: center; }
+    .cover h1 { border: none; font-size: 28pt; }
+    .cover p { color: #444; }
+    .toc { page-break-before: always; }
+    .toc ol { list-style: none; padding-left: 0; }
+    .toc ol ol { padding-left: 1.5em; margin-bottom: 6px; }
+    .toc a { color: #000; text-decoration: none; }
+    .toc > ol > li > a { font-weight: bold; }
+    .chapter { page-break-before: always; }
+    .toc a::after, .chapter a[href^="#"]::after { content: none; }
+"""
+
+# 쪽 번호 (Chromium 인쇄 머리글/바닥글 템플릿)
+_FOOTER_TEMPLATE = ('<div style="width: 100%; font-size: 8pt; color: #666; text-align: center;">'
+                    '<span class="pageNumber"></span> / <span class="totalPages"></span></div>')
+
+class BookRenderer(md_ast.PrintHtmlRenderer):
+    """
+    교재용 챕터 HTML
+    
+    제목 id 앞에 챕터 id를 붙이고(prefix), 교재에 들어 있는 문서로 가는 상대 링크는
+    교재 안의 앵커로 바꾼다 (chapters: 저장소 기준 md 경로 -> 챕터 id).
+    """
+    
+    def __init__(self, source_key, prefix, chapters):
+        self.source_key = source_key
+        self.prefix = prefix
+        self.chapters = chapters
+    
+    def block(self, node, parts):
+        if node.__class__ is md_ast.Heading:
+            text = self.inline(node.children)
+            anchor = heading_slug(text, self._slugs)
+            parts.append(f'<h{node.level} id="{self.prefix}-{anchor}">{text}</h{node.level}>')
+        else:
+            super().block(node, parts)
+    
+    def link_href(self, href):
+        resolved = converter.resolve_link(self.source_key, href)
+        if resolved is None:
+            return href
+        target, anchor = resolved
+        prefix = self.chapters.get(target)
+        if prefix is None:
+            return href
+        return f"#{prefix}-{anchor}" if anchor else f"#{prefix}"
+
+def book_sources(pairs=None, plans=False):
+    """교재에 넣을 md 파일 (챕터 폴더 순서, plans=True면 루트 계획 파일을 앞에 포함)"""
+    if pairs is None:
+        pairs = converter.discover_sources()
+    return [md_file for md_file, _ in pairs
+            if plans or os.path.dirname(os.path.abspath(md_file)) != converter.BASE_DIR]
+
+def build_book_html(md_files, title=DEFAULT_TITLE, toc_depth=2):
+    """
+    교재 HTML 생성
+    
+    Args:
+        md_files: 교재에 넣을 md 파일 (이 순서대로 챕터가 됨)
+        title: 표지와 문서 제목
+        toc_depth: 목차에 넣을 제목 수준 (2면 ##까지, 3이면 ###까지)
+    
+    Returns:
+        (HTML 문자열, [(md 파일, 챕터 id, 제목)])
+    """
+    keys = [converter.manifest_key(md_file) for md_file in md_files]
+    chapters = {key: f"ch{number:02d}" for number, key in enumerate(keys, 1)}
+    
+    toc = []
+    bodies = []
+    contents = []
+    for md_file, key in zip(md_files, keys):
+        prefix = chapters[key]
+        document = md_ast.load_document(md_file)
+        contents.append((md_file, prefix, document.title))
+        
+        items = []
+        for entry in md_ast.render_toc(document):
+            if entry["level"] <= toc_depth:
+                items.append(f'<li><a href="#{prefix}-{entry["id"]}">{escape_html(entry["text"])}</a></li>')
+        sub = f'\n<ol>\n{chr(10).join(items)}\n</ol>' if items else ''
+        toc.append(f'<li><a href="#{prefix}">{escape_html(document.title)}</a>{sub}</li>')
+        
+        body = BookRenderer(key, prefix, chapters).render(document)
+        bodies.append(f'<section class="chapter" id="{prefix}">\n<h1>{escape_html(document.title)}</h1>\n{body}\n</section>')
+    
+    html = (
+        '<!DOCTYPE html>\n<html lang="ko">\n<head>\n  <meta charset="UTF-8">\n'
+        f'  <title>{escape_html(title)}</title>\n  <style>{md_ast.PRINT_STYLE}{BOOK_STYLE}  </style>\n</head>\n<body>\n'
+        f'<div class="cover">\n<h1>{escape_html(title)}</h1>\n<p>챕터 {len(md_files)}개</p>\n</div>\n'
+        f'<nav class="toc">\n<h2>목차</h2>\n<ol>\n{chr(10).join(toc)}\n</ol>\n</nav>\n'
+        + '\n'.join(bodies) + '\n</body>\n</html>\n'
+    )
+    return html, contents
+
+# ---------------------------------------------------------------------------
+# PDF 렌더링
+# ---------------------------------------------------------------------------
+
+def pdf_options(paper="A4", margin="18mm", page_numbers=True, timeout=60000):
+    """PDF 렌더링 옵션 검증 후 옵션 딕셔너리 반환"""
+    if paper not in PAPER_FORMATS:
+        raise ValueError(f"paper는 {PAPER_FORMATS} 중 하나여야 합니다: {paper}")
+    return {"paper": paper, "margin": margin, "page_numbers": page_numbers, "timeout": timeout}
+
+def pdf_cache_key(html_path, options):
+    """교재 HTML 내용과 PDF 옵션으로 만든 캐시 키"""
+    h = hashlib.sha256(f"v{BOOK_CACHE_VERSION}\n".encode())
+    h.update(json.dumps({k: options[k] for k in ("paper", "margin", "page_numbers")}, sort_keys=True).encode())
+    h.update(Path(html_path).read_bytes())
+    return h.hexdigest()
+
+def render_pdfs(pairs, options, cache=True):
+    """
+    (교재 HTML, 출력 PDF) 목록을 브라우저 하나로 렌더링
+    
+    캐시에 있는 PDF는 복사만 하고, 캐시에 없는 것이 있을 때만 브라우저를 실행한다.
+    
+    Returns:
+        {'done': [출력 PDF], 'cached': [출력 PDF], 'errors': {HTML 파일: 메시지},
+         'renders': {HTML 파일: 렌더링 시간(초)}, 'elapsed': 초}
+    """
+    started = time.perf_counter()
+    result = {"done": [], "cached": [], "errors": {}, "renders": {}, "elapsed": 0.0}
+    pending = []
+    for html_path, pdf_path in pairs:
+        html_path, pdf_path = Path(html_path).resolve(), Path(pdf_path)
+        cached_file = Path(BOOK_CACHE_DIR) / f"{pdf_cache_key(html_path, options)}.pdf"
+        if cache and cached_file.exists():
+            converter.write_if_changed(pdf_path, cached_file.read_bytes())
+            result["cached"].append(str(pdf_path))
+        else:
+            pending.append((html_path, pdf_path, cached_file))
+    
+    if pending:
+        # 캐시에 없는 교재가 있을 때만 playwright 로드
+        from md_publish import load_image_module
+        async_playwright = load_image_module().require_playwright()
+        asyncio.run(_render_pdf_batch(async_playwright, pending, options, result))
+    
+    result["elapsed"] = time.perf_counter() - started
+    return result
+
+async def _render_pdf_batch(async_playwright, jobs, options, result):
+    async with async_playwright() as p:
+        # 브라우저와 페이지는 한 번만 만들어 모든 교재에 재사용
+        browser = await p.chromium.launch(headless=True)
+        try:
+            page = await browser.new_page()
+            page.set_default_timeout(options["timeout"])
+            await page.emulate_media(media="print")
+            for html_path, pdf_path, cached_file in jobs:
+                started = time.perf_counter()
+                try:
+                    await page.goto(html_path.as_uri(), wait_until="load")
+                    await page.evaluate("document.fonts.ready.then(() => true)")
+                    data = await _print_pdf(page, options)
+                    converter.write_if_changed(pdf_path, data)
+                    os.makedirs(cached_file.parent, exist_ok=True)
+                    tmp_file = cached_file.with_name(cached_file.name + ".tmp")
+                    tmp_file.write_bytes(data)
+                    os.replace(tmp_file, cached_file)
+                except Exception as e:
+                    result["errors"][str(html_path)] = f"{type(e).__name__}: {e}"
+                else:
+                    result["done"].append(str(pdf_path))
+                    result["renders"][str(html_path)] = time.perf_counter() - started
+        finally:
+            await browser.close()
+
+async def _print_pdf(page, options):
+    margin = options["margin"]
+    kwargs = {
+        "format": options["paper"],
+        "print_background": True,
+        "margin": {"top": margin, "bottom": margin, "left": margin, "right": margin},
+    }
+    if options["page_numbers"]:
+        kwargs.update(display_header_footer=True, header_template="<div></div>", footer_template=_FOOTER_TEMPLATE)
+    try:
+        # outline: 제목으로 PDF 책갈피 생성 (지원하지 않는 playwright 버전이면 생략)
+        return await page.pdf(outline=True, **kwargs)
+    except TypeError:
+        return await page.pdf(**kwargs)
+
+def build_book(output=DEFAULT_OUTPUT, pairs=None, title=DEFAULT_TITLE, plans=False, toc_depth=2,
+               options=None, html_only=False, cache=True):
+    """
+    교재 HTML을 쓰고 PDF로 렌더링
+    
+    Args:
+        output: 출력 PDF 경로 (교재 HTML은 같은 이름의 .html)
+        pairs: (md 파일, html 파일) 목록 (None이면 전체 학습 자료)
+        options: pdf_options() 결과 (None이면 기본값)
+        html_only: True면 교재 HTML만 쓰고 PDF는 만들지 않음
+        cache: False면 PDF 캐시를 무시하고 다시 렌더링
+    
+    Returns:
+        {'html': 교재 HTML 경로, 'chapters': [(md 파일, 챕터 id, 제목)], 'html_written': 새로 썼는지,
+         'pdf': render_pdfs 결과 또는 None}
+    """
+    md_files = book_sources(pairs, plans)
+    html, contents = build_book_html(md_files, title, toc_depth)
+    html_path = os.path.splitext(output)[0] + ".html"
+    os.makedirs(os.path.dirname(os.path.abspath(html_path)), exist_ok=True)
+    result = {"html": html_path, "chapters": contents, "html_written": converter.write_if_changed(html_path, html),
+              "pdf": None}
+    if not html_only:
+        result["pdf"] = render_pdfs([(html_path, output)], options or pdf_options(), cache)
+    return result
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="전체 챕터를 목차가 있는 학습 교재 PDF 하나로 출력")
+    parser.add_argument("dirs", nargs="*", help="교재에 넣을 챕터 폴더 (생략하면 전체 챕터)")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT,
+                        help=f"출력 PDF (기본값: {os.path.relpath(DEFAULT_OUTPUT, converter.BASE_DIR)})")
+    parser.add_argument("--title", default=DEFAULT_TITLE, help=f"교재 제목 (기본값: {DEFAULT_TITLE})")
+    parser.add_argument("--plans", action="store_true", help="루트 계획 파일(00_마스터_플랜.md 등)을 앞에 포함")
+    parser.add_argument("--toc-depth", type=int, choices=(1, 2, 3), default=2,
+                        help="목차에 넣을 제목 수준 (1: 챕터만, 2: ##까지, 3: ###까지, 기본값: 2)")
+    parser.add_argument("--paper", choices=PAPER_FORMATS, default="A4", help="용지 크기 (기본값: A4)")
+    parser.add_argument("--margin", default="18mm", help="여백 (기본값: 18mm)")
+    parser.add_argument("--no-page-numbers", action="store_true", help="바닥글 쪽 번호를 넣지 않음")
+    parser.add_argument("--html-only", action="store_true", help="교재 HTML만 만들고 PDF는 렌더링하지 않음")
+    parser.add_argument("--no-cache", action="store_true", help="PDF 캐시를 무시하고 다시 렌더링")
+    args = parser.parse_args(argv)
+    
+    pairs = converter.discover_sources(dirs=args.dirs or None)
+    options = pdf_options(args.paper, args.margin, not args.no_page_numbers)
+    try:
+        result = build_book(args.output, pairs, args.title, args.plans, args.toc_depth,
+                            options, args.html_only, not args.no_cache)
+    except RuntimeError as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 2
+    
+    for md_file, prefix, title in result["chapters"]:
+        print(f"  {prefix}  {title} ({converter.manifest_key(md_file)})")
+    state = "새로 씀" if result["html_written"] else "변경 없음"
+    print(f"\n[OK] 교재 HTML: {os.path.relpath(result['html'], converter.BASE_DIR)} "
+          f"(챕터 {len(result['chapters'])}개, {state})")
+    pdf = result["pdf"]
+    if pdf is None:
+        return 0
+    for html_file, message in pdf["errors"].items():
+        print(f"[ERROR] PDF 렌더링 실패 ({html_file}): {message}")
+    for path in pdf["done"]:
+        print(f"[OK] PDF 렌더링: {path} ({pdf['elapsed']:.2f}초)")
+    for path in pdf["cached"]:
+        print(f"[--] PDF 캐시 사용: {path}")
+    return 1 if pdf["errors"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
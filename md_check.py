@@ -0,0 +1,312 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+학습 자료의 python 코드 블록이 실제로 실행되는지 확인하는 스크립트
+
+문서마다 별도 파이썬 프로세스(python -I, 임시 폴더, 표준 입력 없음) 하나에서 코드 블록을
+순서대로 같은 이름 공간에 실행한다 (학습자가 앞 블록에서 만든 변수를 이어서 쓰는 것과 같음).
+블록마다 제한 시간이 있고, 실패하면 마크다운 파일과 줄 번호를 알려 준다. 성공/오류 결과는
+(그 블록까지의 코드 전체, 파이썬/설치 패키지 버전, 제한 시간) 해시로 .build_cache/snippets에
+캐시하므로 바뀐 블록이 없는 문서는 다시 실행하지 않는다. 시간 초과와 건너뜀은 실행 환경에 따라
+달라질 수 있어 캐시하지 않는다.
+
+설치되지 않은 모듈을 import하거나 input()으로 입력을 기다리는 코드 블록, 네트워크에 접속하지
+못해 실패한(또는 접속하다 시간 초과된) 코드 블록은 실패가 아니라 '건너뜀'으로 분류한다.
+앞 블록이 실패하거나 건너뛰어진 뒤에 실패한 블록도 앞 블록의 결과가 없어서일 수 있으므로
+건너뜀으로 분류한다 (문서마다 처음 실패한 블록만 오류로 보고).
+"""
+import os
+import re
+import sys
+import json
+import time
+import hashlib
+import argparse
+import subprocess
+import tempfile
+
+import md_to_html_final as converter
+
+SNIPPET_CACHE_DIR = os.path.join(converter.BUILD_DIR, "snippets")
+# 실행 방식이나 결과 형식을 바꾸면 올림 (이전 캐시 무효화)
+CHECK_VERSION = 3
+PYTHON_LANGS = ("python", "py", "python3")
+DEFAULT_TIMEOUT = 10.0
+
+_BLOCK_FILE = "block_{:03d}.py"
+_RUNNER_NAME = "md_check_runner.py"
+_RESULTS_NAME = "results.jsonl"
+# faulthandler가 시간 초과 때 출력하는 스택 (가장 최근 호출이 먼저)
+_TIMEOUT_FRAME = re.compile(r'File ".*block_(\d{3})\.py", line (\d+)')
+# 네트워크 접속 실패 (urllib, socket, requests/urllib3 예외의 마지막 줄)
+_NETWORK_ERROR = re.compile(
+    r'^(?:[\w.]+\.)?(?:URLError|HTTPError|gaierror|herror|timeout|ConnectionError|Connection\w+Error'
+    r'|TimeoutError|RemoteDisconnected|SSLError|MaxRetryError|NewConnectionError|ConnectTimeout|ReadTimeout)\b')
+# 네트워크를 쓰는 코드 (접속하다 시간 초과되면 건너뜀으로 분류)
+_NETWORK_CODE = re.compile(r'\b(?:urllib|urlopen|requests|http\.client|socket|httpx|aiohttp)\b')
+# 캐시하는 결과 (시간 초과, 건너뜀은 설치 패키지 외의 환경에 따라 달라질 수 있음)
+CACHED_STATUSES = ("ok", "error")
+
+# 자식 프로세스에서 블록 파일을 순서대로 실행하고 블록마다 결과 한 줄을 기록하는 스크립트
+# (없는 모듈 확인도 코드 블록과 같은 -I 실행 환경에서 함)
+_RUNNER = '''
+import sys, json, time, builtins, traceback, faulthandler
+from importlib.util import find_spec
+
+def run(count, timeout):
+    namespace = {"__name__": "__main__", "__builtins__": builtins}
+    with open(%(results)r, "w", encoding="utf-8") as results:
+        for index in range(count):
+            path = %(block)r.format(index)
+            with open(path, "r", encoding="utf-8") as f:
+                source = f.read()
+            record = {"ok": True, "line": None, "message": "", "missing": False}
+            faulthandler.dump_traceback_later(timeout, exit=True)
+            started = time.perf_counter()
+            try:
+                exec(compile(source, path, "exec"), namespace)
+            except SystemExit as e:
+                if e.code not in (None, 0):
+                    record.update(ok=False, message=f"SystemExit: {e.code}")
+            except BaseException as e:
+                frames = [frame.lineno for frame in traceback.extract_tb(e.__traceback__) if frame.filename == path]
+                line = frames[-1] if frames else None
+                if isinstance(e, SyntaxError) and e.filename == path:
+                    line = e.lineno
+                name = getattr(e, "name", None) if isinstance(e, ModuleNotFoundError) else None
+                record.update(ok=False, line=line, message=traceback.format_exception_only(type(e), e)[-1].strip(),
+                              missing=bool(name) and find_spec(name.split(".")[0]) is None)
+            finally:
+                faulthandler.cancel_dump_traceback_later()
+            record["seconds"] = time.perf_counter() - started
+            results.write(json.dumps(record) + "\\n")
+            results.flush()
+
+run(int(sys.argv[1]), float(sys.argv[2]))
+''' % {"results": _RESULTS_NAME, "block": _BLOCK_FILE}
+
+def python_blocks(md_file):
+    """마크다운 파일의 python 코드 블록 -> [(코드 첫 줄 번호, 코드)]"""
+    with open(md_file, "r", encoding="utf-8") as f:
+        return [(line, code) for line, lang, code in converter.iter_code_blocks(f)
+                if lang.lower() in PYTHON_LANGS and code.strip()]
+
+_environment = None
+
+def environment_fingerprint():
+    """실행 결과를 결정하는 환경 해시 (파이썬 버전 + 설치된 패키지 버전)"""
+    global _environment
+    if _environment is None:
+        from importlib import metadata
+        packages = sorted(f"{dist.metadata['Name']}=={dist.version}" for dist in metadata.distributions())
+        h = hashlib.sha256(f"{sys.executable}\0{sys.version}\0".encode())
+        h.update("\n".join(packages).encode())
+        _environment = h.hexdigest()
+    return _environment
+
+def snippet_keys(codes, timeout):
+    """
+    문서의 코드 블록별 캐시 키
+    
+    블록의 결과는 앞 블록들이 만든 이름 공간에 달려 있으므로 각 키는 그 블록과
+    앞의 모든 블록의 코드를 합친 해시다 (앞 블록이 바뀌면 뒤 블록도 모두 다시 실행).
+    """
+    h = hashlib.sha256(f"{CHECK_VERSION}\0{environment_fingerprint()}\0{timeout}\0".encode("utf-8"))
+    keys = []
+    for code in codes:
+        h.update(f"{len(code)}\0{code}\0".encode("utf-8"))
+        keys.append(h.copy().hexdigest())
+    return keys
+
+def _classify(code, record):
+    """자식 프로세스의 블록 결과 -> 'ok'|'error'|'skipped'"""
+    message = record["message"]
+    if record["ok"]:
+        return "ok"
+    if record["missing"]:
+        return "skipped"
+    if message.startswith("EOFError") and "input(" in code:
+        return "skipped"
+    if _NETWORK_ERROR.match(message):
+        return "skipped"
+    return "error"
+
+def run_document(blocks, timeout=DEFAULT_TIMEOUT):
+    """
+    문서의 코드 블록을 새 파이썬 프로세스 하나에서 순서대로 실행 (캐시 없음)
+    
+    -I(격리 모드)로 실행하므로 PYTHON* 환경 변수, 사용자 site-packages, 현재 폴더의
+    모듈이 코드 블록에 영향을 주지 않는다 (인코딩과 .pyc 설정은 -X utf8, -B로 대신함).
+    블록 하나가 timeout을 넘으면 프로세스를 끝내고 남은 블록은 건너뜀으로 돌려준다.
+    
+    Args:
+        blocks: [(코드 첫 줄 번호, 코드)] (줄 번호는 건너뜀 메시지에만 씀)
+    
+    Returns:
+        블록별 {'status': 'ok'|'error'|'timeout'|'skipped', 'line': 코드 안 줄 번호 또는 None,
+                'message': 오류 마지막 줄, 'seconds': 실행 시간}
+    """
+    env = dict(os.environ, MPLBACKEND="Agg")
+    # 코드가 만드는 파일이 저장소에 남지 않도록 임시 폴더에서 실행
+    with tempfile.TemporaryDirectory(prefix="md_check_") as workdir:
+        for index, (_, code) in enumerate(blocks):
+            with open(os.path.join(workdir, _BLOCK_FILE.format(index)), "w", encoding="utf-8") as f:
+                f.write(code)
+        with open(os.path.join(workdir, _RUNNER_NAME), "w", encoding="utf-8") as f:
+            f.write(_RUNNER)
+        command = [sys.executable, "-I", "-B", "-X", "utf8", _RUNNER_NAME, str(len(blocks)), str(timeout)]
+        started = time.perf_counter()
+        try:
+            # 블록별 제한 시간은 자식 프로세스의 faulthandler가 지키고, 이것은 그마저 멈췄을 때를 위한 것
+            completed = subprocess.run(command, cwd=workdir, env=env, stdin=subprocess.DEVNULL,
+                                       stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                       timeout=timeout * len(blocks) + 30)
+            stderr = completed.stderr.decode("utf-8", "replace")
+            returncode = completed.returncode
+        except subprocess.TimeoutExpired as e:
+            stderr = f"Timeout\n{(e.stderr or b'').decode('utf-8', 'replace')}"
+            returncode = None
+        elapsed = time.perf_counter() - started
+        try:
+            with open(os.path.join(workdir, _RESULTS_NAME), "r", encoding="utf-8") as f:
+                records = [json.loads(line) for line in f]
+        except FileNotFoundError:
+            records = []
+    
+    outcomes = []
+    failed_at = None
+    for (start, code), record in zip(blocks, records):
+        status = _classify(code, record)
+        if status == "error" and failed_at is not None:
+            status = "skipped"
+            record["message"] = f"앞 코드 블록({failed_at}번째 줄)이 실패해서일 수 있음: {record['message']}"
+        if status != "ok":
+            failed_at = start + record["line"] - 1 if record["line"] else start
+        outcomes.append({"status": status, "line": record["line"], "message": record["message"],
+                         "seconds": record["seconds"]})
+    
+    if len(outcomes) < len(blocks):
+        # 기록이 끊긴 블록: 시간 초과(faulthandler) 또는 프로세스 비정상 종료
+        index = len(outcomes)
+        start, code = blocks[index]
+        seconds = max(0.0, elapsed - sum(outcome["seconds"] for outcome in outcomes))
+        lines = [line for line in stderr.splitlines() if line.strip()]
+        if lines and lines[0].startswith("Timeout"):
+            network = _NETWORK_CODE.search(code) is not None
+            frames = [int(line) for number, line in _TIMEOUT_FRAME.findall(stderr) if int(number) == index]
+            outcomes.append({"status": "skipped" if network else "timeout", "line": frames[0] if frames else None,
+                             "message": f"{timeout:g}초 안에 끝나지 않음{' (네트워크 대기)' if network else ''}",
+                             "seconds": seconds})
+        else:
+            message = lines[-1].strip() if lines else f"종료 코드 {returncode}"
+            outcomes.append({"status": "error", "line": None, "message": message, "seconds": seconds})
+        for _ in blocks[index + 1:]:
+            outcomes.append({"status": "skipped", "line": None, "seconds": 0.0,
+                             "message": f"앞 코드 블록({start}번째 줄)이 끝나지 않아 실행하지 않음"})
+    return outcomes
+
+def _load_cached(key):
+    try:
+        with open(os.path.join(SNIPPET_CACHE_DIR, f"{key}.json"), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+def _save_cached(key, outcome):
+    cache_file = os.path.join(SNIPPET_CACHE_DIR, f"{key}.json")
+    os.makedirs(SNIPPET_CACHE_DIR, exist_ok=True)
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(outcome, f, ensure_ascii=False)
+    os.replace(tmp_file, cache_file)
+
+def check_document(blocks, timeout=DEFAULT_TIMEOUT, use_cache=True):
+    """
+    캐시를 참고해 문서 하나의 코드 블록 실행 (성공/오류 결과만 캐시에 저장)
+    
+    캐시에 없는 블록이 있으면 문서 처음부터 그 블록까지 다시 실행한다 (앞 블록의 이름 공간이 필요함).
+    
+    Returns:
+        블록별 (run_document 결과, 캐시 사용 여부)
+    """
+    keys = snippet_keys([code for _, code in blocks], timeout)
+    outcomes = [_load_cached(key) if use_cache else None for key in keys]
+    missing = [index for index, outcome in enumerate(outcomes) if outcome is None]
+    if not missing:
+        return [(outcome, True) for outcome in outcomes]
+    
+    ran = run_document(blocks[:missing[-1] + 1], timeout)
+    for key, outcome in zip(keys, ran):
+        if outcome["status"] in CACHED_STATUSES:
+            _save_cached(key, outcome)
+    return [(outcome, False) for outcome in ran] + [(outcome, True) for outcome in outcomes[len(ran):]]
+
+def check_code_blocks(md_files, jobs=1, timeout=DEFAULT_TIMEOUT, use_cache=True):
+    """
+    마크다운 파일들의 python 코드 블록을 문서별로 병렬 실행
+    
+    Args:
+        md_files: 마크다운 파일 목록
+        jobs: 동시에 실행할 파이썬 프로세스 수 (문서 하나가 프로세스 하나)
+        timeout: 코드 블록별 제한 시간 (초)
+        use_cache: False면 캐시를 무시하고 모두 다시 실행
+    
+    Returns:
+        {'blocks': [(md 파일, 마크다운 줄 번호, 결과)], 'ran': 실행한 코드 수, 'cached': 캐시 사용 수}
+        결과의 'line'은 오류가 난 마크다운 줄 번호로 바뀌어 있다 (알 수 없으면 코드 블록 첫 줄).
+    """
+    documents = [(md_file, blocks) for md_file in md_files for blocks in [python_blocks(md_file)] if blocks]
+    check = lambda blocks: check_document(blocks, timeout, use_cache)
+    if jobs <= 1 or len(documents) <= 1:
+        checked = [check(blocks) for _, blocks in documents]
+    else:
+        # 작업 단위가 하위 프로세스를 기다리는 일이라 스레드로 충분함
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(jobs, len(documents))) as executor:
+            checked = list(executor.map(check, [blocks for _, blocks in documents]))
+    
+    result = {"blocks": [], "ran": 0, "cached": 0}
+    for (md_file, blocks), outcomes in zip(documents, checked):
+        for (start, _), (outcome, cached) in zip(blocks, outcomes):
+            result["cached" if cached else "ran"] += 1
+            outcome = dict(outcome)
+            outcome["line"] = start + outcome["line"] - 1 if outcome["line"] else start
+            result["blocks"].append((md_file, outcome["line"], outcome))
+    return result
+
+def failures(result):
+    """실패(오류 + 시간 초과)한 코드 블록만"""
+    return [block for block in result["blocks"] if block[2]["status"] in ("error", "timeout")]
+
+def format_block(md_file, line, outcome):
+    """'파일:줄: 메시지' 형식 (편집기에서 바로 이동할 수 있게)"""
+    return f"{converter.manifest_key(md_file)}:{line}: [{outcome['status']}] {outcome['message']}"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="학습 자료의 python 코드 블록 실행 확인")
+    parser.add_argument("dirs", nargs="*", help="확인할 폴더 (생략하면 전체 챕터와 루트 계획 파일)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="동시에 실행할 파이썬 프로세스 수 (기본값: CPU 수)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help=f"코드 블록별 제한 시간(초) (기본값: {DEFAULT_TIMEOUT:g})")
+    parser.add_argument("--no-cache", action="store_true", help="캐시를 무시하고 모두 다시 실행")
+    parser.add_argument("-v", "--verbose", action="store_true", help="건너뛴 코드 블록도 출력")
+    args = parser.parse_args(argv)
+    
+    md_files = [md_file for md_file, _ in converter.discover_sources(dirs=args.dirs or None)]
+    started = time.perf_counter()
+    result = check_code_blocks(md_files, jobs=args.jobs, timeout=args.timeout, use_cache=not args.no_cache)
+    elapsed = time.perf_counter() - started
+    
+    counts = {}
+    for md_file, line, outcome in result["blocks"]:
+        counts[outcome["status"]] = counts.get(outcome["status"], 0) + 1
+        if outcome["status"] in ("error", "timeout") or (args.verbose and outcome["status"] == "skipped"):
+            print(format_block(md_file, line, outcome))
+    print(f"\n코드 블록 {len(result['blocks'])}개: 성공 {counts.get('ok', 0)}개, 오류 {counts.get('error', 0)}개, "
+          f"시간 초과 {counts.get('timeout', 0)}개, 건너뜀 {counts.get('skipped', 0)}개 "
+          f"(실행 {result['ran']}개, 캐시 {result['cached']}개, {elapsed:.2f}초)")
+    return 1 if failures(result) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
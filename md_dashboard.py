@@ -0,0 +1,260 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+진도표(progress_dashboard.html) 데이터를 미리 만드는 스크립트
+
+32일_학습일정.md의 Phase/Day 일정과 체크리스트, 챕터 폴더의 학습 자료 목록을 읽어
+작업(task) 목록으로 정리하고 dashboard_data.js에 저장한다. 진도표는 이 파일을
+<script>로 읽으므로 file://로 열어도 동작하고, 일정을 HTML에 직접 적어 둘 필요가 없다.
+
+작업 id는 내용에서 만들어 일정 순서가 바뀌어도 저장된 진도가 유지된다.
+(Day는 'd<번호>', 체크리스트는 본문 해시, 챕터는 저장소 기준 md 경로)
+
+dashboard_data.js는 변환된 챕터 HTML처럼 저장소에 함께 커밋한다 (받자마자 진도표를 열 수 있게).
+일정이나 챕터를 고치면 md_to_html_final.py(aice.py convert)가 다시 만들고, 내용이 같으면 쓰지 않는다.
+"""
+import os
+import re
+import sys
+import json
+import hashlib
+import argparse
+from datetime import date, timedelta
+
+import md_ast
+import md_to_html_final as converter
+
+SCHEDULE_PATH = os.path.join(converter.BASE_DIR, "32일_학습일정.md")
+DASHBOARD_DATA_PATH = os.path.join(converter.BASE_DIR, "dashboard_data.js")
+# 데이터 형식을 바꾸면 올림 (progress_dashboard.html도 같이 수정)
+DASHBOARD_VERSION = 1
+# progress_dashboard.html이 읽는 전역 변수 이름
+DATA_VARIABLE = "AICE_DASHBOARD"
+
+_DATE_FIELD = re.compile(r'^\*\*(시작일|목표일)\*\*:\s*(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일')
+_PHASE = re.compile(r'^###\s+Phase\s+(\d+):\s*(.+?)\s*\(Day\s+(\d+)-(\d+)\)\s*$')
+_PHASE_CHECKLIST = re.compile(r'^###\s+Phase\s+(\d+)\s+체크리스트\s*$')
+_DAY = re.compile(r'^####\s+Day\s+(\d+)(?:-(\d+))?\s*\((\d{1,2})/(\d{1,2})')
+_FIELD = re.compile(r'^-\s+\*\*(.+?)\*\*:\s*(.*)$')
+_CHECK = re.compile(r'^\s*-\s+\[[ xX]\]\s+(.+)$')
+_HOURS = re.compile(r'(\d+(?:\.\d+)?)\s*시간')
+
+def text_id(prefix, text):
+    """체크리스트 항목 id (본문 해시라 항목 순서가 바뀌어도 유지됨)"""
+    return f"{prefix}.{hashlib.sha1(text.encode('utf-8')).hexdigest()[:8]}"
+
+def parse_hours(value):
+    """'2시간', '각 3시간' -> 2.0, 3.0 (없으면 0)"""
+    match = _HOURS.search(value)
+    return float(match.group(1)) if match else 0.0
+
+def parse_schedule(lines):
+    """
+    학습 일정 마크다운 파싱
+    
+    '#### Day a-b (M/D-M/D)'처럼 여러 날을 묶은 항목은 하루씩 펼치고,
+    '각 N시간'은 하루 N시간으로 본다. 날짜의 연도는 시작일 기준으로 정한다.
+    
+    Returns:
+        {'title', 'start', 'goal', 'phases': [{'id', 'title', 'days': [a, b], 'day_tasks': [...],
+         'checklist': [...]}]}
+        Day 작업: {'id', 'day', 'date', 'goal', 'hours', 'fields': {이름: 값}, 'checklist': [본문]}
+    """
+    schedule = {"title": converter.extract_title(lines), "start": None, "goal": None, "phases": []}
+    phases = {}
+    phase = None
+    entry = None
+    checklist = None
+    
+    for raw in lines:
+        line = raw.rstrip()
+        stripped = line.lstrip()
+        match = _DATE_FIELD.match(stripped)
+        if match:
+            key = "start" if match.group(1) == "시작일" else "goal"
+            schedule[key] = date(*map(int, match.group(2, 3, 4))).isoformat()
+            continue
+        
+        if line.startswith("#"):
+            entry = checklist = None
+            match = _PHASE.match(line)
+            if match:
+                number = int(match.group(1))
+                phase = {"id": f"p{number}", "title": match.group(2),
+                         "days": [int(match.group(3)), int(match.group(4))], "entries": [], "checklist": []}
+                phases[number] = phase
+                schedule["phases"].append(phase)
+                continue
+            match = _PHASE_CHECKLIST.match(line)
+            if match:
+                # '전체 체크리스트' 섹션의 Phase별 목록은 해당 Phase에 붙임
+                target = phases.get(int(match.group(1)))
+                checklist = target["checklist"] if target is not None else None
+                continue
+            match = _DAY.match(line)
+            if match and phase is not None:
+                first = int(match.group(1))
+                last = int(match.group(2) or first)
+                entry = {"first": first, "last": last, "month": int(match.group(3)),
+                         "day": int(match.group(4)), "fields": {}, "checklist": []}
+                phase["entries"].append(entry)
+            elif line.startswith("## "):
+                phase = None
+            continue
+        
+        if entry is not None:
+            match = _FIELD.match(line)
+            if match:
+                if match.group(1) == "체크리스트":
+                    checklist = entry["checklist"]
+                else:
+                    entry["fields"][match.group(1)] = match.group(2).strip()
+                    checklist = None
+                continue
+        if checklist is not None:
+            match = _CHECK.match(line)
+            if match:
+                checklist.append(match.group(1).strip())
+    
+    start = date.fromisoformat(schedule["start"]) if schedule["start"] else None
+    for phase in schedule["phases"]:
+        phase["day_tasks"] = []
+        for entry in phase.pop("entries"):
+            year = start.year if start is not None else date.today().year
+            if start is not None and entry["month"] < start.month:
+                year += 1
+            first_date = date(year, entry["month"], entry["day"])
+            hours = parse_hours(entry["fields"].get("소요시간", ""))
+            for number in range(entry["first"], entry["last"] + 1):
+                phase["day_tasks"].append({
+                    "id": f"d{number}",
+                    "day": number,
+                    "date": (first_date + timedelta(days=number - entry["first"])).isoformat(),
+                    "goal": entry["fields"].get("목표", ""),
+                    "hours": hours,
+                    "fields": entry["fields"],
+                    # 묶인 날의 체크리스트는 첫째 날에만 붙임
+                    "checklist": entry["checklist"] if number == entry["first"] else [],
+                })
+    return schedule
+
+def chapter_tasks(pairs):
+    """
+    챕터 폴더의 학습 자료 -> [(폴더 이름, 작업)]
+    
+    작업: {'id': 'c:<md 경로>', 'name', 'title', 'url', 'sections': ## 제목 수, 'time'}
+    예상 시간은 자료에 '**소요시간**: N시간'이 있을 때만 넣는다.
+    """
+    tasks = []
+    for md_file, html_file in pairs:
+        directory = os.path.dirname(os.path.abspath(md_file))
+        if directory == converter.BASE_DIR:
+            continue
+        document = md_ast.load_document(md_file)
+        hours = 0.0
+        for node in document.children:
+            if node.__class__ is md_ast.ListBlock:
+                for item in node.children:
+                    text = md_ast.inline_text(item.children)
+                    if text.startswith("소요시간:"):
+                        hours = parse_hours(text)
+                        break
+            if hours:
+                break
+        task = {
+            "id": f"c:{converter.manifest_key(md_file)}",
+            "name": os.path.basename(md_file),
+            "title": document.title,
+            "url": os.path.relpath(html_file, converter.BASE_DIR).replace(os.sep, "/"),
+            "sections": sum(1 for entry in md_ast.render_toc(document) if entry["level"] == 2),
+        }
+        if hours:
+            task["time"] = hours
+        tasks.append((os.path.basename(directory), task))
+    return tasks
+
+def build_dataset(schedule_path=SCHEDULE_PATH, pairs=None):
+    """
+    진도표 데이터
+    
+    Returns:
+        {'version', 'title', 'start', 'goal', 'source': 일정 파일 해시,
+         'groups': [{'id', 'kind': 'phase'|'chapter', 'title', 'range'?, 'tasks': [작업]}]}
+        작업: {'id', 'name', 'time'?, 'date'?, 'goal'?, 'parent'?, 'url'?, 'sections'?}
+        (값이 없는 항목은 생략해 파일을 작게 유지)
+    """
+    if pairs is None:
+        pairs = converter.discover_sources()
+    with open(schedule_path, "rb") as f:
+        md_bytes = f.read()
+    schedule = parse_schedule(md_bytes.decode("utf-8").split('\n'))
+    
+    groups = []
+    for phase in schedule["phases"]:
+        tasks = []
+        for day in phase["day_tasks"]:
+            month, day_of_month = map(int, day["date"].split("-")[1:])
+            task = {"id": day["id"], "name": f"Day {day['day']} ({month}/{day_of_month})",
+                    "date": day["date"], "time": day["hours"]}
+            if day["goal"]:
+                task["goal"] = day["goal"]
+            tasks.append(task)
+            tasks += [{"id": text_id(day["id"], text), "name": text, "parent": day["id"]}
+                      for text in day["checklist"]]
+        tasks += [{"id": text_id(phase["id"], text), "name": text, "parent": phase["id"]}
+                  for text in phase["checklist"]]
+        first, last = phase["days"]
+        groups.append({"id": phase["id"], "kind": "phase", "title": f"Phase {phase['id'][1:]}: {phase['title']}",
+                       "range": f"Day {first}-{last}", "tasks": tasks})
+    
+    chapters = {}
+    for folder, task in chapter_tasks(pairs):
+        chapters.setdefault(folder, []).append(task)
+    for folder, tasks in chapters.items():
+        groups.append({"id": f"c{folder[:2]}", "kind": "chapter", "title": folder, "tasks": tasks})
+    
+    return {
+        "version": DASHBOARD_VERSION,
+        "title": schedule["title"],
+        "start": schedule["start"],
+        "goal": schedule["goal"],
+        "source": hashlib.sha256(md_bytes).hexdigest()[:12],
+        "groups": groups,
+    }
+
+def write_dashboard_data(path=DASHBOARD_DATA_PATH, schedule_path=SCHEDULE_PATH, pairs=None):
+    """
+    dashboard_data.js 생성 (내용이 같으면 쓰지 않음)
+    
+    Returns:
+        {'written': 새로 썼는지, 'groups': 그룹 수, 'tasks': 작업 수, 'bytes': 파일 크기}
+    """
+    dataset = build_dataset(schedule_path, pairs)
+    payload = json.dumps(dataset, ensure_ascii=False, separators=(",", ":"))
+    data = f"window.{DATA_VARIABLE} = {payload};\n".encode("utf-8")
+    return {
+        "written": converter.write_if_changed(path, data),
+        "groups": len(dataset["groups"]),
+        "tasks": sum(len(group["tasks"]) for group in dataset["groups"]),
+        "bytes": len(data),
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="학습 일정과 챕터 목록으로 진도표 데이터 생성")
+    parser.add_argument("-o", "--output", default=DASHBOARD_DATA_PATH,
+                        help=f"출력 파일 (기본값: {os.path.relpath(DASHBOARD_DATA_PATH, converter.BASE_DIR)})")
+    parser.add_argument("--schedule", default=SCHEDULE_PATH,
+                        help=f"학습 일정 마크다운 (기본값: {os.path.relpath(SCHEDULE_PATH, converter.BASE_DIR)})")
+    args = parser.parse_args(argv)
+    
+    if not os.path.exists(args.schedule):
+        print(f"오류: 학습 일정 파일을 찾을 수 없습니다: {args.schedule}", file=sys.stderr)
+        return 1
+    result = write_dashboard_data(args.output, args.schedule)
+    state = "새로 씀" if result["written"] else "변경 없음"
+    print(f"[OK] 진도표 데이터: 그룹 {result['groups']}개, 작업 {result['tasks']}개, "
+          f"{result['bytes'] / 1024:.1f}KB ({state})")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
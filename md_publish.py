@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+마크다운 -> HTML -> 이미지를 한 번에 만드는 파이프라인 스크립트
+
+변환(CPU)과 이미지 렌더링(브라우저)을 겹쳐서 실행한다. 변환은 프로세스 풀에서 하고,
+끝난 페이지는 바로 크기가 정해진 asyncio 큐에 넣어 브라우저 작업 페이지들이 꺼내 간다.
+큐가 가득 차면 변환 결과를 넣는 쪽이 기다리므로(backpressure) 브라우저보다 앞서
+나간 페이지가 무한정 쌓이지 않는다.
+
+    python md_publish.py                 전체 자료 변환 + 이미지 생성
+    python md_publish.py --sequential    비교용: 전체 변환이 끝난 뒤 이미지 생성
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+import functools
+from pathlib import Path
+
+import md_to_html_final as converter
+
+def load_image_module():
+    """01_개요 및 환경/html_to_image.py 로드 (폴더 이름에 공백이 있어 파일 경로로 로드)"""
+    import aice
+    return aice.load_command("image")
+
+def _timed_build(*args):
+    """프로세스 풀 작업 단위: (변환 시간(초), _build_worker 결과)"""
+    started = time.perf_counter()
+    outcome = converter._build_worker(*args)
+    return time.perf_counter() - started, outcome
+
+def new_stats():
+    return {
+        "convert": {"count": 0, "busy": 0.0, "span": 0.0},
+        "render": {"count": 0, "busy": 0.0, "span": 0.0},
+        "queue": {"size": 0, "max_depth": 0, "put_wait": 0.0, "get_wait": 0.0},
+    }
+
+def publish(pairs, image, options, jobs=1, concurrency=4, queue_size=8, force=False,
+            shared_css=False, minify=False, cache=True):
+    """
+    (md 파일, html 파일) 목록을 변환하면서 바로 이미지로 렌더링
+    
+    Args:
+        pairs: (md_file, html_file) 튜플 목록
+        image: html_to_image 모듈 (load_image_module())
+        options: image.render_options(...) 결과
+        jobs: 변환 프로세스 수
+        concurrency: 동시에 렌더링할 브라우저 페이지 수
+        queue_size: 렌더링을 기다리는 페이지 최대 수 (가득 차면 변환 결과 넣기를 기다림)
+        force: True면 빌드 캐시를 무시하고 모두 다시 변환
+        shared_css, minify: md_to_html_final.build_incremental과 같음
+            (convert와 같은 값을 줘야 매니페스트의 출력 모드가 맞아 다시 변환하지 않음)
+        cache: True면 이미지 캐시 사용
+    
+    Returns:
+        {'build': build_incremental과 같은 형식, 'images': html_to_images와 같은 형식,
+         'stats': 단계별 처리량 통계, 'elapsed': 초}
+    """
+    async_playwright = image.require_playwright()
+    started = time.perf_counter()
+    build = {"skipped": [], "unchanged": [], "written": [], "errors": {}}
+    images = image.new_result()
+    stats = new_stats()
+    stats["queue"]["size"] = queue_size
+    asyncio.run(_publish(async_playwright, image, pairs, options, jobs, concurrency, queue_size,
+                         force, shared_css, minify, cache, build, images, stats))
+    elapsed = time.perf_counter() - started
+    images["elapsed"] = elapsed
+    stats["queue"]["get_wait"] = images["idle"]
+    stats["render"]["count"] = len(images["renders"])
+    stats["render"]["busy"] = sum(images["renders"].values())
+    return {"build": build, "images": images, "stats": stats, "elapsed": elapsed}
+
+async def _publish(async_playwright, image, pairs, options, jobs, concurrency, queue_size,
+                   force, shared_css, minify, cache, build, images, stats):
+    queue = asyncio.Queue(maxsize=queue_size)
+    workers = max(1, concurrency)
+    started = time.perf_counter()
+    
+    async def consume():
+        await image.render_queue(async_playwright, queue, options, workers, images)
+        stats["render"]["span"] = time.perf_counter() - started
+    
+    async def produce():
+        try:
+            await _convert_and_enqueue(image, queue, pairs, options, jobs, force, shared_css, minify,
+                                       cache, build, images, stats)
+            stats["convert"]["span"] = time.perf_counter() - started
+        finally:
+            # 작업 페이지마다 종료 신호 하나씩 (변환 중 오류가 나도 브라우저는 끝나도록)
+            for _ in range(workers):
+                await queue.put(None)
+    
+    await asyncio.gather(produce(), consume())
+
+async def _convert_and_enqueue(image, queue, pairs, options, jobs, force, shared_css, minify,
+                               cache, build, images, stats):
+    loop = asyncio.get_running_loop()
+    # 매니페스트 읽기, 변환기 해시, 이미지 캐시 조회(HTML 해시)는 파일을 읽으므로
+    # 이벤트 루프를 막지 않게 스레드에서 실행 (그동안 브라우저 페이지는 계속 렌더링)
+    plan = await loop.run_in_executor(None, functools.partial(
+        converter.BuildPlan, pairs, force=force, shared_css=shared_css, minify=minify))
+    build.update(plan.result)
+    queue_stats = stats["queue"]
+    
+    async def enqueue(html_file):
+        html_path = Path(html_file).resolve()
+        output_file = html_path.with_suffix(image.IMAGE_FORMATS[options["format"]])
+        cached_file = None
+        if cache:
+            hit, cached_file = await loop.run_in_executor(
+                None, image.lookup_cached_image, html_path, output_file, options)
+            if hit:
+                images["cached"].append(str(output_file))
+                return
+        waiting = time.perf_counter()
+        await queue.put((html_path, output_file, cached_file))
+        queue_stats["put_wait"] += time.perf_counter() - waiting
+        queue_stats["max_depth"] = max(queue_stats["max_depth"], queue.qsize())
+    
+    # 변경되지 않은 페이지는 이미 HTML이 있으므로 바로 렌더링 큐로 보냄
+    html_files = dict(pairs)
+    for md_file in plan.result["skipped"]:
+        await enqueue(html_files[md_file])
+    
+    if plan.pending:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=max(1, min(jobs, len(plan.pending)))) as executor:
+            tasks = {
+                loop.run_in_executor(executor, _timed_build, *plan.worker_args(md_file, html_file, entry)):
+                (md_file, html_file)
+                for md_file, html_file, entry in plan.pending
+            }
+            # 끝난 순서대로 큐에 넣어 브라우저가 바로 렌더링하게 함
+            while tasks:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    md_file, html_file = tasks.pop(task)
+                    try:
+                        seconds, (status, entry, _) = task.result()
+                    except Exception as e:
+                        plan.fail(md_file, e)
+                        continue
+                    stats["convert"]["count"] += 1
+                    stats["convert"]["busy"] += seconds
+                    plan.record(md_file, status, entry)
+                    await enqueue(html_file)
+    
+    build.update(await loop.run_in_executor(None, plan.finish))
+
+def publish_sequential(pairs, image, options, jobs=1, concurrency=4, force=False,
+                       shared_css=False, minify=False, cache=True):
+    """비교용: 전체 변환이 끝난 뒤 이미지 렌더링 (publish와 같은 형식의 결과)"""
+    started = time.perf_counter()
+    stats = new_stats()
+    build = converter.build_incremental(pairs, force=force, jobs=jobs, shared_css=shared_css, minify=minify)
+    converted = len(build["written"]) + len(build["unchanged"])
+    converted_at = time.perf_counter() - started
+    stats["convert"].update(count=converted, busy=converted_at, span=converted_at)
+    
+    # 변환이 모두 끝난 뒤 렌더링 시작 (html_to_image.py를 따로 실행하는 것과 같음)
+    targets = []
+    for md_file, html_file in pairs:
+        if md_file not in build["errors"]:
+            html_path = Path(html_file).resolve()
+            targets.append((html_path, html_path.with_suffix(image.IMAGE_FORMATS[options["format"]])))
+    images = image.render_pages(targets, options, concurrency, cache)
+    elapsed = time.perf_counter() - started
+    stats["render"].update(count=len(images["renders"]), busy=sum(images["renders"].values()), span=elapsed)
+    stats["queue"]["get_wait"] = images["idle"]
+    return {"build": build, "images": images, "stats": stats, "elapsed": elapsed}
+
+def format_stats(stats, elapsed):
+    """단계별 처리량 통계 출력용 문자열"""
+    lines = []
+    for name, label in (("convert", "변환"), ("render", "렌더링")):
+        stage = stats[name]
+        rate = stage["count"] / stage["span"] if stage["span"] else 0.0
+        lines.append(f"  {label:<6} {stage['count']:>4}개  작업 시간 {stage['busy']:7.2f}초  "
+                     f"단계 완료 {stage['span']:7.2f}초  {rate:6.1f}개/초")
+    queue = stats["queue"]
+    lines.append(f"  큐     최대 {queue['max_depth']}/{queue['size']}개  "
+                 f"넣기 대기 {queue['put_wait']:.2f}초 (backpressure)  꺼내기 대기 {queue['get_wait']:.2f}초")
+    lines.append(f"  전체   {elapsed:.2f}초")
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="마크다운 -> HTML -> 이미지 파이프라인 (변환과 렌더링을 겹쳐 실행)")
+    parser.add_argument("dirs", nargs="*", help="변환할 폴더 (생략하면 전체 챕터와 루트 계획 파일)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="동시에 변환할 프로세스 수 (기본값: CPU 수)")
+    parser.add_argument("-c", "--concurrency", type=int, default=4, help="동시에 렌더링할 브라우저 페이지 수")
+    parser.add_argument("--queue-size", type=int, default=8,
+                        help="렌더링을 기다리는 페이지 최대 수 (기본값: 8)")
+    parser.add_argument("--force", action="store_true", help="빌드 캐시를 무시하고 모두 다시 변환")
+    parser.add_argument("--shared-css", action="store_true", help="md_to_html_final.py --shared-css와 같음")
+    parser.add_argument("--minify", action="store_true", help="출력 HTML의 공백과 주석 압축")
+    parser.add_argument("--split-sections", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--no-cache", action="store_true", help="이미지 캐시를 사용하지 않음")
+    parser.add_argument("--format", choices=("png", "jpeg", "webp"), default="png", help="이미지 형식 (기본값: png)")
+    parser.add_argument("--width", type=int, default=1200, help="이미지 너비 (기본값: 1200px)")
+    parser.add_argument("--scale", type=float, default=2, help="기기 배율 (기본값: 2)")
+    parser.add_argument("--sequential", action="store_true", help="비교용: 전체 변환 후 렌더링 (겹치지 않음)")
+    args = parser.parse_args(argv)
+    if args.queue_size < 1:
+        parser.error("--queue-size는 1 이상이어야 합니다")
+    if args.split_sections:
+        parser.error("--split-sections는 지원하지 않습니다: 이미지는 file:// 주소로 렌더링해서 절 조각을 "
+                     "불러올 수 없습니다 (publish는 나누지 않은 페이지를 렌더링하고, 웹용 분할 출력은 "
+                     "publish 뒤에 'aice.py convert --split-sections'로 만드세요)")
+    
+    pairs = converter.discover_sources(dirs=args.dirs or None)
+    print(f"\n총 {len(pairs)}개 파일 처리 시작... (변환 프로세스 {args.jobs}개, 렌더링 페이지 {args.concurrency}개)\n")
+    image = load_image_module()
+    try:
+        options = image.render_options(width=args.width, scale=args.scale, image_format=args.format)
+        if args.sequential:
+            result = publish_sequential(pairs, image, options, jobs=args.jobs, concurrency=args.concurrency,
+                                        force=args.force, shared_css=args.shared_css, minify=args.minify,
+                                        cache=not args.no_cache)
+        else:
+            result = publish(pairs, image, options, jobs=args.jobs, concurrency=args.concurrency,
+                             queue_size=args.queue_size, force=args.force, shared_css=args.shared_css,
+                             minify=args.minify, cache=not args.no_cache)
+    except RuntimeError as e:
+        # playwright가 없는 경우
+        print(f"오류: {e}")
+        return 2
+    
+    build, images = result["build"], result["images"]
+    for md_path, message in sorted(build["errors"].items()):
+        print(f"[ERROR] 변환 오류 ({converter.manifest_key(md_path)}): {message}")
+    for html_file, message in sorted(images["errors"].items()):
+        print(f"[ERROR] 렌더링 오류 ({html_file}): {message}")
+    for key, href, reason in build["links"]["broken"]:
+        print(f"[LINK] 깨진 링크 ({key}): {href} ({reason})")
+    print(f"변환 {len(build['written'])}개, 동일 {len(build['unchanged'])}개, 건너뜀 {len(build['skipped'])}개 / "
+          f"이미지 {len(images['done'])}개, 캐시 {len(images['cached'])}개\n")
+    print(format_stats(result["stats"], result["elapsed"]))
+    return 1 if build["errors"] or images["errors"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,288 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+전체 학습 자료의 검색 색인을 미리 만드는 스크립트
+
+제목/본문/코드를 제목(##, ###) 단위 구절로 나누고, 단어마다 글자 2-gram을 뽑아
+역색인을 만든다. 한국어는 띄어쓰기 단위가 길고 조사가 붙으므로 형태소 분석 대신
+글자 n-gram을 쓴다. 색인은 챕터 폴더별 조각(shard)으로 나누어 search_index/에 저장하고,
+search.html은 manifest.json으로 검색어가 들어 있는 조각만 골라 내려받는다.
+
+문서별 추출 결과는 .build_cache/search에 캐시하므로 바뀐 문서만 다시 색인한다.
+"""
+import os
+import re
+import sys
+import json
+import hashlib
+import argparse
+import unicodedata
+
+import md_ast
+import md_to_html_final as converter
+
+SEARCH_INDEX_DIR = os.path.join(converter.BASE_DIR, "search_index")
+SEARCH_CACHE_DIR = os.path.join(converter.BUILD_DIR, "search")
+# 색인 형식을 바꾸면 올림 (search.html도 같이 수정)
+INDEX_VERSION = 2
+# manifest의 조각 비트마스크는 자바스크립트 32비트 정수 연산으로 처리
+MAX_SHARDS = 31
+# 이 모듈이 쓰는 조각 파일 이름 (<챕터 번호 또는 root>.<내용 해시>.json, 정리할 때 이 파일만 지움)
+_SHARD_FILE = re.compile(r'^(?:\d{2}|root)\.[0-9a-f]{12}\.json$')
+
+_WORD = re.compile(r'\w+')
+
+def normalize(text):
+    """검색용 정규화 (NFKC + 소문자, search.html의 normalize와 같아야 함)"""
+    return unicodedata.normalize("NFKC", text).lower()
+
+def text_grams(text):
+    """
+    텍스트의 색인 단위 집합
+    
+    단어마다 글자 2-gram을 만들고, 한 글자 단어는 그 글자 하나를 쓴다.
+    (예: '리스트 컴프리헨션' -> 리스, 스트, 컴프, 프리, 리헨, 헨션)
+    """
+    grams = set()
+    for word in _WORD.findall(normalize(text)):
+        if len(word) == 1:
+            grams.add(word)
+        else:
+            grams.update(word[i:i + 2] for i in range(len(word) - 1))
+    return grams
+
+def document_passages(document):
+    """
+    문서를 제목 단위 구절로 나눔 -> [(제목, 앵커, 본문 텍스트)] (코드 블록 포함)
+    
+    앵커는 변환된 페이지의 제목 id다 (문서 첫 부분은 '').
+    """
+    passages = []
+    heading = document.title
+    anchor = ""
+    buffer = []
+    slugs = {}
+    renderer = md_ast.HtmlRenderer()
+    
+    def walk(nodes):
+        nonlocal heading, anchor, buffer
+        for node in nodes:
+            cls = node.__class__
+            if cls is md_ast.Heading:
+                if buffer or not passages:
+                    passages.append((heading, anchor, "\n".join(buffer)))
+                heading = md_ast.inline_text(node.children)
+                # md_ast.render_toc와 같은 방식 (문서 안 겹치는 제목은 -1, -2 …)
+                anchor = converter.heading_slug(renderer.inline(node.children), slugs)
+                buffer = []
+            elif cls is md_ast.CodeBlock:
+                buffer.append(node.code)
+            elif cls in (md_ast.Section, md_ast.ListBlock):
+                walk(node.children)
+            elif cls is md_ast.Table:
+                buffer.extend(md_ast.table_row_text(row) for row in node.children)
+            elif cls not in (md_ast.Rule, md_ast.TableLinks):
+                buffer.append(md_ast.inline_text(node.children))
+    
+    walk(document.children)
+    passages.append((heading, anchor, "\n".join(buffer)))
+    return passages
+
+# ---------------------------------------------------------------------------
+# 문서별 색인 (캐시)
+# ---------------------------------------------------------------------------
+
+_fingerprint = None
+
+def index_fingerprint():
+    """색인 결과를 결정하는 소스 해시 (파서 + 이 파일)"""
+    global _fingerprint
+    if _fingerprint is None:
+        h = hashlib.sha256(md_ast.ast_fingerprint().encode())
+        with open(os.path.abspath(__file__), "rb") as f:
+            h.update(f.read())
+        _fingerprint = h.hexdigest()
+    return _fingerprint
+
+def document_url(html_file):
+    """search.html 기준 상대 경로"""
+    return os.path.relpath(html_file, converter.BASE_DIR).replace(os.sep, "/")
+
+def document_key(md_file, html_file):
+    """문서 색인 캐시 키 (경로 + 색인기 + 내용 해시 + include한 데이터 파일 상태)"""
+    with open(md_file, "rb") as f:
+        md_bytes = f.read()
+    h = hashlib.sha256(f"{document_url(html_file)}\0{index_fingerprint()}\0".encode() + md_bytes)
+    if b"include:" in md_bytes:
+        stamps = converter.include_stamps(md_file, md_bytes.decode("utf-8").split('\n'))
+        h.update(json.dumps(stamps, sort_keys=True).encode())
+    return h.hexdigest()
+
+def index_document(md_file, html_file, key=None):
+    """
+    문서 하나의 색인 레코드 (내용, 경로, 색인기가 같으면 캐시에서 읽음)
+    
+    Returns:
+        (레코드, 캐시 사용 여부)
+        레코드: {'url', 'title', 'passages': [[제목, 앵커, 본문]], 'grams': [[구절별 gram]]}
+    """
+    url = document_url(html_file)
+    if key is None:
+        key = document_key(md_file, html_file)
+    cache_file = os.path.join(SEARCH_CACHE_DIR, f"{key}.json")
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            return json.load(f), True
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    
+    document = md_ast.load_document(md_file)
+    passages = document_passages(document)
+    record = {
+        "url": url,
+        "title": document.title,
+        "passages": [list(passage) for passage in passages],
+        "grams": [sorted(text_grams(heading + "\n" + text)) for heading, _, text in passages],
+    }
+    os.makedirs(SEARCH_CACHE_DIR, exist_ok=True)
+    tmp_file = cache_file + ".tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(record, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_file, cache_file)
+    return record, False
+
+# ---------------------------------------------------------------------------
+# 조각(shard)과 manifest
+# ---------------------------------------------------------------------------
+
+def shard_of(md_file):
+    """문서가 속한 조각 -> (id, 이름) (챕터 폴더별, 루트 계획 파일은 'root')"""
+    directory = os.path.dirname(os.path.abspath(md_file))
+    if directory == converter.BASE_DIR:
+        return "root", "학습 계획"
+    name = os.path.basename(directory)
+    return name[:2], name
+
+def build_shard(records):
+    """
+    문서 레코드들을 조각 하나로 합침
+    
+    index의 구절 번호 목록은 앞 번호와의 차이로 저장한다 (델타 인코딩).
+    구절: [문서 번호, 제목, 본문, 제목 앵커] (search.html은 '<문서 url>#<앵커>'로 연결)
+    """
+    docs = []
+    passages = []
+    postings = {}
+    for record in records:
+        doc_id = len(docs)
+        docs.append([record["url"], record["title"]])
+        for (heading, anchor, text), grams in zip(record["passages"], record["grams"]):
+            passage_id = len(passages)
+            passages.append([doc_id, heading, text, anchor])
+            for gram in grams:
+                postings.setdefault(gram, []).append(passage_id)
+    
+    index = {}
+    for gram in sorted(postings):
+        ids = postings[gram]
+        index[gram] = [ids[0]] + [ids[i] - ids[i - 1] for i in range(1, len(ids))]
+    return {"version": INDEX_VERSION, "docs": docs, "passages": passages, "index": index}
+
+def _load_manifest(index_dir):
+    try:
+        with open(os.path.join(index_dir, "manifest.json"), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    return manifest if manifest.get("version") == INDEX_VERSION else None
+
+def _dump(data):
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+def build_search_index(pairs=None, index_dir=SEARCH_INDEX_DIR):
+    """
+    검색 색인 생성 (바뀐 문서만 다시 색인, 바뀐 조각만 다시 씀)
+    
+    Args:
+        pairs: (md 파일, html 파일) 목록 (None이면 전체 학습 자료)
+        index_dir: 출력 폴더
+    
+    Returns:
+        {'indexed': [다시 색인한 md], 'cached': [캐시 사용 md], 'written': [새로 쓴 조각 파일],
+         'shards': 조각 수, 'bytes': 전체 크기}
+    """
+    if pairs is None:
+        pairs = converter.discover_sources()
+    result = {"indexed": [], "cached": [], "written": []}
+    
+    # 빠른 경로: 모든 문서의 캐시 키가 지난 빌드와 같으면 조각을 다시 만들지 않음
+    keys = [document_key(md_file, html_file) for md_file, html_file in pairs]
+    state = hashlib.sha256("\n".join(keys).encode()).hexdigest()
+    previous = _load_manifest(index_dir)
+    if previous is not None and previous.get("state") == state and all(
+            os.path.exists(os.path.join(index_dir, shard["file"])) for shard in previous["shards"]):
+        result["cached"] = [md_file for md_file, _ in pairs]
+        result["shards"] = len(previous["shards"])
+        result["bytes"] = previous["bytes"] + os.path.getsize(os.path.join(index_dir, "manifest.json"))
+        return result
+    
+    groups = {}
+    for (md_file, html_file), key in zip(pairs, keys):
+        record, cached = index_document(md_file, html_file, key)
+        result["cached" if cached else "indexed"].append(md_file)
+        shard_id, label = shard_of(md_file)
+        groups.setdefault((shard_id, label), []).append(record)
+    if len(groups) > MAX_SHARDS:
+        raise ValueError(f"조각이 너무 많음: {len(groups)}개 (최대 {MAX_SHARDS}개)")
+    
+    os.makedirs(index_dir, exist_ok=True)
+    shards = []
+    gram_masks = {}
+    total_bytes = 0
+    for bit, ((shard_id, label), records) in enumerate(sorted(groups.items())):
+        shard = build_shard(records)
+        data = _dump(shard).encode("utf-8")
+        # 내용 해시를 파일 이름에 넣어 브라우저가 오래 캐시해도 안전하게 함
+        file_name = f"{shard_id}.{hashlib.sha256(data).hexdigest()[:12]}.json"
+        if converter.write_if_changed(os.path.join(index_dir, file_name), data):
+            result["written"].append(file_name)
+        total_bytes += len(data)
+        shards.append({
+            "id": shard_id, "label": label, "file": file_name,
+            "docs": len(shard["docs"]), "passages": len(shard["passages"]),
+        })
+        for gram in shard["index"]:
+            gram_masks[gram] = gram_masks.get(gram, 0) | (1 << bit)
+    
+    # state, bytes: 다음 빌드의 빠른 경로용 (bytes는 manifest를 뺀 조각 크기 합계)
+    manifest = {"version": INDEX_VERSION, "state": state, "bytes": total_bytes,
+                "shards": shards, "grams": dict(sorted(gram_masks.items()))}
+    data = _dump(manifest).encode("utf-8")
+    if converter.write_if_changed(os.path.join(index_dir, "manifest.json"), data):
+        result["written"].append("manifest.json")
+    total_bytes += len(data)
+    
+    # 이전 빌드의 조각 파일 정리 (색인 폴더를 다른 파일과 같이 써도 되도록 조각 이름만)
+    current = {shard["file"] for shard in shards}
+    for name in os.listdir(index_dir):
+        if _SHARD_FILE.match(name) and name not in current:
+            os.remove(os.path.join(index_dir, name))
+    
+    result["shards"] = len(shards)
+    result["bytes"] = total_bytes
+    return result
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="전체 학습 자료 검색 색인 생성")
+    parser.add_argument("-o", "--output", default=SEARCH_INDEX_DIR,
+                        help=f"색인 폴더 (기본값: {os.path.relpath(SEARCH_INDEX_DIR, converter.BASE_DIR)})")
+    args = parser.parse_args(argv)
+    
+    result = build_search_index(index_dir=args.output)
+    print(f"[OK] 검색 색인: 문서 {len(result['indexed']) + len(result['cached'])}개 "
+          f"(다시 색인 {len(result['indexed'])}개), 조각 {result['shards']}개, "
+          f"{result['bytes'] / 1024:.0f}KB, 새로 쓴 파일 {len(result['written'])}개")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,323 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+빌드 결과물(HTML/CSS/JSON)을 미리 압축해 두고, 압축본을 그대로 내려주는 로컬 정적 서버
+
+압축은 바뀐 파일만 다시 한다 (.build_cache/compress.json에 원본 해시를 기록).
+서버는 Accept-Encoding에 맞는 압축본을 고르고, 기록된 해시를 ETag로 보내며,
+If-None-Match가 맞으면 본문 없이 304로 응답한다.
+"""
+import os
+import re
+import sys
+import gzip
+import json
+import time
+import hashlib
+import argparse
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+import md_to_html_final as converter
+
+COMPRESS_MANIFEST_PATH = os.path.join(converter.BUILD_DIR, "compress.json")
+COMPRESSIBLE_EXTENSIONS = (".html", ".css", ".json", ".js", ".svg", ".txt")
+# 압축 대상을 찾는 폴더 (변환된 HTML 외의 빌드 결과물)
+ARTIFACT_DIRS = ("assets", "search_index")
+# 저장소 최상위의 정적 페이지와 생성 데이터
+ARTIFACT_FILES = ("search.html", "progress_dashboard.html", "dashboard_data.js")
+# 파일 이름에 내용 해시가 들어 있어 오래 캐시해도 되는 파일 (style.<hash>.css, 02.<hash>.json)
+IMMUTABLE_NAME = re.compile(r'\.[0-9a-f]{12}\.[a-z]+$')
+
+def _gzip(data):
+    # mtime=0: 같은 입력이면 같은 바이트 (빌드 재현성)
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+def _brotli(data):
+    import brotli
+    return brotli.compress(data, quality=11)
+
+def available_encodings():
+    """사용 가능한 압축 방식 -> {Content-Encoding: (확장자, 압축 함수)} (br은 brotli 설치 시)"""
+    encodings = {"gzip": (".gz", _gzip)}
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        encodings["br"] = (".br", _brotli)
+    return encodings
+
+# ---------------------------------------------------------------------------
+# 미리 압축
+# ---------------------------------------------------------------------------
+
+def collect_artifacts(base_dir=converter.BASE_DIR):
+    """
+    압축할 빌드 결과물 목록
+    
+    변환된 HTML과 함께 만든 표 쪽/절 조각 파일(빌드 매니페스트 기준), 최상위의 검색/진도표
+    페이지와 데이터, assets/와 search_index/의 파일.
+    """
+    manifest = converter.load_manifest()
+    paths = []
+    for md_file, html in converter.discover_sources(base_dir):
+        if os.path.exists(html):
+            paths.append(html)
+            entry = manifest["files"].get(converter.manifest_key(md_file))
+            paths += [path for path in converter.output_files(html, entry) if os.path.exists(path)]
+    paths += [path for path in (os.path.join(base_dir, name) for name in ARTIFACT_FILES) if os.path.exists(path)]
+    for name in ARTIFACT_DIRS:
+        directory = os.path.join(base_dir, name)
+        if os.path.isdir(directory):
+            paths += [os.path.join(directory, f) for f in sorted(os.listdir(directory))
+                      if f.endswith(COMPRESSIBLE_EXTENSIONS)]
+    return paths
+
+def load_compress_manifest(path=COMPRESS_MANIFEST_PATH):
+    """압축 매니페스트 {상대 경로: {'sha256', 'size', 'mtime_ns', 'encodings'}}"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def _variant_path(path, encoding, encodings):
+    return path + encodings[encoding][0]
+
+def precompress(paths, encodings=None, manifest_path=COMPRESS_MANIFEST_PATH, min_size=256):
+    """
+    파일마다 압축본(file.html.gz 등)을 만든다 (원본이 바뀐 파일만)
+    
+    Args:
+        paths: 압축할 파일 목록
+        encodings: available_encodings() 중 사용할 것 (None이면 전부)
+        min_size: 이보다 작은 파일은 압축하지 않음 (헤더 비용이 더 큼)
+    
+    Returns:
+        {'compressed': [...], 'skipped': [...], 'bytes': 원본 합계, 'compressed_bytes': {인코딩: 합계}}
+    """
+    if encodings is None:
+        encodings = available_encodings()
+    manifest = load_compress_manifest(manifest_path)
+    result = {"compressed": [], "skipped": [], "bytes": 0,
+              "compressed_bytes": {name: 0 for name in encodings}}
+    current = {}
+    
+    for path in paths:
+        key = converter.manifest_key(path)
+        st = os.stat(path)
+        entry = manifest.get(key)
+        variants_exist = entry is not None and all(
+            os.path.exists(_variant_path(path, name, encodings)) for name in entry["encodings"])
+        same_encodings = entry is not None and set(entry.get("tried", ())) == set(encodings)
+        
+        # 빠른 경로: 크기와 수정 시각이 같으면 해시도 계산하지 않음
+        if variants_exist and same_encodings and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns:
+            current[key] = entry
+            result["skipped"].append(path)
+        else:
+            with open(path, "rb") as f:
+                data = f.read()
+            digest = hashlib.sha256(data).hexdigest()
+            if variants_exist and same_encodings and entry["sha256"] == digest:
+                entry.update(size=st.st_size, mtime_ns=st.st_mtime_ns)
+                current[key] = entry
+                result["skipped"].append(path)
+            else:
+                written = []
+                for name, (suffix, compress) in encodings.items():
+                    packed = compress(data) if len(data) >= min_size else None
+                    if packed is not None and len(packed) < len(data):
+                        converter.write_if_changed(path + suffix, packed)
+                        written.append(name)
+                    elif os.path.exists(path + suffix):
+                        os.remove(path + suffix)
+                entry = current[key] = {
+                    "sha256": digest, "size": st.st_size, "mtime_ns": st.st_mtime_ns,
+                    "encodings": written, "tried": sorted(encodings),
+                }
+                result["compressed"].append(path)
+        
+        result["bytes"] += entry["size"]
+        for name in encodings:
+            variant = _variant_path(path, name, encodings)
+            result["compressed_bytes"][name] += (
+                os.path.getsize(variant) if name in entry["encodings"] else entry["size"])
+    
+    _remove_orphans(paths, encodings)
+    os.makedirs(os.path.dirname(os.path.abspath(manifest_path)), exist_ok=True)
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(current, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+    return result
+
+def _remove_orphans(paths, encodings):
+    """원본이 없어진 압축본 삭제 (이전 빌드의 해시 이름 파일 등)"""
+    suffixes = tuple(ext + suffix for ext in COMPRESSIBLE_EXTENSIONS for suffix, _ in encodings.values())
+    for directory in {os.path.dirname(p) for p in paths}:
+        for name in os.listdir(directory):
+            if name.endswith(suffixes):
+                variant = os.path.join(directory, name)
+                if not os.path.exists(os.path.splitext(variant)[0]):
+                    os.remove(variant)
+
+# ---------------------------------------------------------------------------
+# 정적 서버
+# ---------------------------------------------------------------------------
+
+def parse_accept_encoding(header):
+    """Accept-Encoding 헤더 -> {인코딩: q값} (q=0은 제외)"""
+    accepted = {}
+    for item in (header or "").split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        match = re.search(r'q\s*=\s*([0-9.]+)', params)
+        if match:
+            try:
+                q = float(match.group(1))
+            except ValueError:
+                q = 0.0
+        if q > 0:
+            accepted[name] = q
+    return accepted
+
+class ETagTable:
+    """파일별 ETag (압축 매니페스트의 해시 사용, 없으면 직접 계산해 (mtime, 크기)로 캐시)"""
+    
+    def __init__(self, root, manifest_path=COMPRESS_MANIFEST_PATH):
+        self.root = root
+        self.manifest_path = manifest_path
+        self._manifest = {}
+        self._manifest_stat = None
+        self._computed = {}
+    
+    def _reload(self):
+        try:
+            st = os.stat(self.manifest_path)
+        except FileNotFoundError:
+            return
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp != self._manifest_stat:
+            self._manifest = load_compress_manifest(self.manifest_path)
+            self._manifest_stat = stamp
+    
+    def lookup(self, path):
+        """-> (sha256, 사용 가능한 압축 방식 목록)"""
+        self._reload()
+        st = os.stat(path)
+        key = os.path.relpath(path, self.root).replace(os.sep, "/")
+        entry = self._manifest.get(key)
+        if entry is not None and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns:
+            return entry["sha256"], entry["encodings"]
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._computed.get(path)
+        if cached is None or cached[0] != stamp:
+            with open(path, "rb") as f:
+                cached = self._computed[path] = (stamp, hashlib.sha256(f.read()).hexdigest())
+        # 매니페스트와 다른 원본이면 압축본도 오래된 것이므로 쓰지 않음
+        return cached[1], []
+
+def make_handler(root, etags, encodings, quiet=False):
+    class StaticHandler(SimpleHTTPRequestHandler):
+        """미리 압축된 파일 선택 + ETag/304 응답"""
+        
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, directory=root, **kwargs)
+        
+        def log_message(self, format, *args):
+            if not quiet:
+                super().log_message(format, *args)
+        
+        def send_head(self):
+            path = self.translate_path(self.path)
+            if not os.path.isfile(path):
+                return super().send_head()
+            
+            try:
+                digest, compressed = etags.lookup(path)
+            except OSError:
+                self.send_error(404, "File not found")
+                return None
+            
+            # 압축 방식 선택 (q값이 가장 높은 것, 같으면 br > gzip 순)
+            accepted = parse_accept_encoding(self.headers.get("Accept-Encoding"))
+            choices = [name for name in compressed if name in encodings
+                       and (name in accepted or "*" in accepted)]
+            choices.sort(key=lambda name: (accepted.get(name, accepted.get("*", 0)), name == "br"), reverse=True)
+            encoding = choices[0] if choices else None
+            etag = f'"{digest[:32]}{"-" + encoding if encoding else ""}"'
+            
+            cache_control = ("public, max-age=31536000, immutable"
+                             if IMMUTABLE_NAME.search(path) else "no-cache")
+            if_none_match = self.headers.get("If-None-Match")
+            if if_none_match and (if_none_match.strip() == "*"
+                                  or etag in [tag.strip() for tag in if_none_match.split(",")]):
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", cache_control)
+                self.send_header("Vary", "Accept-Encoding")
+                self.end_headers()
+                return None
+            
+            file_path = path + encodings[encoding][0] if encoding else path
+            try:
+                f = open(file_path, "rb")
+            except OSError:
+                self.send_error(404, "File not found")
+                return None
+            self.send_response(200)
+            self.send_header("Content-Type", self.guess_type(path))
+            self.send_header("Content-Length", str(os.fstat(f.fileno()).st_size))
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            self.send_header("Vary", "Accept-Encoding")
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", cache_control)
+            self.end_headers()
+            return f
+    
+    return StaticHandler
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="빌드 결과물 미리 압축 + 압축본/ETag/304를 지원하는 로컬 정적 서버")
+    parser.add_argument("--port", type=int, default=8000, help="서버 포트 (기본값: 8000)")
+    parser.add_argument("--encodings", default=None,
+                        help=f"사용할 압축 방식 (쉼표 구분, 기본값: 사용 가능한 전부 = {','.join(available_encodings())})")
+    parser.add_argument("--compress-only", action="store_true", help="압축만 하고 서버는 실행하지 않음")
+    parser.add_argument("--no-compress", action="store_true", help="압축 없이 서버만 실행")
+    parser.add_argument("--quiet", action="store_true", help="요청 로그 출력 안 함")
+    args = parser.parse_args(argv)
+    
+    encodings = available_encodings()
+    if args.encodings:
+        names = [name for name in args.encodings.split(",") if name]
+        unknown = [name for name in names if name not in encodings]
+        if unknown:
+            parser.error(f"사용할 수 없는 압축 방식: {', '.join(unknown)} (br은 brotli 패키지 필요)")
+        encodings = {name: encodings[name] for name in names}
+    
+    if not args.no_compress:
+        started = time.perf_counter()
+        result = precompress(collect_artifacts(), encodings)
+        sizes = ", ".join(f"{name} {size / 1024:,.0f}KB" for name, size in result["compressed_bytes"].items())
+        print(f"[OK] 압축 {len(result['compressed'])}개, 변경 없음 {len(result['skipped'])}개 "
+              f"(원본 {result['bytes'] / 1024:,.0f}KB -> {sizes}, {time.perf_counter() - started:.2f}초)")
+    if args.compress_only:
+        return 0
+    
+    handler = make_handler(converter.BASE_DIR, ETagTable(converter.BASE_DIR), encodings, args.quiet)
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), handler)
+    server.daemon_threads = True
+    print(f"로컬 서버: http://127.0.0.1:{args.port}/ (Ctrl+C로 종료)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n서버 종료")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
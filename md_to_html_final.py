@@ -7,12 +7,34 @@ import os
 import re
 import sys
 import io
+import csv
+import json
+import time
+import hashlib
+import argparse
+import unicodedata
+import contextlib
+from html import unescape
+from urllib.parse import unquote
 
 # Windows에서 UTF-8 출력 설정
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMPLATE_PATH = os.path.join(BASE_DIR, "templates", "html_style_template.html")
+BUILD_DIR = os.path.join(BASE_DIR, ".build_cache")
+MANIFEST_PATH = os.path.join(BUILD_DIR, "manifest.json")
+BUILD_REPORT_PATH = os.path.join(BUILD_DIR, "build_report.json")
+# 아무것도 바뀌지 않은 'aice.py convert'를 이 모듈 import 없이 끝내기 위한 기록 (aice.py가 직접 읽음)
+NOOP_STAMP_PATH = os.path.join(BUILD_DIR, "noop_stamp.json")
+# --shared-css 모드에서 공용 스타일시트를 저장하는 폴더
+ASSETS_DIR = os.path.join(BASE_DIR, "assets")
+
+# 변환 결과에 영향을 주는 소스 파일 (내용이 바뀌면 전체 재빌드)
+CONVERTER_SOURCES = [os.path.abspath(__file__)]
+
 def escape_html(text):
     """HTML 특수문자 이스케이프"""
     text = text.replace('&', '&amp;')
@@ -20,144 +42,825 @@ def escape_html(text):
     text = text.replace('>', '&gt;')
     return text
 
+# 인라인 문법이 시작될 수 있는 문자 (없으면 스캔 생략)
+_INLINE_SPECIAL = re.compile(r'[`*\[]')
+
+# 인라인 스캐너가 출력하는 태그와 코드 내용 처리 함수
+# (strong 열기/닫기, em 열기/닫기, code 열기/닫기, 링크 열기/주소 끝/닫기, 코드 이스케이프)
+# md_ast는 같은 스캐너에 표식 객체를 넘겨 인라인 노드를 만든다.
+HTML_INLINE_TAGS = (
+    '<strong>', '</strong>', '<em>', '</em>', '<code>', '</code>',
+    '<a href="', '">', '</a>', escape_html,
+)
+
 def parse_inline_markdown(text):
-    """인라인 마크다운 처리"""
-    # 강조 (순서 중요: ** 먼저, * 나중에)
-    text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
-    text = re.sub(r'(?<!\*)\*(?!\*)([^*]+?)(?<!\*)\*(?!\*)', r'<em>\1</em>', text)
+    """
+    인라인 마크다운 처리 (코드, 강조, 링크를 한 번의 스캔으로 처리)
     
-    # 인라인 코드
-    text = re.sub(r'`([^`]+)`', r'<code>\1</code>', text)
+    왼쪽에서 오른쪽으로 한 번만 훑으면서 닫는 기호를 찾는다. 닫는 기호 검색이
+    실패하면 그 뒤로는 다시 찾지 않으므로 '*'가 많은 줄에서도 선형 시간이다.
+    코드 스팬 안의 내용은 강조/링크를 적용하지 않고 이스케이프만 한다.
+    """
+    if not _INLINE_SPECIAL.search(text):
+        return text
+    out = []
+    _scan_inline(text, 0, len(text), out)
+    return ''.join(out)
+
+def _scan_inline(text, start, end, out, tags=HTML_INLINE_TAGS):
+    """text[start:end] 구간을 스캔해 HTML 조각(또는 tags의 표식)을 out에 추가"""
+    (strong_open, strong_close, em_open, em_close, code_open, code_close,
+     link_open, link_href_end, link_close, escape_code) = tags
+    find = text.find
+    special = _INLINE_SPECIAL.search
+    # 닫는 기호가 더 이상 없다고 확인된 종류 (다시 검색하지 않음)
+    no_code = no_strong = no_em = no_link = False
+    # 마지막으로 찾은 ']' / ')' 위치 (아직 앞에 있으면 재사용)
+    close_bracket = close_paren = -2
+    i = start
     
-    # 링크
-    text = re.sub(r'\[([^\]]+)\]\(([^\)]+)\)', r'<a href="\2">\1</a>', text)
+    while i < end:
+        m = special(text, i, end)
+        if m is None:
+            out.append(text[i:end])
+            break
+        pos = m.start()
+        if pos > i:
+            out.append(text[i:pos])
+        i = pos
+        ch = text[i]
+        
+        # 인라인 코드: `code`
+        if ch == '`':
+            j = -1 if no_code else find('`', i + 1, end)
+            if j == -1:
+                no_code = True
+            elif j > i + 1:
+                out.append(code_open)
+                out.append(escape_code(text[i + 1:j]))
+                out.append(code_close)
+                i = j + 1
+                continue
+            out.append('`')
+            i += 1
+            continue
+        
+        # 강조: **strong**
+        if ch == '*' and i + 1 < end and text[i + 1] == '*':
+            j = -1 if no_strong else find('**', i + 2, end)
+            if j == -1:
+                no_strong = True
+            elif j > i + 2:
+                out.append(strong_open)
+                _scan_inline(text, i + 2, j, out, tags)
+                out.append(strong_close)
+                i = j + 2
+                continue
+            # 짝이 없는 '*' 연속은 그대로 출력
+            run_end = i
+            while run_end < end and text[run_end] == '*':
+                run_end += 1
+            out.append(text[i:run_end])
+            i = run_end
+            continue
+        
+        # 기울임: *em* (앞뒤가 '*'가 아닌 단일 '*')
+        if ch == '*':
+            if no_em or (i > start and text[i - 1] == '*'):
+                out.append('*')
+                i += 1
+                continue
+            k = find('*', i + 1, end)
+            while k != -1 and k + 1 < end and text[k + 1] == '*':
+                # '**' 연속은 닫는 기호가 아니므로 건너뜀
+                k += 2
+                while k < end and text[k] == '*':
+                    k += 1
+                k = find('*', k, end)
+            if k == -1:
+                no_em = True
+            elif k > i + 1:
+                out.append(em_open)
+                _scan_inline(text, i + 1, k, out, tags)
+                out.append(em_close)
+                i = k + 1
+                continue
+            out.append('*')
+            i += 1
+            continue
+        
+        # 링크: [text](url)
+        if not no_link:
+            if close_bracket < i:
+                close_bracket = find(']', i + 1, end)
+            j = close_bracket
+            if j == -1:
+                no_link = True
+            elif j > i + 1 and j + 1 < end and text[j + 1] == '(':
+                if close_paren < j + 2:
+                    close_paren = find(')', j + 2, end)
+                k = close_paren
+                if k == -1:
+                    no_link = True
+                elif k > j + 2:
+                    out.append(link_open)
+                    out.append(text[j + 2:k])
+                    out.append(link_href_end)
+                    _scan_inline(text, i + 1, j, out, tags)
+                    out.append(link_close)
+                    i = k + 1
+                    continue
+        out.append('[')
+        i += 1
+
+# ---------------------------------------------------------------------------
+# 빌드 계측 (opt-in)
+# ---------------------------------------------------------------------------
+
+class BuildProfiler:
+    """
+    블록 종류, 인라인 처리, 템플릿 삽입, 파일 읽기/쓰기별 시간과 횟수를 모은다
     
-    return text
+    profiling()으로 켰을 때만 동작하며, 꺼져 있으면 변환 경로에 비용이 없다.
+    블록 시간에는 그 블록 안의 인라인 처리 시간이 포함된다.
+    """
+    
+    def __init__(self):
+        self.totals = {}
+        self.documents = {}
+        self.current = None
+    
+    @staticmethod
+    def _add_to(table, name, seconds, count):
+        stat = table.get(name)
+        if stat is None:
+            table[name] = {"count": count, "seconds": seconds}
+        else:
+            stat["count"] += count
+            stat["seconds"] += seconds
+    
+    def add(self, name, seconds, count=1):
+        """항목 시간 기록 (문서 처리 중이면 문서별 통계에도 기록)"""
+        self._add_to(self.totals, name, seconds, count)
+        if self.current is not None:
+            self._add_to(self.documents[self.current]["items"], name, seconds, count)
+    
+    def timed(self, name, func):
+        """func를 호출할 때마다 name 항목 시간을 기록하는 함수 (모듈 전역 함수는 바꾸지 않음)"""
+        def wrapper(*args):
+            started = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                self.add(name, time.perf_counter() - started)
+        return wrapper
+    
+    def begin_document(self, name):
+        self.current = name
+        self.documents.setdefault(name, {"seconds": 0.0, "items": {}})
+        return time.perf_counter()
+    
+    def end_document(self, started):
+        self.documents[self.current]["seconds"] += time.perf_counter() - started
+        self.current = None
+    
+    def merge(self, report):
+        """다른 프로세스에서 받은 report()를 합침"""
+        for name, stat in report["totals"].items():
+            self._add_to(self.totals, name, stat["seconds"], stat["count"])
+        for doc, data in report["documents"].items():
+            mine = self.documents.setdefault(doc, {"seconds": 0.0, "items": {}})
+            mine["seconds"] += data["seconds"]
+            for name, stat in data["items"].items():
+                self._add_to(mine["items"], name, stat["seconds"], stat["count"])
+    
+    def report(self, top=10):
+        """JSON으로 저장할 수 있는 빌드 리포트"""
+        slowest = sorted(self.documents.items(), key=lambda item: item[1]["seconds"], reverse=True)
+        return {
+            "totals": self.totals,
+            "documents": self.documents,
+            "slowest_documents": [[doc, data["seconds"]] for doc, data in slowest[:top]],
+        }
+
+_profiler = None
+
+@contextlib.contextmanager
+def profiling():
+    """
+    with 블록 안의 변환을 계측 (새 BuildProfiler를 넘겨주고, 끝나면 이전 상태로 되돌림)
+    
+    parse_inline_markdown 등 다른 모듈이 가져다 쓰는 함수는 바꾸지 않는다.
+    인라인 시간은 _iter_markdown_html이 자기 안에서만 감싸서 잰다.
+    """
+    global _profiler
+    previous, _profiler = _profiler, BuildProfiler()
+    try:
+        yield _profiler
+    finally:
+        _profiler = previous
+
+# HTML 조각의 시작 태그 -> 블록 종류
+_BLOCK_KINDS = {
+    '<pre>': 'code',
+    '<table>': 'table', '<thead>': 'table', '<tr>': 'table', '</table>': 'table', '<p class="table-links">': 'table',
+    '<h1>': 'heading', '<h2>': 'heading', '<h3>': 'heading',
+    '<ul>': 'list', '<ol>': 'list', '</ul>': 'list', '</ol>': 'list', '<li>': 'list',
+    '<div class="checklist-item">': 'checklist',
+    '<div class="tip">': 'quote', '<div class="warning">': 'quote', '<blockquote>': 'quote',
+    '<p>': 'paragraph',
+    '<hr>': 'rule',
+}
+
+def _profiled_blocks(fragments):
+    """
+    조각 생성기를 감싸서 블록 종류별 시간을 기록
+    
+    next() 한 번에 걸린 시간 = 이전 조각 이후 이 조각을 만들기까지의 처리 시간
+    (빈 줄, 코드 블록 내부 줄 처리 포함, 소비자가 쓰는 시간은 제외)
+    """
+    profiler = _profiler
+    while True:
+        started = time.perf_counter()
+        fragment = next(fragments, None)
+        if fragment is None:
+            return
+        # 제목은 id 속성이 붙으므로 태그 이름으로 찾음 ('<h2 id="…">' -> '<h2>')
+        kind = _BLOCK_KINDS.get(fragment[:fragment.find('>') + 1]) or _BLOCK_KINDS.get(fragment[:3] + '>', 'section')
+        profiler.add("block:" + kind, time.perf_counter() - started)
+        yield fragment
+
+# ---------------------------------------------------------------------------
+# 코드 블록 하이라이트
+# ---------------------------------------------------------------------------
+
+HIGHLIGHT_CACHE_DIR = os.path.join(BUILD_DIR, "highlight")
+# 하이라이트 HTML 형식을 바꾸면 올림 (디스크 캐시 무효화)
+HIGHLIGHT_VERSION = 1
+
+_highlighter = None
+_highlighter_version = None
+_highlight_memo = {}
+
+def highlighter_version():
+    """
+    하이라이트 결과를 결정하는 라이브러리 버전 ('none'이면 하이라이트 없음)
+    
+    패키지 버전만 확인하고 렉서/포매터는 로드하지 않는다 (캐시만 쓰는 빌드는 로드 비용 없음).
+    """
+    global _highlighter_version
+    if _highlighter_version is None:
+        try:
+            import pygments
+        except ImportError:
+            _highlighter_version = "none"
+        else:
+            _highlighter_version = f"pygments-{pygments.__version__}"
+    return _highlighter_version
+
+def _load_highlighter():
+    """Pygments 렉서/포매터 로드 (캐시에 없는 코드를 처음 하이라이트할 때, 실패하면 False)"""
+    global _highlighter
+    if _highlighter is None:
+        try:
+            from pygments import highlight
+            from pygments.lexers import get_lexer_by_name
+            from pygments.formatters import HtmlFormatter
+            from pygments.util import ClassNotFound
+        except ImportError:
+            _highlighter = False
+        else:
+            _highlighter = (highlight, get_lexer_by_name, HtmlFormatter(nowrap=True), ClassNotFound)
+    return _highlighter
+
+def highlight_code(lang, code):
+    """
+    코드 블록 내용을 <code> 안에 넣을 HTML로 변환
+    
+    Pygments가 있으면 토큰별 <span class="k"> 등으로 감싸고, 없거나 모르는 언어면
+    이스케이프만 한다. 결과는 (언어, 코드 해시)로 프로세스 안에서는 메모리에,
+    실행 사이에는 .build_cache/highlight에 캐시되므로 같은 코드는 한 번만 하이라이트한다.
+    """
+    version = highlighter_version()
+    if version == "none" or not lang or not code:
+        return escape_html(code)
+    started = time.perf_counter() if _profiler is not None else None
+    
+    key = hashlib.sha256(f"{HIGHLIGHT_VERSION}\0{version}\0{lang}\0{code}".encode("utf-8")).hexdigest()
+    html = _highlight_memo.get(key)
+    if html is None:
+        cache_file = os.path.join(HIGHLIGHT_CACHE_DIR, key + ".html")
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                html = f.read()
+        except FileNotFoundError:
+            html = _highlight_uncached(lang, code)
+            os.makedirs(HIGHLIGHT_CACHE_DIR, exist_ok=True)
+            # 병렬 빌드 워커끼리 같은 키를 동시에 쓸 수 있으므로 임시 파일 이름에 PID 포함
+            tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                f.write(html)
+            os.replace(tmp_file, cache_file)
+        _highlight_memo[key] = html
+    
+    if started is not None:
+        _profiler.add("highlight", time.perf_counter() - started)
+    return html
+
+def _highlight_uncached(lang, code):
+    highlighter = _load_highlighter()
+    if not highlighter:
+        return escape_html(code)
+    highlight, get_lexer_by_name, formatter, ClassNotFound = highlighter
+    try:
+        lexer = get_lexer_by_name(lang, stripnl=False, ensurenl=False)
+    except ClassNotFound:
+        return escape_html(code)
+    html = highlight(code, lexer, formatter)
+    # HtmlFormatter는 마지막 줄에 항상 줄바꿈을 붙이므로 원문에 없으면 제거
+    if html.endswith('\n') and not code.endswith('\n'):
+        html = html[:-1]
+    return html
+
+_ORDERED_ITEM = re.compile(r'^\d+\.\s+')
+_STRONG_MARKUP = re.compile(r'\*\*(.+?)\*\*')
+
+def _lines_with_next(lines):
+    """(줄 번호, 줄, 다음 줄) 순서로 돌려줌 (파일 핸들도 한 줄씩 처리)"""
+    it = iter(lines)
+    line = next(it, None)
+    index = 0
+    while line is not None:
+        next_line = next(it, None)
+        yield index, line.rstrip('\n'), next_line
+        index += 1
+        line = next_line
+
+def iter_markdown_html(lines, source=None):
+    """
+    마크다운 줄을 하나씩 읽어 HTML 조각을 생성하는 제너레이터
+    
+    Args:
+        lines: 줄 단위 이터러블 (파일 핸들 또는 문자열 리스트)
+        source: 마크다운 파일 경로 (include 지시문의 데이터 파일 기준 폴더)
+    
+    문서 전체를 메모리에 올리지 않으며, 최대 메모리는 가장 큰 코드 블록 하나 크기다.
+    include한 CSV/TSV 표도 한 행씩 읽어 행 단위 조각으로 내보낸다.
+    """
+    fragments = _iter_markdown_html(lines, source)
+    return fragments if _profiler is None else _profiled_blocks(fragments)
+
+def _iter_markdown_html(lines, source=None):
+    """블록 이벤트를 다크 테마 HTML 조각으로 변환"""
+    inline = parse_inline_markdown if _profiler is None else _profiler.timed("inline", parse_inline_markdown)
+    aligns = ()
+    slugs = {}
+    for event in iter_block_events(lines, source):
+        kind = event[0]
+        if kind == 'table_row':
+            yield table_row_html(event[1], event[2], event[3], aligns, inline)
+        elif kind == 'item':
+            yield f'<li>{inline(event[1])}</li>'
+        elif kind == 'paragraph':
+            yield f'<p>{inline(event[1])}</p>'
+        elif kind == 'heading':
+            level = event[1]
+            text = inline(event[2])
+            yield f'<h{level} id="{heading_slug(text, slugs)}">{text}</h{level}>'
+        elif kind == 'code':
+            yield f'<pre><code class="language-{event[1]}">{highlight_code(event[1], event[2])}</code></pre>'
+        elif kind == 'list_open':
+            yield f'<{event[1]}>'
+        elif kind == 'list_close':
+            yield f'</{event[1]}>'
+        elif kind == 'check':
+            checked = 'checked' if event[1] else ''
+            yield f'<div class="checklist-item"><input type="checkbox" {checked}><label>{inline(event[2])}</label></div>'
+        elif kind == 'quote':
+            if event[1] == 'quote':
+                yield f'<blockquote>{inline(event[2])}</blockquote>'
+            else:
+                yield f'<div class="{event[1]}"><strong>{inline(event[2])}</strong></div>'
+        elif kind == 'rule':
+            yield '<hr>'
+        elif kind == 'section_open':
+            yield f'<div class="{event[1]}">'
+        elif kind == 'section_close':
+            yield '</div>'
+        elif kind == 'table_open':
+            aligns = event[1]
+            yield '<table>'
+        elif kind == 'table_close':
+            yield '</table>'
+        elif kind == 'table_links':
+            yield table_links_html(event[1])
+
+_HTML_TAG = re.compile(r'<[^>]+>')
+
+def heading_slug(inline_html, seen):
+    """
+    제목 앵커 id (GitHub 방식이라 문서 안 목차 링크 '#31-주석' 등과 맞음)
+    
+    소문자로 바꾸고 글자/숫자/'_'/'-' 외의 문자를 지운 뒤 공백을 '-'로 바꾼다.
+    같은 문서에서 겹치면 -1, -2 …를 붙인다 (seen: 문서별 사용한 id -> 번호).
+    """
+    text = unescape(_HTML_TAG.sub('', inline_html)).lower()
+    slug = ''.join(
+        '-' if ch == ' ' else ch for ch in text
+        if ch in ' -_' or unicodedata.category(ch)[0] in 'LNM'
+    )
+    result = slug
+    while result in seen:
+        seen[slug] += 1
+        result = f"{slug}-{seen[slug]}"
+    seen[result] = 0
+    return result
+
+def table_row_html(header, cells, literal, aligns, inline=parse_inline_markdown):
+    """표 한 행 (literal=True면 CSV 값이므로 인라인 마크다운 없이 이스케이프만)"""
+    tag = 'th' if header else 'td'
+    render = escape_html if literal else inline
+    out = []
+    for cell, align in zip(cells, aligns):
+        style = f' style="text-align: {align}"' if align else ''
+        out.append(f'<{tag}{style}>{render(cell)}</{tag}>')
+    row = f'<tr>{"".join(out)}</tr>'
+    return f'<thead>{row}</thead>' if header else row
+
+def table_links_html(links):
+    """표 아래 링크 줄 (전체 데이터, 다른 쪽)"""
+    return '<p class="table-links">' + ' · '.join(f'<a href="{href}">{label}</a>' for href, label in links) + '</p>'
+
+# ---------------------------------------------------------------------------
+# 표 (GFM 파이프 표, CSV/TSV 포함 지시문)
+# ---------------------------------------------------------------------------
+
+_TABLE_DELIMITER = re.compile(r'^\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?$')
+_TABLE_PIPE = re.compile(r'(?<!\\)\|')
+_INCLUDE = re.compile(r'^<!--\s*include:\s*(\S+)((?:\s+\w+=\S+)*)\s*-->$')
+INCLUDE_OPTIONS = ("limit", "page", "delimiter")
+_DELIMITERS = {"comma": ",", "tab": "\t", "semicolon": ";", "pipe": "|"}
 
-def parse_markdown_to_html(md_content):
-    """마크다운 내용을 HTML로 변환"""
-    html_parts = []
-    lines = md_content.split('\n')
-    i = 0
+def split_table_row(row):
+    """'| a | b |' -> ['a', 'b'] ('\\|'는 칸 안의 '|')"""
+    row = row.strip()
+    if row.startswith('|'):
+        row = row[1:]
+    if row.endswith('|') and not row.endswith('\\|'):
+        row = row[:-1]
+    return [cell.strip().replace('\\|', '|') for cell in _TABLE_PIPE.split(row)]
+
+def table_aligns(delimiter_row):
+    """구분선 줄의 열 정렬 -> ('left' | 'center' | 'right' | None, ...)"""
+    aligns = []
+    for cell in split_table_row(delimiter_row):
+        if cell.startswith(':') and cell.endswith(':'):
+            aligns.append('center')
+        elif cell.endswith(':'):
+            aligns.append('right')
+        elif cell.startswith(':'):
+            aligns.append('left')
+        else:
+            aligns.append(None)
+    return tuple(aligns)
+
+def parse_include(stripped):
+    """
+    표 포함 지시문 해석
+    
+        <!-- include: data/sales.csv limit=20 -->
+        <!-- include: scores.tsv page=100 -->
+    
+    Returns:
+        (마크다운 파일 기준 상대 경로, 옵션 딕셔너리) 또는 None (지시문이 아니면)
+    """
+    match = _INCLUDE.match(stripped)
+    if match is None:
+        return None
+    options = {}
+    for item in match.group(2).split():
+        name, value = item.split('=', 1)
+        if name not in INCLUDE_OPTIONS:
+            raise ValueError(f"알 수 없는 include 옵션: {name} (사용 가능: {', '.join(INCLUDE_OPTIONS)})")
+        if name == "delimiter":
+            options[name] = _DELIMITERS.get(value, value)
+        elif not value.isdigit() or int(value) < 1:
+            raise ValueError(f"include 옵션 {name}은 1 이상의 정수여야 합니다: {value}")
+        else:
+            options[name] = int(value)
+    return match.group(1), options
+
+def include_path(source, target):
+    """포함할 파일의 절대 경로 (마크다운 파일 폴더 기준, source가 없으면 현재 폴더 기준)"""
+    base_dir = os.path.dirname(os.path.abspath(source)) if source else os.getcwd()
+    return os.path.normpath(os.path.join(base_dir, target))
+
+def _open_table(path, options):
+    """CSV/TSV 파일을 열어 (파일, csv.reader) 반환 (확장자가 .tsv/.tab이면 탭 구분)"""
+    delimiter = options.get("delimiter")
+    if delimiter is None:
+        delimiter = '\t' if path.lower().endswith(('.tsv', '.tab')) else ','
+    f = open(path, "r", encoding="utf-8-sig", newline='')
+    return f, csv.reader(f, delimiter=delimiter)
+
+def table_page_name(source, target, number):
+    """page 옵션으로 나눈 표의 number번째 쪽 파일 이름 (<문서>.<데이터 파일>.p<번호>.html)"""
+    stem = os.path.splitext(os.path.basename(source))[0]
+    data_stem = os.path.splitext(os.path.basename(target))[0]
+    return f"{stem}.{data_stem}.p{number}.html"
+
+def _page_label(number, page_size, total):
+    first = (number - 1) * page_size + 1
+    return f"{first}–{min(number * page_size, total)}행"
+
+def iter_include_events(target, options, source=None):
+    """
+    CSV/TSV 파일을 표 이벤트로 변환 (한 행씩 읽어 바로 내보냄)
+    
+    첫 행은 머리글이다. limit=N이면 N행까지만 넣고 전체 파일 링크를, page=N이면 첫 쪽(N행)만
+    넣고 나머지 쪽 파일(write_table_pages가 만듦) 링크를 붙인다. 남은 행은 개수만 센다.
+    """
+    if "page" in options and source is None:
+        raise ValueError("include의 page 옵션은 파일을 변환할 때만 사용할 수 있습니다")
+    path = include_path(source, target)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"include 파일을 찾을 수 없습니다: {target}")
+    shown = options.get("page") or options.get("limit")
+    f, reader = _open_table(path, options)
+    with f:
+        header = next(reader, None)
+        if header is None:
+            return
+        columns = len(header)
+        yield ('table_open', (None,) * columns)
+        yield ('table_row', True, header, True)
+        total = 0
+        for row in reader:
+            total += 1
+            if shown is None or total <= shown:
+                yield ('table_row', False, _fit_row(row, columns), True)
+        yield ('table_close',)
+    
+    if shown is None or total <= shown:
+        return
+    if "page" in options:
+        pages = -(-total // shown)
+        yield ('table_links', [
+            (table_page_name(source, target, number), _page_label(number, shown, total))
+            for number in range(2, pages + 1)
+        ])
+    else:
+        href = target.replace(os.sep, '/')
+        yield ('table_links', [(href, f"전체 {total}행 보기 ({os.path.basename(target)})")])
+
+def _fit_row(cells, columns):
+    """머리글 열 수에 맞춤 (모자라면 빈 칸, 넘치면 버림)"""
+    if len(cells) < columns:
+        return cells + [''] * (columns - len(cells))
+    return cells[:columns]
+
+def iter_includes(lines):
+    """코드 블록 밖의 include 지시문 -> (상대 경로, 옵션) 이터레이터"""
+    in_code_block = False
+    for line in lines:
+        if line.startswith('```'):
+            in_code_block = not in_code_block
+        elif not in_code_block:
+            stripped = line.strip()
+            if stripped.startswith('<!--'):
+                include = parse_include(stripped)
+                if include is not None:
+                    yield include
+
+def include_stamps(md_file, lines):
+    """포함한 데이터 파일의 {저장소 기준 경로: [크기, 수정 시각]} (증분 빌드 의존성)"""
+    stamps = {}
+    for target, _ in iter_includes(lines):
+        path = include_path(md_file, target)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            continue
+        stamps[manifest_key(path)] = [st.st_size, st.st_mtime_ns]
+    return stamps
+
+def _includes_unchanged(entry):
+    for key, stamp in entry.get("includes", {}).items():
+        try:
+            st = os.stat(os.path.join(BASE_DIR, key))
+        except FileNotFoundError:
+            return False
+        if [st.st_size, st.st_mtime_ns] != stamp:
+            return False
+    return True
+
+def write_table_pages(md_file, html_file, template, lines, minify=False):
+    """
+    page 옵션이 있는 include 표의 2쪽부터를 별도 HTML 파일로 저장
+    
+    데이터 파일을 두 번 훑는다 (행 수 세기, 쪽 쓰기). 메모리에는 한 쪽 분량의 행만 둔다.
+    더 이상 만들지 않는 예전 쪽 파일은 build_file이 매니페스트 기록을 보고 지운다.
+    
+    Returns:
+        (이번에 만든 쪽 파일 이름 목록, 그중 새로 쓴 파일 목록)
+    """
+    pages = []
+    written = []
+    out_dir = os.path.dirname(os.path.abspath(html_file))
+    title = extract_title(lines)
+    for target, options in iter_includes(lines):
+        page_size = options.get("page")
+        if page_size is None:
+            continue
+        path = include_path(md_file, target)
+        f, reader = _open_table(path, options)
+        with f:
+            next(reader, None)
+            total = sum(1 for _ in reader)
+        page_count = -(-total // page_size)
+        links = [(os.path.basename(html_file), "1쪽 (본문)")] + [
+            (table_page_name(md_file, target, number), _page_label(number, page_size, total))
+            for number in range(2, page_count + 1)
+        ]
+        
+        f, reader = _open_table(path, options)
+        with f:
+            header = next(reader, None) or []
+            columns = len(header)
+            aligns = (None,) * columns
+            for _ in range(page_size):
+                next(reader, None)
+            for number in range(2, page_count + 1):
+                fragments = [table_links_html(links), '<table>', table_row_html(True, header, True, aligns)]
+                for _ in range(page_size):
+                    row = next(reader, None)
+                    if row is None:
+                        break
+                    fragments.append(table_row_html(False, _fit_row(row, columns), True, aligns))
+                fragments += ['</table>', table_links_html(links)]
+                page_title = f"{title} - {os.path.basename(target)} ({_page_label(number, page_size, total)})"
+                html_output = template.render(page_title, '\n    '.join(fragments))
+                name = table_page_name(md_file, target, number)
+                pages.append(name)
+                if write_if_changed(os.path.join(out_dir, name), minify_html(html_output) if minify else html_output):
+                    written.append(name)
+    return pages, written
+
+def iter_block_events(lines, source=None):
+    """
+    마크다운 줄을 블록 이벤트 튜플로 변환 (HTML 렌더러와 md_ast가 공유하는 파서)
+    
+    이벤트 종류:
+        ('heading', 레벨, 원문)          ('paragraph', 원문)
+        ('list_open', 'ul'|'ol')         ('item', 원문)       ('list_close', 'ul'|'ol')
+        ('check', 체크 여부, 원문)        ('code', 언어, 코드)
+        ('quote', 'tip'|'warning'|'quote', 원문)
+        ('section_open', 'summary'|'checklist')  ('section_close',)  ('rule',)
+        ('table_open', 열 정렬)          ('table_row', 머리글 여부, [칸 원문], CSV 값 여부)
+        ('table_close',)                 ('table_links', [(주소, 이름)])
+    
+    원문은 인라인 마크다운이 처리되지 않은 텍스트다. section_close는 가장 안쪽 섹션을 닫는다.
+    source는 마크다운 파일 경로로, include 지시문의 데이터 파일을 찾는 기준이다.
+    """
     in_code_block = False
     code_block_lang = ''
     code_block_content = []
     in_list = False
     list_type = 'ul'
-    in_table = False
-    table_rows = []
     in_summary = False
     in_checklist = False
+    in_table = False
+    table_columns = 0
+    skip_delimiter = False
     
-    while i < len(lines):
-        line = lines[i]
+    for index, line, next_line in _lines_with_next(lines):
         stripped = line.strip()
         
         # 코드 블록 처리
         if line.startswith('```'):
             if in_code_block:
                 # 코드 블록 종료
-                code_content = '\n'.join(code_block_content)
-                html_parts.append(f'<pre><code class="language-{code_block_lang}">{escape_html(code_content)}</code></pre>')
+                yield ('code', code_block_lang, '\n'.join(code_block_content))
                 code_block_content = []
                 in_code_block = False
                 code_block_lang = ''
             else:
                 # 코드 블록 시작
+                if in_table:
+                    yield ('table_close',)
+                    in_table = False
                 in_code_block = True
                 code_block_lang = line[3:].strip() or 'text'
-            i += 1
             continue
         
         if in_code_block:
             code_block_content.append(line)
-            i += 1
             continue
         
-        # 리스트 종료 처리
-        if in_list and not (stripped.startswith('- ') or re.match(r'^\d+\.\s+', stripped) or not stripped):
-            html_parts.append(f'</{list_type}>')
+        # 표 행 (구분선 줄은 건너뛰고, '|'가 없는 줄이나 빈 줄에서 표를 닫음)
+        if in_table:
+            if skip_delimiter:
+                skip_delimiter = False
+                continue
+            if stripped and '|' in stripped:
+                yield ('table_row', False, _fit_row(split_table_row(stripped), table_columns), False)
+                continue
+            yield ('table_close',)
+            in_table = False
+        
+        is_check = stripped.startswith('- [ ]') or stripped.startswith('- [x]') or stripped.startswith('- [X]')
+        
+        # 리스트 종료 처리 (체크리스트 항목도 일반 리스트를 닫음)
+        if in_list and not ((stripped.startswith('- ') and not is_check) or _ORDERED_ITEM.match(stripped) or not stripped):
+            yield ('list_close', list_type)
             in_list = False
             list_type = 'ul'
         
+        # 표 시작: 머리글 줄 다음 줄이 열 수가 같은 구분선(|---|:---:|)이면 GFM 표
+        if '|' in stripped and next_line is not None and _TABLE_DELIMITER.match(next_line.strip()):
+            header = split_table_row(stripped)
+            aligns = table_aligns(next_line.strip())
+            if len(header) == len(aligns):
+                yield ('table_open', aligns)
+                yield ('table_row', True, header, False)
+                in_table = True
+                table_columns = len(aligns)
+                skip_delimiter = True
+                continue
+        
+        # CSV/TSV 표 포함 지시문
+        if stripped.startswith('<!--'):
+            include = parse_include(stripped)
+            if include is not None:
+                yield from iter_include_events(include[0], include[1], source)
+                continue
+        
         # 제목 처리 (목차 섹션 제외)
         if stripped.startswith('# '):
-            if i > 0:  # 첫 번째 제목이 아니면
-                html_parts.append(f'<h1>{parse_inline_markdown(stripped[2:])}</h1>')
-            i += 1
+            if index > 0:  # 첫 번째 제목이 아니면
+                yield ('heading', 1, stripped[2:])
             continue
         elif stripped.startswith('## '):
             # 요약 섹션 체크
             if '요약' in stripped or '정리' in stripped:
                 if in_summary:
-                    html_parts.append('</div>')
-                html_parts.append('<div class="summary">')
+                    yield ('section_close',)
+                yield ('section_open', 'summary')
                 in_summary = True
             # 체크리스트 섹션 체크
             elif '체크리스트' in stripped or '✅' in stripped:
                 if in_checklist:
-                    html_parts.append('</div>')
-                html_parts.append('<div class="checklist">')
+                    yield ('section_close',)
+                yield ('section_open', 'checklist')
                 in_checklist = True
             
-            html_parts.append(f'<h2>{parse_inline_markdown(stripped[3:])}</h2>')
-            i += 1
+            yield ('heading', 2, stripped[3:])
             continue
         elif stripped.startswith('### '):
-            html_parts.append(f'<h3>{parse_inline_markdown(stripped[4:])}</h3>')
-            i += 1
+            yield ('heading', 3, stripped[4:])
             continue
         
         # 구분선 (체크리스트나 요약 섹션 안에서는 닫기)
         if stripped == '---':
             if in_checklist:
-                html_parts.append('</div>')
+                yield ('section_close',)
                 in_checklist = False
             if in_summary:
-                html_parts.append('</div>')
+                yield ('section_close',)
                 in_summary = False
-            html_parts.append('<hr>')
-            i += 1
+            yield ('rule',)
             continue
         
         # 체크리스트 항목
-        if stripped.startswith('- [ ]') or stripped.startswith('- [x]') or stripped.startswith('- [X]'):
+        if is_check:
             if not in_checklist:
-                html_parts.append('<div class="checklist">')
+                yield ('section_open', 'checklist')
                 in_checklist = True
-            checked = 'checked' if stripped[3:5] in ['[x', '[X'] else ''
-            content = stripped[5:].strip()
-            html_parts.append(f'<div class="checklist-item"><input type="checkbox" {checked}><label>{parse_inline_markdown(content)}</label></div>')
-            i += 1
+            yield ('check', stripped[3:5] in ['[x', '[X'], stripped[5:].strip())
             continue
         
         # 리스트 처리
         if stripped.startswith('- '):
             if not in_list:
-                html_parts.append('<ul>')
+                yield ('list_open', 'ul')
                 in_list = True
                 list_type = 'ul'
-            content = stripped[2:]
-            html_parts.append(f'<li>{parse_inline_markdown(content)}</li>')
-            i += 1
+            yield ('item', stripped[2:])
             continue
-        elif re.match(r'^\d+\.\s+', stripped):
+        elif _ORDERED_ITEM.match(stripped):
             if not in_list or list_type != 'ol':
                 if in_list:
-                    html_parts.append(f'</{list_type}>')
-                html_parts.append('<ol>')
+                    yield ('list_close', list_type)
+                yield ('list_open', 'ol')
                 in_list = True
                 list_type = 'ol'
-            content = re.sub(r'^\d+\.\s+', '', stripped)
-            html_parts.append(f'<li>{parse_inline_markdown(content)}</li>')
-            i += 1
+            yield ('item', _ORDERED_ITEM.sub('', stripped))
             continue
         
         # 코드 블록이 리스트 안에 있는지 확인 (다음 줄이 코드 블록이면 리스트 종료)
-        if in_list and i < len(lines) - 1:
-            next_line = lines[i + 1].strip()
-            if next_line.startswith('```'):
-                html_parts.append(f'</{list_type}>')
+        if in_list and next_line is not None:
+            if next_line.strip().startswith('```'):
+                yield ('list_close', list_type)
                 in_list = False
                 list_type = 'ul'
         
@@ -167,90 +870,1120 @@ def parse_markdown_to_html(md_content):
             # Tip, Warning 등 특수 처리
             if '💡' in content or 'Tip' in content:
                 # 중첩 strong 태그 방지
-                clean_content = re.sub(r'\*\*(.+?)\*\*', r'\1', content)
-                html_parts.append(f'<div class="tip"><strong>{parse_inline_markdown(clean_content)}</strong></div>')
+                yield ('quote', 'tip', _STRONG_MARKUP.sub(r'\1', content))
             elif '⚠️' in content or 'Warning' in content:
-                clean_content = re.sub(r'\*\*(.+?)\*\*', r'\1', content)
-                html_parts.append(f'<div class="warning"><strong>{parse_inline_markdown(clean_content)}</strong></div>')
+                yield ('quote', 'warning', _STRONG_MARKUP.sub(r'\1', content))
             else:
-                html_parts.append(f'<blockquote>{parse_inline_markdown(content)}</blockquote>')
-            i += 1
+                yield ('quote', 'quote', content)
             continue
         
         # 빈 줄
         if not stripped:
-            i += 1
             continue
         
         # 일반 문단
-        if stripped:
-            parsed = parse_inline_markdown(line)
-            html_parts.append(f'<p>{parsed}</p>')
-        
-        i += 1
+        yield ('paragraph', line)
     
-    # 리스트가 끝나지 않은 경우
+    # 표나 리스트가 끝나지 않은 경우
+    if in_table:
+        yield ('table_close',)
     if in_list:
-        html_parts.append(f'</{list_type}>')
+        yield ('list_close', list_type)
     
     # 섹션이 끝나지 않은 경우
     if in_summary:
-        html_parts.append('</div>')
+        yield ('section_close',)
     if in_checklist:
-        html_parts.append('</div>')
+        yield ('section_close',)
+
+def iter_code_blocks(lines):
+    """
+    펜스 코드 블록만 뽑는 제너레이터 (iter_block_events와 같은 펜스 규칙)
     
-    return '\n    '.join(html_parts)
+    Returns:
+        (코드 첫 줄 번호(1부터), 언어, 코드) 튜플 이터레이터
+        닫히지 않은 코드 블록은 iter_block_events처럼 버린다.
+    """
+    in_code_block = False
+    for index, line in enumerate(lines):
+        line = line.rstrip('\n')
+        if line.startswith('```'):
+            if in_code_block:
+                yield start, lang, '\n'.join(content)
+                in_code_block = False
+            else:
+                in_code_block = True
+                lang = line[3:].strip() or 'text'
+                start = index + 2
+                content = []
+        elif in_code_block:
+            content.append(line)
 
-def markdown_to_html(md_file, html_file):
-    """마크다운 파일을 HTML로 변환"""
+def parse_markdown_to_html(md_content, source=None):
+    """마크다운 내용을 HTML로 변환 (source: include 지시문 기준이 되는 마크다운 파일 경로)"""
+    return '\n    '.join(iter_markdown_html(md_content.split('\n'), source))
+
+_TITLE_LINE = re.compile(r'^#\s+(.+)$')
+
+def extract_title(lines):
+    """첫 번째 '# 제목' 줄에서 제목 추출"""
+    for line in lines:
+        title_match = _TITLE_LINE.match(line.rstrip('\n'))
+        if title_match:
+            return title_match.group(1)
+    return "제목 없음"
+
+# ---------------------------------------------------------------------------
+# 컴파일된 템플릿
+# ---------------------------------------------------------------------------
+
+TITLE_PLACEHOLDER = "제목을 여기에 입력"
+
+class CompiledTemplate:
+    """
+    슬롯(title, body, footer) 위치를 미리 계산해 둔 HTML 템플릿
+    
+    로드할 때 한 번만 분석하고, 렌더링은 고정 조각과 슬롯 값을 이어 붙이기만 한다.
+    """
+    SLOTS = ("title", "body", "footer")
+    _STYLE = re.compile(r'[ \t]*<style>(.*?)</style>', re.DOTALL)
+    _CONTAINER = re.compile(r'<div class="container">\s*<h1>[^<]*</h1>.*?(?=<div class="footer">)', re.DOTALL)
+    _FOOTER = re.compile(r'<div class="footer">(.*?)</div>', re.DOTALL)
+    
+    def __init__(self, source):
+        self.source = source
+        self.digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        self._pieces = self._compile(source)
+        self._body_index = self._pieces.index("body")
+        self._linked = {}
+    
+    def _compile(self, source):
+        """템플릿을 [고정 문자열, 슬롯 이름, ...] 목록으로 분해하고 슬롯 위치 검증"""
+        head_title = source.find(f"<title>{TITLE_PLACEHOLDER}</title>")
+        container = self._CONTAINER.search(source)
+        footer = self._FOOTER.search(source, container.end()) if container else None
+        if head_title == -1:
+            raise ValueError(f"템플릿에 <title>{TITLE_PLACEHOLDER}</title> 슬롯이 없습니다")
+        if container is None:
+            raise ValueError('템플릿에 <div class="container"><h1>…</h1> 본문 슬롯이 없습니다')
+        if footer is None:
+            raise ValueError('템플릿에서 본문 뒤에 <div class="footer"> 슬롯을 찾을 수 없습니다')
+        if not head_title < container.start():
+            raise ValueError("템플릿의 <title> 슬롯이 본문 슬롯보다 뒤에 있습니다")
+        
+        title_start = head_title + len("<title>")
+        self.default_footer = footer.group(1)
+        return [
+            source[:title_start], "title",
+            source[title_start + len(TITLE_PLACEHOLDER):container.start()]
+            + '<div class="container">\n    <h1>', "title",
+            '</h1>\n    \n    <div class="section-box">\n    ', "body",
+            '\n    </div>\n    \n    <div class="footer">', "footer",
+            source[footer.end(1):],
+        ]
+    
+    def _fill(self, pieces, title, footer):
+        values = {"title": title, "footer": self.default_footer if footer is None else footer}
+        return ''.join(values.get(piece, piece) if i % 2 else piece for i, piece in enumerate(pieces))
+    
+    def render(self, title, body, footer=None):
+        """슬롯 값을 채워 완성된 HTML 반환"""
+        return self.header(title) + body + self.trailer(footer)
     
-    # HTML 템플릿 읽기
-    template_path = os.path.join(os.path.dirname(__file__), "templates", "html_style_template.html")
-    with open(template_path, "r", encoding="utf-8") as f:
-        html_template = f.read()
+    def header(self, title):
+        """본문 슬롯 앞부분 (스트리밍 출력용)"""
+        return self._fill(self._pieces[:self._body_index], title, None)
+    
+    def trailer(self, footer=None):
+        """본문 슬롯 뒷부분 (스트리밍 출력용)"""
+        return self._fill(self._pieces[self._body_index + 1:], None, footer)
+    
+    def stylesheet(self):
+        """<style> 블록을 압축한 CSS와 내용 해시가 들어간 파일 이름 -> (이름, CSS)"""
+        style = self._STYLE.search(self.source)
+        if style is None:
+            raise ValueError("템플릿에 <style> 블록이 없습니다")
+        css = minify_css(style.group(1))
+        return f"style.{hashlib.sha256(css.encode('utf-8')).hexdigest()[:12]}.css", css
+    
+    def linked(self, href):
+        """<style> 블록 대신 href 스타일시트를 연결하는 템플릿 (href별로 캐시)"""
+        template = self._linked.get(href)
+        if template is None:
+            style = self._STYLE.search(self.source)
+            if style is None:
+                raise ValueError("템플릿에 <style> 블록이 없습니다")
+            source = self.source[:style.start()] + f'  <link rel="stylesheet" href="{href}">' + self.source[style.end():]
+            template = self._linked[href] = CompiledTemplate(source)
+        return template
+
+# ---------------------------------------------------------------------------
+# 출력 압축 (--minify)
+# ---------------------------------------------------------------------------
+
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+_CSS_SPACE = re.compile(r'\s*([{}:;,>])\s*')
+_HTML_COMMENT = re.compile(r'<!--.*?-->', re.DOTALL)
+_PRE_BLOCK = re.compile(r'(<pre\b.*?</pre>)', re.DOTALL)
+_STYLE_BLOCK = re.compile(r'(<style>)(.*?)(</style>)', re.DOTALL)
+_BLOCK_TAG_SPACE = re.compile(
+    r'\s*(</?(?:html|head|body|meta|title|link|style|div|p|h[1-6]|ul|ol|li|pre|hr|blockquote|table|thead|tbody|tr|th|td)\b[^>]*>)\s*')
+_TAG_TRAILING_SPACE = re.compile(r'(<[a-zA-Z][^<>]*?)\s+>')
+
+def minify_css(css):
+    """CSS 주석과 불필요한 공백 제거"""
+    css = _CSS_COMMENT.sub('', css)
+    css = _CSS_SPACE.sub(r'\1', ' '.join(css.split()))
+    return css.replace(';}', '}').strip()
+
+def minify_html(html):
+    """
+    HTML 공백 압축
+    
+    블록 태그 앞뒤 공백(본문 조각을 잇는 '\n    ' 포함)과 주석을 지우고, 나머지 연속 공백은
+    한 칸으로 줄인다. 인라인 태그 사이 공백은 보이는 글자이므로 남기고,
+    <pre> 안의 코드와 태그 속성 값은 그대로 둔다.
+    """
+    parts = _PRE_BLOCK.split(_HTML_COMMENT.sub('', html))
+    for i in range(0, len(parts), 2):
+        part = _STYLE_BLOCK.sub(lambda m: m.group(1) + minify_css(m.group(2)) + m.group(3), parts[i])
+        part = ' '.join(part.split())
+        part = _BLOCK_TAG_SPACE.sub(r'\1', part)
+        parts[i] = _TAG_TRAILING_SPACE.sub(r'\1>', part)
+    return ''.join(parts)
+
+_template_cache = {}
+
+def load_template(path=TEMPLATE_PATH):
+    """
+    컴파일된 템플릿 반환 (파일이 바뀌지 않았으면 캐시 재사용)
+    
+    stat 한 번으로 변경 여부를 확인하므로 watch 모드에서도 템플릿 수정이 반영된다.
+    """
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _template_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    with open(path, "r", encoding="utf-8") as f:
+        template = CompiledTemplate(f.read())
+    _template_cache[path] = (key, template)
+    return template
+
+def page_template(html_file, shared_css=False):
+    """
+    출력 파일에 쓸 템플릿
+    
+    shared_css=True면 CSS를 페이지에 넣는 대신 assets/의 공용 스타일시트를 연결한다
+    (출력 파일 위치 기준 상대 경로).
+    """
+    template = load_template()
+    if not shared_css:
+        return template
+    css_path = os.path.join(ASSETS_DIR, template.stylesheet()[0])
+    href = os.path.relpath(css_path, os.path.dirname(os.path.abspath(html_file))).replace(os.sep, "/")
+    return template.linked(href)
+
+def write_stylesheet(template=None):
+    """공용 스타일시트를 assets/에 쓰고 이전 해시의 파일은 삭제 -> 파일 경로"""
+    if template is None:
+        template = load_template()
+    name, css = template.stylesheet()
+    os.makedirs(ASSETS_DIR, exist_ok=True)
+    write_if_changed(os.path.join(ASSETS_DIR, name), css)
+    for old in os.listdir(ASSETS_DIR):
+        if old.startswith("style.") and old.endswith(".css") and old != name:
+            os.remove(os.path.join(ASSETS_DIR, old))
+    return os.path.join(ASSETS_DIR, name)
+
+def output_digest(shared_css=False, minify=False, split_sections=False):
+    """템플릿 + 출력 모드 해시 (매니페스트에서 템플릿 의존성으로 사용)"""
+    digest = load_template().digest
+    if not (shared_css or minify or split_sections):
+        return digest
+    mode = f"shared_css={shared_css}\0minify={minify}"
+    if split_sections:
+        mode += f"\0split_sections={SPLIT_MIN_BYTES}"
+    return hashlib.sha256(f"{digest}\0{mode}".encode()).hexdigest()
+
+def render_markdown_file(md_file, md_bytes=None, template=None, minify=False):
+    """마크다운 파일을 완성된 HTML 문자열로 변환 (minify=True면 공백 압축)"""
+    if template is None:
+        template = load_template()
     
     # 마크다운 파일 읽기
-    with open(md_file, "r", encoding="utf-8") as f:
-        md_content = f.read()
+    if md_bytes is None:
+        with open(md_file, "rb") as f:
+            md_bytes = f.read()
+    lines = md_bytes.decode("utf-8").split('\n')
     
-    # 제목 추출 (첫 번째 # 제목)
-    title_match = re.search(r'^#\s+(.+)$', md_content, re.MULTILINE)
-    title = title_match.group(1) if title_match else "제목 없음"
+    # 제목 추출 (첫 번째 # 제목) 후 본문을 변환해 템플릿에 삽입
+    title = extract_title(lines)
+    body = '\n    '.join(iter_markdown_html(lines, md_file))
+    if _profiler is None:
+        html_output = template.render(title, body)
+        return minify_html(html_output) if minify else html_output
+    started = time.perf_counter()
+    html_output = template.render(title, body)
+    _profiler.add("template", time.perf_counter() - started)
+    if minify:
+        started = time.perf_counter()
+        html_output = minify_html(html_output)
+        _profiler.add("minify", time.perf_counter() - started)
+    return html_output
+
+def stream_markdown_file(md_file, html_file, template=None):
+    """
+    마크다운 파일을 한 줄씩 읽으면서 HTML을 바로 출력 파일에 쓴다 (--stream)
     
-    # 마크다운을 HTML로 변환
-    body_content = parse_markdown_to_html(md_content)
+    여러 챕터를 합친 대용량 문서용. 문서 전체 문자열이나 조각 리스트를 만들지 않으며,
+    출력 바이트는 render_markdown_file(minify=False)과 같다. 임시 파일에 쓴 뒤 기존 출력과
+    내용이 다를 때만 교체하고, 링크 그래프용 앵커와 링크는 조각마다 모은다.
     
-    # 템플릿에 내용 삽입
-    html_output = html_template.replace("제목을 여기에 입력", title)
+    Returns:
+        (새로 썼는지 여부, 앵커 목록, 링크 목록)
+    """
+    if template is None:
+        template = load_template()
+    anchors = []
+    links = []
+    tmp_file = f"{html_file}.{os.getpid()}.tmp"
+    # newline='': '\r\n' 줄도 split('\n')과 같은 줄이 되도록 줄바꿈 변환 없이 읽고 씀
+    with open(md_file, "r", encoding="utf-8", newline='') as src, \
+         open(tmp_file, "w", encoding="utf-8", newline='') as out:
+        
+        def emit(text):
+            out.write(text)
+            anchors.extend(_ANCHOR_ID.findall(text))
+            links.extend(_LINK_HREF.findall(text))
+        
+        title = extract_title(src)
+        src.seek(0)
+        emit(template.header(title))
+        separator = ''
+        for chunk in iter_markdown_html(src, md_file):
+            out.write(separator)
+            emit(chunk)
+            separator = '\n    '
+        emit(template.trailer())
     
-    # 기존 컨테이너 내용 교체
-    pattern = r'<div class="container">\s*<h1>[^<]+</h1>.*?<div class="footer">'
-    replacement = f'<div class="container">\n    <h1>{title}</h1>\n    \n    <div class="section-box">\n    {body_content}\n    </div>\n    \n    <div class="footer">'
+    import filecmp
+    if os.path.exists(html_file) and filecmp.cmp(tmp_file, html_file, shallow=False):
+        os.remove(tmp_file)
+        return False, anchors, list(dict.fromkeys(links))
+    os.replace(tmp_file, html_file)
+    return True, anchors, list(dict.fromkeys(links))
+
+def _scan_source(md_file):
+    """소스를 한 줄씩 읽어 (내용 해시, include 지시문 포함 여부) 계산 (--stream)"""
+    h = hashlib.sha256()
+    has_include = False
+    with open(md_file, "rb") as f:
+        for line in f:
+            h.update(line)
+            if not has_include and b"include:" in line:
+                has_include = True
+    return h.hexdigest(), has_include
+
+def _directive_lines(md_file):
+    """
+    include 처리(include_stamps, write_table_pages)에 필요한 줄만 읽음 (--stream)
     
-    html_output = re.sub(pattern, replacement, html_output, flags=re.DOTALL)
+    제목, 코드 펜스, 주석 줄만 남겨도 제목 추출과 코드 블록 안팎 판정 결과는 전체 줄과 같다.
+    """
+    with open(md_file, "r", encoding="utf-8", newline='') as f:
+        return [line.rstrip('\n') for line in f if line.startswith(('#', '```')) or '<!--' in line]
+
+def write_if_changed(path, data):
+    """내용이 실제로 달라졌을 때만 파일을 쓴다 (쓰면 True)"""
+    if _profiler is not None:
+        started = time.perf_counter()
+        written = _write_if_changed(path, data)
+        _profiler.add("write", time.perf_counter() - started)
+        return written
+    return _write_if_changed(path, data)
+
+def _write_if_changed(path, data):
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
+
+def markdown_to_html(md_file, html_file):
+    """마크다운 파일을 HTML로 변환"""
+    html_output = render_markdown_file(md_file)
     
-    # HTML 파일 저장
-    with open(html_file, "w", encoding="utf-8") as f:
-        f.write(html_output)
+    # HTML 파일 저장 (바이트가 같으면 건너뜀), --split-sections로 만든 예전 절 조각은 지움
+    write_if_changed(html_file, html_output)
+    write_section_fragments(html_file, {})
     
     print(f"[OK] 변환 완료: {os.path.basename(md_file)} -> {os.path.basename(html_file)}")
 
-if __name__ == "__main__":
-    # 02_파이썬기초 폴더의 모든 MD 파일 변환
-    base_dir = os.path.dirname(__file__)
-    python_dir = os.path.join(base_dir, "02_파이썬기초")
-    
-    if os.path.exists(python_dir):
-        md_files = [f for f in os.listdir(python_dir) if f.endswith(".md")]
-        print(f"\n총 {len(md_files)}개 파일 변환 시작...\n")
-        for filename in sorted(md_files):
-            md_path = os.path.join(python_dir, filename)
-            html_path = os.path.join(python_dir, filename.replace(".md", ".html"))
+# ---------------------------------------------------------------------------
+# 절(##) 단위 분할 출력 (--split-sections)
+# ---------------------------------------------------------------------------
+
+# 본문이 이보다 작은 문서는 나누지 않음 (요청이 늘어나는 비용이 더 큼)
+SPLIT_MIN_BYTES = 30 * 1024
+_NESTING_TAG = re.compile(r'<(/?)(div|ul|ol|table|blockquote)\b[^>]*>')
+_H2_HEADING = re.compile(r'<h2 id="([^"]*)">(.*?)</h2>', re.DOTALL)
+
+# 나머지 절을 화면 가까이 스크롤하면 차례로, 앵커로 이동하면 그 절까지 불러옴
+# 앵커 이동은 앞 절이 늦게 채워지며 위치가 밀리지 않도록 앞 절을 모두 불러온 뒤 스크롤한다.
+# file://에서는 fetch가 막히므로 조각 파일 링크로 대신한다.
+# (--minify가 줄바꿈을 없애므로 스크립트에 // 주석을 쓰지 않음)
+_LAZY_SECTIONS_SCRIPT = """<script>
+    (() => {
+      const sections = Array.from(document.querySelectorAll('.lazy-section[data-src]'));
+      const pending = new Map();
+      const load = (section) => {
+        if (!pending.has(section)) {
+          const marker = section.querySelector('.lazy-loading');
+          pending.set(section, fetch(section.dataset.src)
+            .then(response => { if (!response.ok) throw new Error(response.status); return response.text(); })
+            .then(html => { marker.insertAdjacentHTML('beforebegin', html); marker.remove(); })
+            .catch(() => {
+              const link = document.createElement('a');
+              link.href = section.dataset.src;
+              link.textContent = '이 절 열기';
+              marker.replaceChildren(link);
+            }));
+        }
+        return pending.get(section);
+      };
+      const reveal = () => {
+        const id = decodeURIComponent(location.hash.slice(1));
+        const index = id ? sections.findIndex(section => section.dataset.anchors.split(' ').includes(id)) : -1;
+        if (index < 0) return;
+        Promise.all(sections.slice(0, index + 1).map(load)).then(() => {
+          const target = document.getElementById(id);
+          if (target) target.scrollIntoView();
+        });
+      };
+      let next = 0;
+      const observer = 'IntersectionObserver' in window ? new IntersectionObserver(entries => {
+        if (!entries.some(entry => entry.isIntersecting)) return;
+        observer.disconnect();
+        if (next < sections.length) load(sections[next++]).then(() => { if (next < sections.length) observer.observe(sections[next]); });
+      }, { rootMargin: '0px 0px 1200px 0px' }) : null;
+      if (observer && sections.length) {
+        observer.observe(sections[0]);
+      } else {
+        sections.forEach(load);
+      }
+      window.addEventListener('hashchange', reveal);
+      reveal();
+    })();
+    </script>"""
+
+def split_body_sections(chunks):
+    """
+    본문 조각을 ## 제목 단위로 묶음 -> [[첫 ## 앞 내용...], [첫 ## 절...], ...]
+    
+    첫 묶음은 첫 ## 앞의 내용이고(없으면 빈 목록) k번째 묶음이 k번째 ## 절이다.
+    ##가 요약/체크리스트 상자 안에 있어도 나누며, 묶음마다 태그 짝이 맞도록 앞 묶음에서
+    열린 태그를 닫고 새 묶음에서 다시 연다 (## 바로 앞에서 연 상자는 새 묶음으로 옮김).
+    """
+    sections = [[]]
+    open_tags = []
+    for chunk in chunks:
+        if chunk.startswith('<h2'):
+            current = sections[-1]
+            moved = 0
+            while (moved < len(open_tags) and len(current) > moved
+                   and current[-1 - moved] == open_tags[-1 - moved]):
+                moved += 1
+            del current[len(current) - moved:]
+            carried = open_tags[:len(open_tags) - moved]
+            current.extend(f'</{_NESTING_TAG.match(tag).group(2)}>' for tag in reversed(carried))
+            sections.append(list(open_tags))
+        sections[-1].append(chunk)
+        # 코드 블록은 내용이 이스케이프되어 있어 셀 태그가 없음
+        if not chunk.startswith('<pre'):
+            for tag in _NESTING_TAG.finditer(chunk):
+                if not tag.group(1):
+                    open_tags.append(tag.group(0))
+                elif open_tags:
+                    open_tags.pop()
+    return sections
+
+def section_fragment_name(html_file, index, data):
+    """절 조각 파일 이름 (<문서>.s<번호>.<내용 해시 12자리>.html)"""
+    stem = os.path.splitext(os.path.basename(html_file))[0]
+    digest = hashlib.sha256(data.encode("utf-8")).hexdigest()[:12]
+    return f"{stem}.s{index:02d}.{digest}.html"
+
+def section_fragments(html_file):
+    """출력 폴더에 있는 이 문서의 절 조각 파일 이름 목록"""
+    out_dir = os.path.dirname(os.path.abspath(html_file))
+    stem = os.path.splitext(os.path.basename(html_file))[0]
+    pattern = re.compile(re.escape(stem) + r'\.s\d{2,}\.[0-9a-f]{12}\.html$')
+    try:
+        return sorted(name for name in os.listdir(out_dir) if pattern.match(name))
+    except FileNotFoundError:
+        return []
+
+def render_split_sections(md_file, html_file, md_bytes, template=None, minify=False):
+    """
+    문서를 ## 절 단위로 나눠 렌더링
+    
+    절 목차, 첫 ## 앞 내용, 첫 절은 페이지에 넣고, 나머지 절은 제목만 남긴 채 본문을 조각
+    파일로 뺀다. 조각 파일 이름의 번호는 ## 순서(s02가 두 번째 ##)이고, 내용 해시가 들어 있어
+    오래 캐시해도 안전하다.
+    본문이 SPLIT_MIN_BYTES보다 작거나 나눌 절이 없으면 보통 페이지와 같다.
+    
+    Returns:
+        (페이지 HTML, {조각 파일 이름: 조각 HTML})
+    """
+    if template is None:
+        template = load_template()
+    lines = md_bytes.decode("utf-8").split('\n')
+    title = extract_title(lines)
+    chunks = list(iter_markdown_html(lines, md_file))
+    sections = split_body_sections(chunks)
+    body = '\n    '.join(chunks)
+    # 첫 ## 앞 내용(0번)과 첫 ## 절(1번)은 페이지에 넣음
+    inline = 2
+    if len(sections) <= inline or len(body.encode("utf-8")) < SPLIT_MIN_BYTES:
+        html_output = template.render(title, body)
+        return (minify_html(html_output) if minify else html_output), {}
+    
+    toc = []
+    parts = []
+    fragments = {}
+    for index, section in enumerate(sections):
+        # 절 앞에 다시 연 상자 태그가 있을 수 있으므로 제목 위치를 찾음 (0번 묶음은 제목 없음)
+        position = next((i for i, chunk in enumerate(section) if chunk.startswith('<h2')), None)
+        if position is not None:
+            heading = _H2_HEADING.match(section[position])
+            toc.append(f'<li><a href="#{heading.group(1)}">{_HTML_TAG.sub("", heading.group(2))}</a></li>')
+        if index < inline:
+            parts.extend(section)
+            continue
+        # 제목은 페이지에 남기고, 제목 앞에서 연 상자 태그와 제목 뒤 내용은 조각으로 (태그 짝이 맞음)
+        data = '\n'.join(section[:position] + section[position + 1:])
+        if minify:
+            data = minify_html(data)
+        name = section_fragment_name(html_file, index, data)
+        fragments[name] = data
+        anchors = ' '.join(_ANCHOR_ID.findall('\n'.join(section)))
+        parts.append(f'<section class="lazy-section" data-src="{name}" data-anchors="{anchors}">\n    '
+                     f'{section[position]}\n    <p class="lazy-loading">불러오는 중…</p>\n    </section>')
+    toc_html = '\n    '.join(toc)
+    parts.insert(0, f'<nav class="section-toc">\n    <ul>\n    {toc_html}\n    </ul>\n    </nav>')
+    parts.append(_LAZY_SECTIONS_SCRIPT)
+    html_output = template.render(title, '\n    '.join(parts))
+    return (minify_html(html_output) if minify else html_output), fragments
+
+def write_section_fragments(html_file, fragments):
+    """절 조각 파일을 쓰고 이 문서의 예전 조각 파일은 지움 -> 새로 쓴 파일 목록"""
+    out_dir = os.path.dirname(os.path.abspath(html_file))
+    written = [name for name, data in fragments.items() if write_if_changed(os.path.join(out_dir, name), data)]
+    for name in section_fragments(html_file):
+        if name not in fragments:
+            os.remove(os.path.join(out_dir, name))
+    return written
+
+# ---------------------------------------------------------------------------
+# 증분 빌드 캐시
+# ---------------------------------------------------------------------------
+
+def converter_fingerprint():
+    """변환기 소스 코드 해시 (변환기 버전 역할)"""
+    h = hashlib.sha256()
+    for path in CONVERTER_SOURCES:
+        with open(path, "rb") as f:
+            h.update(f.read())
+    # Pygments 설치/버전이 바뀌어도 코드 블록 출력이 달라짐
+    h.update(highlighter_version().encode())
+    return h.hexdigest()
+
+def load_manifest(path=MANIFEST_PATH):
+    """빌드 매니페스트 읽기 (없거나 깨졌으면 빈 매니페스트)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {"files": {}}
+    manifest.setdefault("files", {})
+    return manifest
+
+def save_manifest(manifest, path=MANIFEST_PATH):
+    """빌드 매니페스트 저장 (임시 파일에 쓴 뒤 교체)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    data = json.dumps(manifest, ensure_ascii=False, indent=1, sort_keys=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def file_stamp(path):
+    """[크기, 수정 시각] (없으면 None)"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+def save_noop_stamp(argv, pairs, broken, extra_paths=(), path=NOOP_STAMP_PATH):
+    """
+    이번 실행의 옵션과 입력/출력 파일의 [크기, 수정 시각]을 기록 (aice.py convert의 빠른 경로)
+    
+    다음 'aice.py convert'가 같은 폴더에서 같은 옵션, 같은 Python과 하이라이트 라이브러리
+    버전으로 실행되고 기록한 파일이 하나도 바뀌지 않았으면 이 모듈을 import하지 않고 끝낸다.
+    기록하는 파일: 소스와 그 폴더(문서 추가/삭제 감지), include한 데이터 파일, 매니페스트에
+    적힌 모든 출력(페이지, 표 쪽, 절 조각)과 미리 압축한 .gz/.br, 링크 검사의 대상 파일
+    (깨진 링크 결과가 그대로인지), extra_paths.
+    
+    Args:
+        argv: 이번 실행의 명령행 인자 (다음 실행과 그대로 비교)
+        pairs: 이번에 빌드한 [(md 경로, html 경로)]
+        broken: 링크 검사에서 나온 깨진 링크 [(문서 키, href, 이유)] (빠른 경로에서 다시 출력)
+        extra_paths: 결과에 영향을 주는 그 밖의 파일 (검색 색인, 진도표 데이터 등)
+    """
+    manifest = load_manifest()
+    paths = {BASE_DIR, TEMPLATE_PATH, MANIFEST_PATH, *CONVERTER_SOURCES, *extra_paths}
+    for md_file, html_file in pairs:
+        paths.update((md_file, html_file, os.path.dirname(os.path.abspath(md_file))))
+        entry = manifest["files"].get(manifest_key(md_file), {})
+        paths.update(os.path.join(BASE_DIR, key) for key in entry.get("includes", {}))
+        paths.update(output_files(html_file, entry))
+    for record in manifest.get("links", {}).values():
+        paths.update(os.path.join(BASE_DIR, target) for target in record["deps"])
+    paths.update([p + ext for p in paths for ext in (".gz", ".br") if os.path.isfile(p + ext)])
+    stamp = {
+        "argv": list(argv), "cwd": os.getcwd(), "sources": len(pairs),
+        "python": [sys.executable, sys.version], "highlighter": highlighter_version(),
+        "broken": [list(link) for link in broken],
+        "files": {os.path.abspath(p): file_stamp(p) for p in sorted(paths)},
+    }
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(stamp, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+def manifest_key(md_file):
+    """매니페스트 키 (저장소 기준 상대 경로)"""
+    return os.path.relpath(os.path.abspath(md_file), BASE_DIR).replace(os.sep, "/")
+
+def build_file(md_file, html_file, manifest, template_hash, converter_hash, force=False,
+               shared_css=False, minify=False, split_sections=False, stream=False):
+    """
+    매니페스트를 참고해 파일 하나를 증분 빌드
+    
+    template_hash는 output_digest(shared_css, minify, split_sections)와 같아야 한다
+    (출력 모드가 바뀌면 다시 변환하도록). stream=True면 소스와 출력을 한 줄씩 처리해
+    문서 크기와 관계없이 메모리를 적게 쓴다 (출력 바이트는 같으므로 템플릿 해시에 넣지 않음,
+    minify/split_sections와 함께 쓸 수 없음).
+    
+    Returns:
+        'skipped'  : 소스/템플릿/변환기 모두 그대로라서 건너뜀
+        'unchanged': 다시 변환했지만 출력 바이트가 같아서 쓰지 않음
+        'written'  : 출력 파일을 새로 씀
+    """
+    if stream and (minify or split_sections):
+        raise ValueError("stream은 minify, split_sections와 함께 쓸 수 없습니다 (문서 전체가 필요함)")
+    key = manifest_key(md_file)
+    entry = manifest["files"].get(key)
+    st = os.stat(md_file)
+    output = os.path.relpath(os.path.abspath(html_file), BASE_DIR).replace(os.sep, "/")
+    
+    same_deps = (
+        entry is not None
+        and not force
+        and entry.get("template") == template_hash
+        and entry.get("converter") == converter_hash
+        and entry.get("output") == output
+        and os.path.exists(html_file)
+        and all(os.path.exists(path) for path in output_files(html_file, entry))
+        and _includes_unchanged(entry)
+    )
+    
+    # 빠른 경로: 크기와 수정 시각이 같으면 해시도 계산하지 않음
+    if same_deps and entry.get("size") == st.st_size and entry.get("mtime_ns") == st.st_mtime_ns:
+        return "skipped"
+    
+    profiler = _profiler
+    if profiler is not None:
+        started = profiler.begin_document(key)
+    
+    if stream:
+        md_bytes = None
+        source_hash, has_include = _scan_source(md_file)
+    else:
+        with open(md_file, "rb") as f:
+            md_bytes = f.read()
+        source_hash = hashlib.sha256(md_bytes).hexdigest()
+        has_include = b"include:" in md_bytes
+    if profiler is not None:
+        profiler.add("read", time.perf_counter() - started)
+    
+    if same_deps and entry.get("source") == source_hash:
+        # 내용은 같고 수정 시각만 바뀐 경우 (touch, git checkout 등)
+        entry["size"] = st.st_size
+        entry["mtime_ns"] = st.st_mtime_ns
+        if profiler is not None:
+            profiler.end_document(started)
+        return "skipped"
+    
+    template = page_template(html_file, shared_css)
+    fragments = {}
+    if stream:
+        written, anchors, links = stream_markdown_file(md_file, html_file, template)
+    else:
+        if split_sections:
+            html_output, fragments = render_split_sections(md_file, html_file, md_bytes, template, minify)
+        else:
+            html_output = render_markdown_file(md_file, md_bytes, template, minify)
+        written = write_if_changed(html_file, html_output)
+        # 링크 그래프: 이 문서의 앵커와 밖으로 나가는 링크 (check_links가 사용, 절 조각 포함)
+        graph_html = html_output + ''.join(fragments.values())
+        anchors = _ANCHOR_ID.findall(graph_html)
+        links = list(dict.fromkeys(_LINK_HREF.findall(graph_html)))
+    # 분할하지 않는 빌드에서도 예전 조각 파일은 지움
+    written = bool(write_section_fragments(html_file, fragments)) or written
+    includes = {}
+    pages = []
+    if has_include:
+        # CSV/TSV 표: 데이터 파일도 의존성으로 기록하고 page 옵션의 나머지 쪽 파일을 씀
+        lines = _directive_lines(md_file) if stream else md_bytes.decode("utf-8").split('\n')
+        includes = include_stamps(md_file, lines)
+        pages, pages_written = write_table_pages(md_file, html_file, template, lines, minify)
+        written = bool(pages_written) or written
+    # 이전 빌드가 만들었지만 이번에는 만들지 않은 파일 (page 옵션 삭제, 데이터 감소, 출력 경로 변경 등)
+    remove_stale_outputs(entry, "pages", pages)
+    remove_stale_outputs(entry, "fragments", fragments)
+    if profiler is not None:
+        profiler.end_document(started)
+    
+    manifest["files"][key] = {
+        "source": source_hash,
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "template": template_hash,
+        "converter": converter_hash,
+        "output": output,
+    }
+    if includes:
+        manifest["files"][key]["includes"] = includes
+    # 페이지 옆에 만든 파일 (다음 빌드에서 지울 파일 판단, md_static 미리 압축 대상)
+    if pages:
+        manifest["files"][key]["pages"] = sorted(pages)
+    if fragments:
+        manifest["files"][key]["fragments"] = sorted(fragments)
+    manifest["files"][key]["anchors"] = anchors
+    manifest["files"][key]["links"] = links
+    return "written" if written else "unchanged"
+
+def remove_stale_outputs(entry, field, current):
+    """
+    매니페스트 항목 entry[field]에 기록된 파일 중 current에 없는 것을 지움
+    
+    기록은 페이지와 같은 폴더 기준 파일 이름 목록이다 (표 쪽 'pages', 절 조각 'fragments').
+    """
+    if not entry or not entry.get(field) or not entry.get("output"):
+        return
+    out_dir = os.path.join(BASE_DIR, os.path.dirname(entry["output"]))
+    for name in set(entry[field]) - set(current):
+        try:
+            os.remove(os.path.join(out_dir, name))
+        except FileNotFoundError:
+            pass
+
+def output_files(html_file, entry):
+    """페이지와 함께 만든 파일 경로 목록 (표 쪽, 절 조각, 매니페스트 항목 기준)"""
+    out_dir = os.path.dirname(os.path.abspath(html_file))
+    entry = entry or {}
+    return [os.path.join(out_dir, name) for name in entry.get("pages", []) + entry.get("fragments", [])]
+
+def _needs_build(md_file, html_file, entry, template_hash, converter_hash, force):
+    """stat 정보만으로 빌드가 필요한지 빠르게 판단 (해시 계산 없음)"""
+    if force or entry is None:
+        return True
+    st = os.stat(md_file)
+    output = os.path.relpath(os.path.abspath(html_file), BASE_DIR).replace(os.sep, "/")
+    return not (
+        entry.get("template") == template_hash
+        and entry.get("converter") == converter_hash
+        and entry.get("output") == output
+        and entry.get("size") == st.st_size
+        and entry.get("mtime_ns") == st.st_mtime_ns
+        and os.path.exists(html_file)
+        and all(os.path.exists(path) for path in output_files(html_file, entry))
+        and _includes_unchanged(entry)
+    )
+
+def _build_worker(md_file, html_file, entry, template_hash, converter_hash, force, profile=False,
+                  shared_css=False, minify=False, split_sections=False, stream=False):
+    """
+    프로세스 풀 작업 단위: (상태, 갱신된 매니페스트 항목, 계측 리포트 또는 None) 반환
+    
+    profile=True면 작업 프로세스 안에서 계측해 리포트를 돌려준다 (부모 프로세스에서 합침).
+    """
+    key = manifest_key(md_file)
+    local = {"files": {key: entry} if entry is not None else {}}
+    with profiling() if profile else contextlib.nullcontext() as profiler:
+        status = build_file(md_file, html_file, local, template_hash, converter_hash, force,
+                            shared_css, minify, split_sections, stream)
+    return status, local["files"].get(key), profiler.report() if profiler else None
+
+def build_incremental(pairs, manifest_path=MANIFEST_PATH, force=False, jobs=1, profile=False,
+                      shared_css=False, minify=False, split_sections=False, stream=False):
+    """
+    (md 파일, html 파일) 목록을 증분 빌드
+    
+    Args:
+        pairs: (md_file, html_file) 튜플 목록
+        manifest_path: 빌드 매니페스트 경로
+        force: True면 캐시를 무시하고 모두 다시 변환
+        jobs: 작업 프로세스 수 (1이면 현재 프로세스에서 순차 변환)
+        profile: True면 블록 종류/인라인/템플릿/쓰기별 시간을 재서 result['profile']에 담음
+        shared_css: True면 CSS를 assets/의 내용 해시 스타일시트 하나로 빼고 각 페이지는 링크만 함
+        minify: True면 출력 HTML의 공백과 주석을 압축
+        split_sections: True면 긴 문서를 ## 절 단위로 나눠 첫 절만 페이지에 넣고 나머지는
+            스크롤/앵커 이동 시 불러오는 조각 파일로 씀
+        stream: True면 문서를 한 줄씩 읽어 출력 파일에 바로 씀 (대용량 문서용, 출력은 같음)
+    
+    Returns:
+        {'skipped': [...], 'unchanged': [...], 'written': [...], 'errors': {md_file: 메시지},
+         'links': check_links 결과}
+    """
+    with profiling() if profile else contextlib.nullcontext() as profiler:
+        result = _build_incremental(pairs, manifest_path, force, jobs, profile, shared_css, minify,
+                                    split_sections, stream)
+    if profiler is not None:
+        result["profile"] = profiler.report()
+    return result
+
+class BuildPlan:
+    """
+    증분 빌드 계획: 매니페스트와 출력 모드 해시를 읽고 stat만으로 다시 변환할 파일을 고름
+    
+    build_incremental과 md_publish가 함께 쓴다. 변환을 어떻게 실행할지(순차, 프로세스 풀,
+    asyncio)는 호출하는 쪽이 정하고, 끝난 결과를 record/fail로 알린 뒤 finish로 링크 검사와
+    매니페스트 저장을 한다.
+    
+    Attributes:
+        pending: 다시 변환할 [(md 경로, html 경로, 이전 매니페스트 항목)]
+        result: build_incremental 결과 형식 (건너뛴 파일은 만들 때 이미 채워짐)
+    """
+    
+    def __init__(self, pairs, manifest_path=MANIFEST_PATH, force=False, shared_css=False, minify=False,
+                 split_sections=False, stream=False):
+        self.pairs = list(pairs)
+        self.manifest_path = manifest_path
+        self.manifest = load_manifest(manifest_path)
+        self.template_hash = output_digest(shared_css, minify, split_sections)
+        if shared_css:
+            write_stylesheet()
+        self.converter_hash = converter_fingerprint()
+        self.force = force
+        self._options = (shared_css, minify, split_sections, stream)
+        self.result = {"skipped": [], "unchanged": [], "written": [], "errors": {}}
+        
+        # 변경되지 않은 파일은 작업으로 보내지 않고 바로 건너뜀
+        self.pending = []
+        for md_file, html_file in self.pairs:
+            entry = self.manifest["files"].get(manifest_key(md_file))
             try:
-                markdown_to_html(md_path, html_path)
+                dirty = _needs_build(md_file, html_file, entry, self.template_hash, self.converter_hash, force)
+            except OSError as e:
+                self.fail(md_file, e)
+                continue
+            if dirty:
+                self.pending.append((md_file, html_file, entry))
+            else:
+                self.result["skipped"].append(md_file)
+    
+    def worker_args(self, md_file, html_file, entry, profile=False):
+        """_build_worker 인자 (프로세스 풀에 그대로 넘길 수 있음)"""
+        return (md_file, html_file, entry, self.template_hash, self.converter_hash, self.force, profile,
+                *self._options)
+    
+    def record(self, md_file, status, entry):
+        """_build_worker 결과 반영"""
+        self.result[status].append(md_file)
+        if entry is not None:
+            self.manifest["files"][manifest_key(md_file)] = entry
+    
+    def fail(self, md_file, error):
+        self.result["errors"][md_file] = f"{type(error).__name__}: {error}"
+    
+    def finish(self):
+        """링크 검사 후 매니페스트 저장 -> build_incremental과 같은 형식의 결과"""
+        result = self.result
+        keys = [manifest_key(md_file) for md_file, _ in self.pairs]
+        rebuilt = [manifest_key(md_file) for md_file in result["written"] + result["unchanged"]]
+        result["links"] = check_links(self.manifest, keys, rebuilt)
+        save_manifest(self.manifest, self.manifest_path)
+        return result
+
+def _build_incremental(pairs, manifest_path, force, jobs, profile, shared_css, minify, split_sections, stream):
+    plan = BuildPlan(pairs, manifest_path, force, shared_css, minify, split_sections, stream)
+    pending = plan.pending
+    
+    if jobs <= 1 or len(pending) <= 1:
+        for md_file, html_file, entry in pending:
+            try:
+                status, entry, _ = _build_worker(*plan.worker_args(md_file, html_file, entry))
             except Exception as e:
-                print(f"[ERROR] 오류 발생 ({filename}): {e}")
-                import traceback
-                traceback.print_exc()
-        print(f"\n모든 변환 완료!\n")
+                plan.fail(md_file, e)
+                continue
+            plan.record(md_file, status, entry)
+    else:
+        # 프로세스 풀은 병렬 빌드할 때만 로드 (import 비용이 커서 CLI 시작 시간을 늘림)
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        with ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as executor:
+            futures = {
+                executor.submit(_build_worker, *plan.worker_args(md_file, html_file, entry, profile)): md_file
+                for md_file, html_file, entry in pending
+            }
+            for future in as_completed(futures):
+                md_file = futures[future]
+                try:
+                    status, entry, report = future.result()
+                except Exception as e:
+                    plan.fail(md_file, e)
+                    continue
+                if report is not None:
+                    _profiler.merge(report)
+                plan.record(md_file, status, entry)
+    
+    return plan.finish()
+
+# ---------------------------------------------------------------------------
+# 링크 그래프와 증분 링크 검사
+# ---------------------------------------------------------------------------
+
+_ANCHOR_ID = re.compile(r'<h[1-6] id="([^"]*)">')
+_LINK_HREF = re.compile(r'<a href="([^"]*)">')
+_EXTERNAL_LINK = re.compile(r'^(?:[a-zA-Z][a-zA-Z0-9+.-]*:|//)')
+
+def resolve_link(source_key, href):
+    """
+    링크 대상 -> (대상 키, 앵커) 또는 None (외부 링크)
+    
+    대상 키는 저장소 기준 경로이며, 변환 문서의 .html 링크는 원본 .md 키로 바꾼다.
+    '#앵커'만 있으면 대상은 자기 자신이다.
+    """
+    if _EXTERNAL_LINK.match(href):
+        return None
+    path, _, anchor = href.partition('#')
+    anchor = unquote(anchor)
+    if not path:
+        return source_key, anchor
+    target = os.path.normpath(os.path.join(os.path.dirname(source_key), unquote(path.split('?')[0])))
+    target = target.replace(os.sep, '/')
+    if target.endswith('.html') and os.path.exists(os.path.join(BASE_DIR, target[:-5] + '.md')):
+        target = target[:-5] + '.md'
+    return target, anchor
+
+def _target_digest(files, target):
+    """링크 대상의 상태 (문서면 앵커 목록 해시, 그 밖의 파일이면 존재 여부, 없으면 None)"""
+    entry = files.get(target)
+    if entry is not None and "anchors" in entry and os.path.exists(os.path.join(BASE_DIR, target)):
+        return hashlib.sha256('\n'.join(entry["anchors"]).encode("utf-8")).hexdigest()[:16]
+    return "file" if os.path.exists(os.path.join(BASE_DIR, target)) else None
+
+def _check_document(files, key):
+    """문서 하나의 링크 검사 -> (대상별 상태, 깨진 링크 [[주소, 이유]])"""
+    deps = {}
+    broken = []
+    for href in files[key].get("links", ()):
+        resolved = resolve_link(key, href)
+        if resolved is None:
+            continue
+        target, anchor = resolved
+        if target not in deps:
+            deps[target] = _target_digest(files, target)
+        if deps[target] is None:
+            broken.append([href, "파일 없음"])
+        elif anchor and target in files and anchor not in files[target].get("anchors", ()):
+            broken.append([href, "앵커 없음"])
+    return deps, broken
+
+def check_links(manifest, keys, rebuilt=()):
+    """
+    매니페스트의 링크 그래프로 문서 링크 검사 (바뀐 간선만 다시 검사)
+    
+    다시 검사하는 문서: 이번에 다시 변환된 문서(rebuilt), 검사 기록이 없는 문서,
+    링크 대상의 상태(앵커 목록, 파일 존재 여부)가 지난 검사와 달라진 문서.
+    결과는 manifest['links']에 저장되어 다음 빌드에서 재사용된다.
+    
+    Args:
+        manifest: 빌드 매니페스트 (files 항목에 anchors/links가 있어야 함)
+        keys: 검사 결과를 보고할 문서 키 목록
+        rebuilt: 이번 빌드에서 다시 변환한 문서 키
+    
+    Returns:
+        {'broken': [(문서 키, 주소, 이유)], 'checked': 다시 검사한 문서 수, 'documents': 문서 수}
+    """
+    files = manifest["files"]
+    graph = manifest.setdefault("links", {})
+    rebuilt = set(rebuilt)
+    result = {"broken": [], "checked": 0, "documents": 0}
+    for key in keys:
+        if "links" not in files.get(key, {}):
+            continue
+        result["documents"] += 1
+        record = graph.get(key)
+        stale = (
+            key in rebuilt or record is None
+            or any(_target_digest(files, target) != digest for target, digest in record["deps"].items())
+        )
+        if stale:
+            deps, broken = _check_document(files, key)
+            record = graph[key] = {"deps": deps, "broken": broken}
+            result["checked"] += 1
+        result["broken"].extend((key, href, reason) for href, reason in record["broken"])
+    # 없어진 문서의 기록 정리
+    for key in [key for key in graph if key not in files]:
+        del graph[key]
+    return result
 
+# ---------------------------------------------------------------------------
+# 전체 트리 일괄 변환
+# ---------------------------------------------------------------------------
+
+CHAPTER_DIR_PATTERN = re.compile(r'^\d{2}_')
+ROOT_PLAN_PATTERN = re.compile(r'^\d+.*\.md$')
+
+def discover_sources(base_dir=BASE_DIR, dirs=None):
+    """
+    변환 대상 (md 파일, html 파일) 목록 찾기
+    
+    Args:
+        base_dir: 저장소 루트
+        dirs: 변환할 폴더 목록 (None이면 01_~07_ 챕터 폴더 전체와 루트 계획 파일)
+    """
+    pairs = []
+    if dirs is None:
+        dirs = sorted(
+            os.path.join(base_dir, name) for name in os.listdir(base_dir)
+            if CHAPTER_DIR_PATTERN.match(name) and os.path.isdir(os.path.join(base_dir, name))
+        )
+        # 루트의 계획 파일 (00_마스터_플랜.md, 32일_학습일정.md 등)
+        for name in sorted(os.listdir(base_dir)):
+            if ROOT_PLAN_PATTERN.match(name):
+                md_path = os.path.join(base_dir, name)
+                pairs.append((md_path, md_path[:-3] + ".html"))
+    for directory in dirs:
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".md"):
+                md_path = os.path.join(directory, name)
+                pairs.append((md_path, md_path[:-3] + ".html"))
+    return pairs
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="마크다운 학습 자료를 HTML로 일괄 변환")
+    parser.add_argument("dirs", nargs="*", help="변환할 폴더 (생략하면 전체 챕터와 루트 계획 파일)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="동시에 변환할 프로세스 수 (기본값: CPU 수)")
+    parser.add_argument("--force", action="store_true", help="빌드 캐시를 무시하고 모두 다시 변환")
+    parser.add_argument("--profile", nargs="?", const=BUILD_REPORT_PATH, metavar="PATH",
+                        help=f"블록 종류별 시간을 재서 JSON 빌드 리포트로 저장 (기본값: {os.path.relpath(BUILD_REPORT_PATH, BASE_DIR)})")
+    parser.add_argument("--shared-css", action="store_true",
+                        help="템플릿 CSS를 assets/의 공용 스타일시트(내용 해시 이름)로 빼고 페이지에서는 링크만 함")
+    parser.add_argument("--minify", action="store_true", help="출력 HTML의 공백과 주석 압축")
+    parser.add_argument("--split-sections", action="store_true",
+                        help="긴 문서를 ## 절 단위로 나눠 첫 절과 목차만 페이지에 넣고 나머지는 스크롤 시 불러옴 "
+                             "(정적 서버에서 열어야 함, aice.py serve)")
+    parser.add_argument("--stream", action="store_true",
+                        help="문서를 한 줄씩 읽어 출력 파일에 바로 씀 (여러 챕터를 합친 대용량 문서용, 출력은 같음)")
+    parser.add_argument("--no-search", action="store_true", help="검색 색인(search_index/)을 만들지 않음")
+    parser.add_argument("--no-dashboard", action="store_true",
+                        help="진도표 데이터(dashboard_data.js)를 만들지 않음 (md_dashboard.py 참고)")
+    parser.add_argument("--precompress", action="store_true",
+                        help="빌드 결과물(HTML/CSS/JSON)의 gzip 압축본을 옆에 저장 (바뀐 파일만, md_static.py 참고)")
+    parser.add_argument("--check-code", action="store_true",
+                        help="python 코드 블록을 실행해 오류를 보고 (캐시된 결과 재사용, md_check.py 참고)")
+    args = parser.parse_args(argv)
+    if args.stream and (args.minify or args.split_sections):
+        parser.error("--stream은 --minify, --split-sections와 함께 쓸 수 없습니다 (문서 전체가 필요함)")
+    
+    pairs = discover_sources(dirs=args.dirs or None)
+    print(f"\n총 {len(pairs)}개 파일 변환 시작... (프로세스 {args.jobs}개)\n")
+    started = time.perf_counter()
+    result = build_incremental(pairs, force=args.force, jobs=args.jobs, profile=bool(args.profile),
+                               shared_css=args.shared_css, minify=args.minify, split_sections=args.split_sections,
+                               stream=args.stream)
+    elapsed = time.perf_counter() - started
+    
+    for md_path in sorted(result["written"]):
+        print(f"[OK] 변환 완료: {manifest_key(md_path)}")
+    for md_path in sorted(result["unchanged"]):
+        print(f"[--] 출력 동일: {manifest_key(md_path)}")
+    for md_path, message in sorted(result["errors"].items()):
+        print(f"[ERROR] 오류 발생 ({manifest_key(md_path)}): {message}")
+    links = result["links"]
+    for key, href, reason in links["broken"]:
+        print(f"[LINK] 깨진 링크 ({key}): {href} ({reason})")
+    print(f"\n변환 {len(result['written'])}개, 동일 {len(result['unchanged'])}개, "
+          f"건너뜀 {len(result['skipped'])}개, 오류 {len(result['errors'])}개 ({elapsed:.2f}초)")
+    print(f"링크 검사: 문서 {links['documents']}개 중 {links['checked']}개 다시 검사, "
+          f"깨진 링크 {len(links['broken'])}개\n")
+    
+    if args.profile:
+        report = dict(result["profile"], elapsed=elapsed, files={
+            status: [manifest_key(md) for md in result[status]]
+            for status in ("written", "unchanged", "skipped")
+        })
+        os.makedirs(os.path.dirname(os.path.abspath(args.profile)), exist_ok=True)
+        with open(args.profile, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=1)
+        for name, stat in sorted(report["totals"].items(), key=lambda item: -item[1]["seconds"]):
+            print(f"  {name:<18} {stat['count']:>7}회 {stat['seconds'] * 1000:10.2f}ms")
+        print(f"\n빌드 리포트 저장: {args.profile}\n")
+    
+    # 빠른 경로 기록에 넣을 파일 (실행한 단계의 모듈과 결과물)
+    watched = []
+    if args.shared_css:
+        watched += [ASSETS_DIR] + [os.path.join(ASSETS_DIR, name) for name in os.listdir(ASSETS_DIR)]
+    if not args.no_search:
+        # md_search가 이 모듈을 import하므로 여기서 로드 (색인은 항상 전체 자료 기준)
+        import md_search
+        search = md_search.build_search_index()
+        watched += [md_search.__file__, md_search.md_ast.__file__, md_search.SEARCH_INDEX_DIR]
+        watched += [os.path.join(md_search.SEARCH_INDEX_DIR, name) for name in os.listdir(md_search.SEARCH_INDEX_DIR)]
+        print(f"검색 색인: 다시 색인 {len(search['indexed'])}개, 조각 {search['shards']}개 "
+              f"({search['bytes'] / 1024:.0f}KB)\n")
+    
+    if not args.no_dashboard:
+        # 32일_학습일정.md와 챕터 목록에서 진도표 작업 목록 생성 (내용이 같으면 쓰지 않음)
+        import md_dashboard
+        if os.path.exists(md_dashboard.SCHEDULE_PATH):
+            dashboard = md_dashboard.write_dashboard_data()
+            watched += [md_dashboard.__file__, md_dashboard.SCHEDULE_PATH, md_dashboard.DASHBOARD_DATA_PATH]
+            print(f"진도표 데이터: 작업 {dashboard['tasks']}개 ({dashboard['bytes'] / 1024:.1f}KB"
+                  f"{', 새로 씀' if dashboard['written'] else ', 변경 없음'})\n")
+    
+    if args.precompress:
+        import md_static
+        compressed = md_static.precompress(md_static.collect_artifacts())
+        print(f"미리 압축: 압축 {len(compressed['compressed'])}개, 변경 없음 {len(compressed['skipped'])}개\n")
+    
+    failed = []
+    if args.check_code:
+        import md_check
+        checked = md_check.check_code_blocks([md_file for md_file, _ in pairs], jobs=args.jobs)
+        failed = md_check.failures(checked)
+        for block in failed:
+            print(md_check.format_block(*block))
+        print(f"코드 실행 확인: 코드 블록 {len(checked['blocks'])}개, 실패 {len(failed)}개 "
+              f"(실행 {checked['ran']}개, 캐시 {checked['cached']}개)\n")
+    
+    # 다시 실행해도 할 일이 없는 옵션 조합만 기록 (--force/--profile 등은 매번 실제로 실행)
+    if not (result["errors"] or args.force or args.profile or args.precompress or args.check_code):
+        save_noop_stamp(sys.argv[1:] if argv is None else argv, pairs, links["broken"], watched)
+    return 1 if result["errors"] or failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
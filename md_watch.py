@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+마크다운 파일을 감시하면서 바뀐 파일만 HTML로 다시 변환하고,
+로컬 HTTP 서버로 보여 주면서 열린 브라우저 탭을 자동으로 새로고침하는 스크립트
+"""
+import os
+import sys
+import time
+import argparse
+import threading
+from collections import deque
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+import md_to_html_final as converter
+
+# 브라우저에 주입하는 자동 새로고침 스크립트
+LIVE_RELOAD_PATH = "/__livereload"
+LIVE_RELOAD_SCRIPT = f"""<script>
+(function () {{
+  var source = new EventSource("{LIVE_RELOAD_PATH}");
+  source.onmessage = function (event) {{
+    if (event.data === "*" || event.data === decodeURI(location.pathname)) {{
+      location.reload();
+    }}
+  }};
+}})();
+</script>
+"""
+
+class ReloadHub:
+    """
+    변경 알림을 대기 중인 모든 브라우저 연결에 전달
+    
+    알림은 version별로 최근 history개를 보관한다. 연결이 알림을 보내는 사이에 여러 번
+    발행되어도 놓친 version의 경로를 모두 받고, 보관 범위보다 오래 밀렸으면 '*'(전체)를 받는다.
+    """
+    
+    def __init__(self, history=64):
+        self._condition = threading.Condition()
+        self._version = 0
+        self._history = deque(maxlen=history)
+    
+    @property
+    def version(self):
+        return self._version
+    
+    def publish(self, paths):
+        with self._condition:
+            self._version += 1
+            self._history.append((self._version, list(paths)))
+            self._condition.notify_all()
+    
+    def wait(self, version, timeout):
+        """version 이후의 알림을 기다림 -> (새 version, 그 사이 발행된 경로 목록 또는 None)"""
+        with self._condition:
+            self._condition.wait_for(lambda: self._version != version, timeout)
+            if self._version == version:
+                return version, None
+            if self._history[0][0] > version + 1:
+                return self._version, ["*"]
+            paths = [path for number, published in self._history if number > version for path in published]
+            return self._version, list(dict.fromkeys(paths))
+
+def is_hidden_path(root, path):
+    """root 기준으로 점으로 시작하는 폴더/파일(.git, .build_cache 등) 안의 경로인지"""
+    relative = os.path.relpath(path, root)
+    return any(part.startswith(".") and part not in (".", "..") for part in relative.split(os.sep))
+
+def make_handler(hub, root):
+    class LiveReloadHandler(SimpleHTTPRequestHandler):
+        """
+        정적 파일 서버 + HTML에 새로고침 스크립트 주입 + SSE 알림
+        
+        저장소 루트를 그대로 서비스하므로 .git/, .build_cache/ 같은 점 폴더와 점 파일은 404로 막는다.
+        """
+        
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, directory=root, **kwargs)
+        
+        def log_message(self, format, *args):
+            pass
+        
+        def do_GET(self):
+            if self.path == LIVE_RELOAD_PATH:
+                return self._serve_events()
+            path = self.translate_path(self.path)
+            if is_hidden_path(root, path):
+                return self.send_error(404, "File not found")
+            if path.endswith(".html") and os.path.isfile(path):
+                return self._serve_html(path)
+            return super().do_GET()
+        
+        def do_HEAD(self):
+            if is_hidden_path(root, self.translate_path(self.path)):
+                return self.send_error(404, "File not found")
+            return super().do_HEAD()
+        
+        def _serve_html(self, path):
+            with open(path, "rb") as f:
+                body = f.read()
+            # 완성된 페이지에만 주입 (절 조각 등 fetch로 끼워 넣는 HTML 조각에는 넣지 않음)
+            marker = body.rfind(b"</body>")
+            if marker != -1:
+                body = body[:marker] + LIVE_RELOAD_SCRIPT.encode("utf-8") + body[marker:]
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def _serve_events(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            version = hub.version
+            try:
+                while True:
+                    version, paths = hub.wait(version, timeout=15)
+                    if paths is None:
+                        self.wfile.write(b": keepalive\n\n")
+                    else:
+                        for url_path in paths:
+                            self.wfile.write(f"data: {url_path}\n\n".encode("utf-8"))
+                    self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+    
+    return LiveReloadHandler
+
+def snapshot(paths):
+    """파일별 (수정 시각, 크기)"""
+    state = {}
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            continue
+        state[path] = (st.st_mtime_ns, st.st_size)
+    return state
+
+def watched_files(dirs=None):
+    """감시 대상: 변환할 md 파일 + templates 폴더의 파일"""
+    pairs = converter.discover_sources(dirs=dirs)
+    template_dir = os.path.dirname(converter.TEMPLATE_PATH)
+    templates = [os.path.join(template_dir, name) for name in sorted(os.listdir(template_dir))]
+    return pairs, templates
+
+def data_files():
+    """감시 대상: 지난 빌드에서 include한 CSV/TSV 파일 (매니페스트 기록)"""
+    files = set()
+    for entry in converter.load_manifest()["files"].values():
+        files.update(os.path.join(converter.BASE_DIR, key) for key in entry.get("includes", ()))
+    return sorted(files)
+
+def url_path(html_file):
+    """출력 파일의 서버 URL 경로 (브라우저의 decodeURI(location.pathname)와 같은 형태)"""
+    return "/" + os.path.relpath(html_file, converter.BASE_DIR).replace(os.sep, "/")
+
+def rebuild(changed, pairs, templates, jobs):
+    """바뀐 파일에 해당하는 출력만 다시 변환하고 갱신된 URL 경로 목록 반환"""
+    sources = {md for md, _ in pairs}
+    if any(path in templates or path not in sources for path in changed):
+        # 템플릿이나 include한 데이터 파일이 바뀌면 전체를 넘김 (영향 없는 문서는 매니페스트로 건너뜀)
+        targets = pairs
+    else:
+        targets = [(md, html) for md, html in pairs if md in changed]
+    if not targets:
+        return []
+    started = time.perf_counter()
+    result = converter.build_incremental(targets, jobs=jobs)
+    elapsed = (time.perf_counter() - started) * 1000
+    for md_file in result["written"]:
+        print(f"[OK] 변환 완료: {converter.manifest_key(md_file)} ({elapsed:.0f}ms)")
+    for md_file, message in result["errors"].items():
+        print(f"[ERROR] 오류 발생 ({converter.manifest_key(md_file)}): {message}")
+    html_by_md = dict(targets)
+    return [url_path(html_by_md[md]) for md in result["written"]]
+
+def watch(dirs=None, interval=0.5, debounce=0.3, jobs=1, hub=None):
+    """
+    파일 변경을 폴링으로 감시하며 증분 빌드
+    
+    Args:
+        dirs: 감시할 챕터 폴더 (None이면 전체)
+        interval: 폴링 간격 (초)
+        debounce: 마지막 변경 후 이 시간 동안 조용해지면 빌드 (연속 저장을 한 번에 처리)
+        jobs: 빌드 프로세스 수
+        hub: ReloadHub (있으면 빌드된 페이지의 새로고침 알림 전송)
+    """
+    pairs, templates = watched_files(dirs)
+    converter.build_incremental(pairs, jobs=jobs)
+    state = snapshot([md for md, _ in pairs] + templates + data_files())
+    print(f"감시 시작: 파일 {len(state)}개 (Ctrl+C로 종료)")
+    
+    pending = set()
+    last_change = 0.0
+    while True:
+        time.sleep(interval if not pending else min(interval, debounce))
+        
+        # 새로 생긴 파일도 감시 대상에 포함
+        pairs, templates = watched_files(dirs)
+        current = snapshot([md for md, _ in pairs] + templates + data_files())
+        changed = {path for path in current.keys() | state.keys() if current.get(path) != state.get(path)}
+        state = current
+        if changed:
+            pending |= changed
+            last_change = time.monotonic()
+            continue
+        
+        if pending and time.monotonic() - last_change >= debounce:
+            reloaded = rebuild(pending, pairs, templates, jobs)
+            pending = set()
+            if hub is not None and reloaded:
+                hub.publish(reloaded)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="마크다운 변경을 감시하며 HTML 자동 변환 + 브라우저 자동 새로고침")
+    parser.add_argument("dirs", nargs="*", help="감시할 폴더 (생략하면 전체 챕터와 루트 계획 파일)")
+    parser.add_argument("--port", type=int, default=8000, help="로컬 서버 포트 (기본값: 8000)")
+    parser.add_argument("--no-serve", action="store_true", help="서버 없이 변환만 수행")
+    parser.add_argument("--interval", type=float, default=0.5, help="폴링 간격 (초)")
+    parser.add_argument("--debounce", type=float, default=0.3, help="연속 저장을 묶는 대기 시간 (초)")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="빌드 프로세스 수")
+    args = parser.parse_args(argv)
+    
+    hub = None
+    if not args.no_serve:
+        hub = ReloadHub()
+        server = ThreadingHTTPServer(("127.0.0.1", args.port), make_handler(hub, converter.BASE_DIR))
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        print(f"로컬 서버: http://127.0.0.1:{args.port}/")
+    
+    try:
+        watch(args.dirs or None, args.interval, args.debounce, args.jobs, hub)
+    except KeyboardInterrupt:
+        print("\n감시 종료")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())